@@ -0,0 +1,237 @@
+"""
+Syntetická databáza v realistickej veľkosti pre výkonnostné testy.
+
+    python -m benchmarks.generate_data /tmp/bench.db --teams 4 --players 25 --seasons 3
+
+Vytvorí tímy s trénermi a hráčmi, pre každú sezónu zápasy (víkend) a tréningy (pracovné
+dni) a k nim hustú účasť a hodnotenia. S rovnakým --seed a --today je výsledok vždy rovnaký.
+
+Účty: admin / admin123, trener1.. / trener123, hrac0001.. / hrac123 (ako init_db.py).
+Každé heslo sa hashuje raz - bcrypt pre tisíce hráčov by trval minúty.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from database.database import connect
+from database.migrations import migrate
+from database.schema import DDL_DROP
+from repositories.pagination import recent_seasons, season_range
+from services.auth import AuthService
+
+FIRST_NAMES = ("Marek", "Peter", "Martin", "Tomáš", "Ján", "Lukáš", "Michal", "Juraj", "Patrik", "Dávid",
+               "Samuel", "Adam", "Filip", "Matej", "Jakub", "Róbert", "Erik", "Dominik", "Richard", "Ondrej")
+LAST_NAMES = ("Hamšík", "Škriniar", "Kucka", "Duda", "Mak", "Weiss", "Pekarík", "Lobotka", "Haraslín", "Boženík",
+              "Dúbravka", "Hancko", "Vavro", "Gyömbér", "Suslov", "Bero", "Schranz", "Strelec", "Rigo", "Obert")
+POSITIONS = ("Brankár", "Obranca", "Obranca", "Záložník", "Záložník", "Útočník")
+OPPONENTS = ("FC Spartak", "MFK Ružomberok", "FK Senica", "ŠK Slovan", "AS Trenčín", "FC Nitra",
+             "MŠK Žilina", "FK Poprad", "Tatran Prešov", "FC Košice", "DAC Dunajská Streda", "ViOn Zlaté Moravce")
+LOCATIONS = ("Domáci štadión", "Vonku", "Tréningové ihrisko", "Umelá tráva", "Hala")
+
+MATCH_TIME = "15:00"
+TRAINING_TIME = "17:30"
+# Pondelok = 0; tréningy sa rozložia do týchto dní podľa --trainings-per-week
+TRAINING_WEEKDAYS = (1, 3, 0, 2, 4)
+
+
+def _season_days(season: str) -> List[date]:
+    start, end = (date.fromisoformat(d) for d in season_range(season))
+    return [start + timedelta(days=i) for i in range((end - start).days)]
+
+
+def _match_dates(season: str, count: int) -> List[str]:
+    # Zápasy len cez víkend, rovnomerne od augusta do konca mája
+    weekends = [d for d in _season_days(season) if d.weekday() == 5 and (d.month >= 8 or d.month <= 5)]
+    step = max(1, len(weekends) / max(count, 1))
+    picked = [weekends[int(i * step)] for i in range(min(count, len(weekends)))]
+    return [f"{d.isoformat()}T{MATCH_TIME}" for d in picked]
+
+
+def _training_dates(season: str, per_week: int) -> List[str]:
+    weekdays = set(TRAINING_WEEKDAYS[:per_week])
+    return [f"{d.isoformat()}T{TRAINING_TIME}" for d in _season_days(season) if d.weekday() in weekdays]
+
+
+def generate(
+    conn: sqlite3.Connection,
+    teams: int = 4,
+    players_per_team: int = 25,
+    seasons: int = 3,
+    matches_per_season: int = 30,
+    trainings_per_week: int = 3,
+    attendance_density: float = 0.9,
+    evaluation_density: float = 0.7,
+    seed: int = 1,
+    today: Optional[date] = None,
+) -> Dict[str, int]:
+    """
+    Naplní (prázdnu, zmigrovanú) databázu. Všetko ide cez executemany v jednej transakcii.
+    Vráti počty vložených riadkov podľa tabuľky.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = f"{today.isoformat()}T00:00"
+    season_list = recent_seasons(seasons, today)
+
+    auth = AuthService(conn)
+    hashes = {password: auth.hash_password(password) for password in ("admin123", "trener123", "hrac123")}
+
+    cur = conn.cursor()
+    cur.execute(
+        "INSERT INTO users(username, password_hash, role, first_name, last_name) VALUES (?, ?, ?, ?, ?)",
+        ("admin", hashes["admin123"], "admin", "Hlavný", "Admin")
+    )
+
+    counts = {"teams": 0, "users": 1, "matches": 0, "trainings": 0, "attendance": 0, "evaluations": 0}
+    player_number = 0
+    for t in range(1, teams + 1):
+        cur.execute("INSERT INTO teams(name, description) VALUES (?, ?)", (f"Tím {t}", f"Syntetický tím č. {t}"))
+        team_id = cur.lastrowid
+        counts["teams"] += 1
+
+        cur.execute(
+            "INSERT INTO users(username, password_hash, role, first_name, last_name, team_id) VALUES (?, ?, ?, ?, ?, ?)",
+            (f"trener{t}", hashes["trener123"], "coach", rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), team_id)
+        )
+        coach_id = cur.lastrowid
+        counts["users"] += 1
+
+        players = []
+        for _ in range(players_per_team):
+            player_number += 1
+            birth = date(today.year - rng.randint(17, 35), rng.randint(1, 12), rng.randint(1, 28))
+            players.append((
+                f"hrac{player_number:04d}", hashes["hrac123"], "player",
+                rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), rng.choice(POSITIONS), birth.isoformat(), team_id,
+            ))
+        cur.executemany(
+            "INSERT INTO users(username, password_hash, role, first_name, last_name, position, birth_date, team_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            players
+        )
+        counts["users"] += len(players)
+        player_ids = [row[0] for row in cur.execute(
+            "SELECT id FROM users WHERE team_id = ? AND role = 'player' ORDER BY id", (team_id,)
+        )]
+
+        match_rows: List[Tuple] = []
+        training_rows: List[Tuple] = []
+        for season in season_list:
+            for when in _match_dates(season, matches_per_season):
+                played = when < now
+                match_rows.append((
+                    when, rng.choice(OPPONENTS), rng.choice(LOCATIONS[:2]),
+                    rng.randint(0, 5) if played else None, rng.randint(0, 5) if played else None, team_id,
+                ))
+            for when in _training_dates(season, trainings_per_week):
+                training_rows.append((when, rng.choice(LOCATIONS[2:]), "Tréning", team_id))
+
+        cur.executemany(
+            "INSERT INTO matches(date, opponent, location, home_score, away_score, team_id) VALUES (?, ?, ?, ?, ?, ?)",
+            match_rows
+        )
+        cur.executemany(
+            "INSERT INTO trainings(date, location, description, team_id) VALUES (?, ?, ?, ?)",
+            training_rows
+        )
+        counts["matches"] += len(match_rows)
+        counts["trainings"] += len(training_rows)
+
+        matches = cur.execute("SELECT id, date FROM matches WHERE team_id = ?", (team_id,)).fetchall()
+        trainings = cur.execute("SELECT id, date FROM trainings WHERE team_id = ?", (team_id,)).fetchall()
+
+        attendance: List[Tuple] = []
+        evaluations: List[Tuple] = []
+        for column, events in (("match", matches), ("training", trainings)):
+            for event_id, when in events:
+                past = when < now
+                for player_id in player_ids:
+                    if rng.random() >= attendance_density:
+                        continue
+                    confirmed = rng.random() < 0.85
+                    present = past and confirmed and rng.random() < 0.9
+                    attendance.append((
+                        player_id,
+                        event_id if column == "match" else None,
+                        event_id if column == "training" else None,
+                        int(present), int(confirmed),
+                    ))
+                    if column == "match" and present and rng.random() < evaluation_density:
+                        evaluations.append((
+                            event_id, player_id, coach_id, rng.randint(8, 20) / 2, None,
+                        ))
+
+        cur.executemany(
+            "INSERT INTO attendance(user_id, match_id, training_id, present, confirmed) VALUES (?, ?, ?, ?, ?)",
+            attendance
+        )
+        cur.executemany(
+            "INSERT INTO evaluations(match_id, player_id, coach_id, rating, comment) VALUES (?, ?, ?, ?, ?)",
+            evaluations
+        )
+        counts["attendance"] += len(attendance)
+        counts["evaluations"] += len(evaluations)
+
+    conn.commit()
+    return counts
+
+
+def create_database(path: str, **options) -> Dict[str, int]:
+    """Zmaže (ak treba) a vytvorí databázu `path` so schémou a syntetickými dátami."""
+    conn = connect(path)
+    try:
+        conn.executescript(DDL_DROP)
+        migrate(conn)
+        counts = generate(conn, **options)
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    return counts
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Syntetická databáza pre výkonnostné testy")
+    parser.add_argument("database", help="cesta k vytváranej databáze")
+    parser.add_argument("--force", action="store_true", help="prepísať existujúci súbor")
+    parser.add_argument("--teams", type=int, default=4)
+    parser.add_argument("--players", type=int, default=25, help="hráčov v jednom tíme")
+    parser.add_argument("--seasons", type=int, default=3, help="počet sezón (posledná je aktuálna)")
+    parser.add_argument("--matches", type=int, default=30, help="zápasov na sezónu a tím")
+    parser.add_argument("--trainings-per-week", type=int, default=3, choices=range(0, len(TRAINING_WEEKDAYS) + 1))
+    parser.add_argument("--attendance", type=float, default=0.9, help="podiel hráčov so záznamom účasti (0-1)")
+    parser.add_argument("--evaluations", type=float, default=0.7, help="podiel prítomných s hodnotením (0-1)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--today", type=date.fromisoformat, help="referenčný dátum RRRR-MM-DD (predvolene dnes)")
+    args = parser.parse_args(argv)
+
+    if os.path.exists(args.database) and not args.force:
+        print(f"{args.database} už existuje (použi --force)")
+        return 1
+
+    start = time.perf_counter()
+    counts = create_database(
+        args.database,
+        teams=args.teams,
+        players_per_team=args.players,
+        seasons=args.seasons,
+        matches_per_season=args.matches,
+        trainings_per_week=args.trainings_per_week,
+        attendance_density=args.attendance,
+        evaluation_density=args.evaluations,
+        seed=args.seed,
+        today=args.today,
+    )
+    for table, count in counts.items():
+        print(f"  {table:<12} {count:>8}")
+    print(f"Hotovo za {time.perf_counter() - start:.1f} s: {args.database}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
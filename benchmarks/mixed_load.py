@@ -0,0 +1,123 @@
+"""
+Latencia pri zmiešanej záťaži - prihlásenia (bcrypt) súbežne s prehliadaním stránok.
+
+    DATABASE_PATH=/tmp/kopia.db python -m benchmarks.mixed_load --concurrency 20 --requests 500
+
+Aplikácia beží v tom istom procese cez httpx.ASGITransport (bez siete), takže sa meria
+len jej vlastná réžia. Ak niektorý handler blokuje event loop, prejaví sa to rastom p99
+u VŠETKÝCH požiadaviek, nielen u tých pomalých.
+
+Pozor: prihlásenia vytvárajú sessions - spúšťaj nad kópiou databázy.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Dict, List, Sequence
+
+import httpx
+
+BROWSE_PATHS = ("/", "/matches/", "/trainings/", "/players/", "/profile/")
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """Percentil s lineárnou interpoláciou (p v rozsahu 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+async def login(client: httpx.AsyncClient, username: str, password: str) -> None:
+    response = await client.post("/login", data={"username": username, "password": password}, follow_redirects=False)
+    if response.status_code != 303:
+        raise RuntimeError(f"Prihlásenie zlyhalo ({response.status_code}) - skontroluj --username/--password")
+
+
+async def run_mixed_load(
+    app,
+    username: str,
+    password: str,
+    concurrency: int = 20,
+    total: int = 500,
+    login_ratio: float = 0.1,
+    paths: Sequence[str] = BROWSE_PATHS,
+    seed: int = 1,
+) -> Dict[str, List[float]]:
+    """Vráti namerané latencie (v sekundách) podľa druhu požiadavky: 'login' a 'browse'."""
+    rng = random.Random(seed)
+    plan = ["login" if rng.random() < login_ratio else "browse" for _ in range(total)]
+    latencies: Dict[str, List[float]] = {"login": [], "browse": []}
+    errors = 0
+
+    # ASGITransport lifespan nespúšťa - pool a migrácie pripravíme ručne
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as browser:
+            await login(browser, username, password)
+            position = iter(enumerate(plan))
+
+            async def worker() -> None:
+                nonlocal errors
+                for i, kind in position:
+                    start = time.perf_counter()
+                    if kind == "login":
+                        # Každé prihlásenie vo vlastnom klientovi, aby neprepísalo cookie prehliadača
+                        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                            try:
+                                await login(client, username, password)
+                            except RuntimeError:
+                                errors += 1
+                    else:
+                        response = await browser.get(paths[i % len(paths)])
+                        if response.status_code != 200:
+                            errors += 1
+                    latencies[kind].append(time.perf_counter() - start)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    if errors:
+        print(f"Chybných odpovedí: {errors}", file=sys.stderr)
+    return latencies
+
+
+def format_report(latencies: Dict[str, List[float]], elapsed: float) -> str:
+    lines = [f"{'druh':<8} {'počet':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+    for kind, values in latencies.items():
+        if not values:
+            continue
+        row = [percentile(values, p) * 1000 for p in (50, 95, 99, 100)]
+        lines.append(f"{kind:<8} {len(values):>6} " + " ".join(f"{v:>9.1f}" for v in row))
+    count = sum(len(v) for v in latencies.values())
+    lines.append(f"\n{count} požiadaviek za {elapsed:.2f} s ({count / elapsed:.1f} req/s)")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="p99 latencia pri zmiešanej záťaži login + prehliadanie")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--concurrency", type=int, default=20, help="počet súbežných klientov")
+    parser.add_argument("--requests", type=int, default=500, help="celkový počet požiadaviek")
+    parser.add_argument("--login-ratio", type=float, default=0.1, help="podiel prihlásení (0-1)")
+    parser.add_argument("--path", action="append", dest="paths", help="prehliadaná stránka (dá sa opakovať)")
+    args = parser.parse_args(argv)
+
+    # Import až tu - aplikácia si pri importe načíta nastavenia (DATABASE_PATH, ...)
+    from main import app
+
+    start = time.perf_counter()
+    latencies = asyncio.run(run_mixed_load(
+        app, args.username, args.password, args.concurrency, args.requests,
+        args.login_ratio, tuple(args.paths or BROWSE_PATHS),
+    ))
+    print(format_report(latencies, time.perf_counter() - start))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
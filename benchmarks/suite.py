@@ -0,0 +1,240 @@
+"""
+Výkonnostná sada - priepustnosť a p50/p95/p99 pre každý endpoint, s porovnaním voči baseline.
+
+    python -m benchmarks.generate_data /tmp/bench.db --force --today 2026-01-15
+    python -m benchmarks.suite /tmp/bench.db --save baseline.json
+    python -m benchmarks.suite /tmp/bench.db --compare baseline.json     # exit 1 pri regresii
+
+Aplikácia beží v tom istom procese (httpx.ASGITransport), každý endpoint sa zaťaží
+samostatne `--requests` požiadavkami z `--concurrency` súbežných klientov pod rolou,
+ktorá k nemu má prístup. Databázu treba pripraviť cez benchmarks.generate_data
+(účty a heslá sa berú odtiaľ); sada ju nemení okrem sessions z prihlásení.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sqlite3
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from benchmarks.mixed_load import login, percentile
+
+ACCOUNTS = {
+    "admin": ("admin", "admin123"),
+    "coach": ("trener1", "trener123"),
+    "player": ("hrac0001", "hrac123"),
+}
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    role: str
+    path: str
+
+
+# Cesty s {match_id} / {player_id} sa doplnia podľa dát (pozri _resolve_ids)
+ENDPOINTS: Tuple[Endpoint, ...] = (
+    Endpoint("dashboard_admin", "admin", "/"),
+    Endpoint("dashboard_coach", "coach", "/"),
+    Endpoint("dashboard_player", "player", "/"),
+    Endpoint("matches", "player", "/matches/"),
+    Endpoint("matches_season", "player", "/matches/?season={season}"),
+    Endpoint("trainings", "player", "/trainings/"),
+    Endpoint("players", "coach", "/players/"),
+    Endpoint("users", "admin", "/users/"),
+    Endpoint("profile", "player", "/profile/"),
+    Endpoint("match_detail", "player", "/matches/{match_id}/detail"),
+    Endpoint("match_manage", "coach", "/matches/{match_id}/manage"),
+    Endpoint("player_attendance", "coach", "/players/{player_id}/attendance"),
+    Endpoint("attendance_matrix", "coach", "/players/matrix?season={season}&limit=200"),
+    Endpoint("analytics", "coach", "/analytics/?season={season}"),
+)
+
+
+@dataclass
+class Result:
+    requests: int
+    errors: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def _resolve_ids(database_path: str) -> Dict[str, str]:
+    from repositories.pagination import current_season
+    conn = sqlite3.connect(database_path)
+    try:
+        match, played = conn.execute(
+            "SELECT id, date FROM matches WHERE home_score IS NOT NULL ORDER BY date DESC LIMIT 1"
+        ).fetchone() or (None, None)
+        player = conn.execute(
+            "SELECT id FROM users WHERE username = ?", (ACCOUNTS["player"][0],)
+        ).fetchone()
+    finally:
+        conn.close()
+    if match is None or player is None:
+        raise SystemExit("Databáza nemá dáta pre benchmark - vytvor ju cez benchmarks.generate_data")
+    # Sezóna posledného odohraného zápasu - dáta mohli vzniknúť s iným --today
+    season = current_season(date.fromisoformat(played[:10]))
+    return {"match_id": str(match), "player_id": str(player[0]), "season": season}
+
+
+async def _measure(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> Result:
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return Result(
+        requests=total,
+        errors=errors,
+        seconds=round(elapsed, 4),
+        throughput=round(total / elapsed, 2),
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p95_ms=round(percentile(latencies, 95) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+    )
+
+
+async def run_suite(
+    app,
+    ids: Dict[str, str],
+    endpoints: Sequence[Endpoint] = ENDPOINTS,
+    total: int = 200,
+    concurrency: int = 10,
+    warmup: int = 5,
+) -> Dict[str, Result]:
+    results: Dict[str, Result] = {}
+    # ASGITransport lifespan nespúšťa - pool a migrácie pripravíme ručne
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        clients: Dict[str, httpx.AsyncClient] = {}
+        try:
+            for endpoint in endpoints:
+                client = clients.get(endpoint.role)
+                if client is None:
+                    client = clients[endpoint.role] = httpx.AsyncClient(transport=transport, base_url="http://bench")
+                    await login(client, *ACCOUNTS[endpoint.role])
+                path = endpoint.path.format(**ids)
+                for _ in range(warmup):
+                    await client.get(path)
+                results[endpoint.name] = await _measure(client, path, total, concurrency)
+        finally:
+            for client in clients.values():
+                await client.aclose()
+    return results
+
+
+def format_report(results: Dict[str, Result]) -> str:
+    lines = [f"{'endpoint':<20} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'chyby':>6}"]
+    for name, r in results.items():
+        lines.append(f"{name:<20} {r.throughput:>9.1f} {r.p50_ms:>9.2f} {r.p95_ms:>9.2f} {r.p99_ms:>9.2f} {r.errors:>6}")
+    return "\n".join(lines)
+
+
+def save_baseline(path: str, results: Dict[str, Result], meta: Dict[str, object]) -> None:
+    data = {"meta": meta, "endpoints": {name: asdict(r) for name, r in results.items()}}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    results: Dict[str, Result],
+    tolerance: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """
+    Zoznam regresií voči baseline. Latencia je regresia, ak je p95 horšia o viac ako
+    `tolerance` (relatívne) A zároveň o viac ako `min_delta_ms` - pri rýchlych endpointoch
+    by inak rozhodoval šum. Priepustnosť je regresia pri poklese o viac ako `tolerance`.
+    """
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if r.errors and not base.get("errors"):
+            regressions.append(f"{name}: {r.errors} chybných odpovedí")
+        delta = r.p95_ms - base["p95_ms"]
+        if delta > min_delta_ms and r.p95_ms > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.2f} -> {r.p95_ms:.2f} ms")
+        if r.throughput < base["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: priepustnosť {base['throughput']:.1f} -> {r.throughput:.1f} req/s")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Priepustnosť a latencie endpointov, porovnanie s baseline")
+    parser.add_argument("database", help="databáza z benchmarks.generate_data (stačí kópia, zapisujú sa sessions)")
+    parser.add_argument("--requests", type=int, default=200, help="požiadaviek na endpoint")
+    parser.add_argument("--concurrency", type=int, default=10, help="počet súbežných klientov")
+    parser.add_argument("--warmup", type=int, default=5, help="nemeraných požiadaviek pred meraním")
+    parser.add_argument("--only", action="append", help="len vybrané endpointy (dá sa opakovať)")
+    parser.add_argument("--save", metavar="JSON", help="uložiť výsledok ako baseline")
+    parser.add_argument("--compare", metavar="JSON", help="porovnať s baseline, pri regresii exit 1")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="povolené zhoršenie (0.2 = 20 %%)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="menší rozdiel p95 sa ignoruje")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.database):
+        print(f"{args.database} neexistuje - vytvor ju cez python -m benchmarks.generate_data")
+        return 1
+    # Aplikácia si nastavenia načíta pri importe - cesta k DB musí byť známa skôr
+    os.environ["DATABASE_PATH"] = args.database
+    from main import app
+
+    endpoints = [e for e in ENDPOINTS if not args.only or e.name in args.only]
+    results = asyncio.run(run_suite(
+        app, _resolve_ids(args.database), endpoints, args.requests, args.concurrency, args.warmup,
+    ))
+    print(format_report(results))
+
+    if args.save:
+        save_baseline(args.save, results, {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        })
+        print(f"\nBaseline uložená: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline["endpoints"], results, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print("\nRegresie voči baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nBez regresií voči baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
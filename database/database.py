@@ -1,22 +1,29 @@
 import sqlite3
 from contextlib import contextmanager
-from typing import Iterator
-import os
+from typing import Iterator, Optional
+import settings
+from database.tracing import InstrumentedConnection, tracer
 
-@contextmanager
-def open_connection() -> Iterator[sqlite3.Connection]:
-    current_dir = os.path.dirname(os.path.realpath(__file__))
-    database_path = os.path.join(current_dir, 'database.db')
+
+def connect(database_path: Optional[str] = None) -> sqlite3.Connection:
+    """Otvorí a nakonfiguruje nové spojenie (row_factory + PRAGMA)."""
     conn = sqlite3.connect(
-        database_path,
+        database_path or settings.DATABASE_PATH,
         detect_types=sqlite3.PARSE_DECLTYPES,
         check_same_thread=False,   # povolí použití v jiném vlákně
+        # Meranie príkazov len ak je zapnuté - inak čisté spojenie bez réžie
+        factory=InstrumentedConnection if tracer.instrumented else sqlite3.Connection,
     )
     conn.row_factory = sqlite3.Row
-    conn.set_trace_callback(print)
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
+    return conn
 
+
+@contextmanager
+def open_connection() -> Iterator[sqlite3.Connection]:
+    # Samostatné (nepoolované) spojenie - pre skripty ako init_db.py
+    conn = connect()
     try:
         yield conn
     finally:
@@ -0,0 +1,194 @@
+"""
+Spustí EXPLAIN QUERY PLAN nad všetkými dotazmi z repositories/ a nahlási tie,
+ktoré stále prechádzajú celú tabuľku (SCAN bez indexu).
+
+    python -m database.explain            # prázdna DB so schémou v pamäti
+    python -m database.explain --db cesta # kópia reálnej DB (plány podľa jej štatistík)
+
+Dotazy sa zachytia tak, že sa zavolajú skutočné funkcie repozitárov nad dočasnou
+kópiou databázy - nový dotaz preto stačí pridať do CASES.
+"""
+import argparse
+import sqlite3
+import sys
+from typing import Any, Callable, List, Sequence, Tuple
+
+from database.migrations import migrate
+from repositories import analytics, calendar, dashboard, exports, generations, matches, players, stats, trainings, users
+from services.auth import User
+from services.session import SqliteSessionBackend
+
+
+class _CapturingConnection(sqlite3.Connection):
+    """Zapamätá si každý príkaz aj s parametrami."""
+
+    captured: List[Tuple[str, Sequence[Any]]]
+
+    def execute(self, sql, parameters=()):
+        self.captured.append((sql, parameters))
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        seq_of_parameters = list(seq_of_parameters)
+        if seq_of_parameters:
+            self.captured.append((sql, seq_of_parameters[0]))
+        return super().executemany(sql, seq_of_parameters)
+
+
+def _sessions(conn: sqlite3.Connection, **kwargs) -> SqliteSessionBackend:
+    # Bez cache, aby každé volanie naozaj išlo do DB
+    return SqliteSessionBackend(lambda: conn, ttl=60, cache_size=0, **kwargs)
+
+
+# (názov, volanie repozitára) - argumenty stačia ľubovoľné, ide len o tvar dotazu
+CASES: List[Tuple[str, Callable[[sqlite3.Connection], Any]]] = [
+    ("analytics.load_evaluation_columns", lambda c: analytics.load_evaluation_columns(c, "2025-07-01", "2026-07-01")),
+    # Bez filtra sezóny číta analytika zámerne celú tabuľku evaluations (SCAN je tam správny plán)
+    ("analytics.load_match_order", lambda c: analytics.load_match_order(c, "2025-07-01", "2026-07-01")),
+    ("analytics.load_match_order (všetky)", lambda c: analytics.load_match_order(c)),
+    ("analytics.get_players_by_id", lambda c: analytics.get_players_by_id(c)),
+    ("dashboard.get_counts", lambda c: dashboard.get_counts(c)),
+    ("dashboard.get_next_match", lambda c: dashboard.get_next_match(c, "2025-01-01T10:00")),
+    ("dashboard.get_next_training", lambda c: dashboard.get_next_training(c, "2025-01-01T10:00")),
+    ("dashboard.get_recent_matches", lambda c: dashboard.get_recent_matches(c)),
+    ("calendar.set_calendar_token", lambda c: calendar.set_calendar_token(c, 1, "abc", 0.0)),
+    ("calendar.get_calendar_token", lambda c: calendar.get_calendar_token(c, 1)),
+    ("calendar.find_calendar_user", lambda c: calendar.find_calendar_user(c, "abc")),
+    ("calendar.delete_calendar_token", lambda c: calendar.delete_calendar_token(c, 1)),
+    ("generations.get_generation_stamps", lambda c: generations.get_generation_stamps(c, ("matches", "trainings"))),
+    ("generations.get_generations", lambda c: generations.get_generations(c, ("matches", "attendance"))),
+    ("matches.list_matches", lambda c: matches.list_matches(c)),
+    ("matches.list_matches_page", lambda c: matches.list_matches_page(c, 10, "WyIyMDI1LTAxLTAxVDEwOjAwIiwgMV0", "2024-07-01", "2025-07-01", 1)),
+    ("matches.get_match", lambda c: matches.get_match(c, 1)),
+    ("matches.get_attendance", lambda c: matches.get_attendance(c, 1, 1)),
+    ("matches.set_attendance", lambda c: matches.set_attendance(c, 1, 1, True)),
+    ("matches.toggle_attendance", lambda c: matches.toggle_attendance(c, 1, 1)),
+    ("matches.get_match_attendees", lambda c: matches.get_match_attendees(c, 1)),
+    ("matches.get_match_participants", lambda c: matches.get_match_participants(c, 1)),
+    ("matches.get_evaluation", lambda c: matches.get_evaluation(c, 1, 1)),
+    ("matches.set_evaluation", lambda c: matches.set_evaluation(c, 1, 1, 1, 5.0, "")),
+    ("matches.update_score", lambda c: matches.update_score(c, 1, 1, 0)),
+    ("matches.update_match", lambda c: matches.update_match(c, 1, "2025-01-01T10:00", "X", "Y", None, None)),
+    ("matches.delete_match", lambda c: matches.delete_match(c, 999)),
+    ("trainings.list_trainings", lambda c: trainings.list_trainings(c)),
+    ("trainings.list_trainings_page", lambda c: trainings.list_trainings_page(c, 10, "WyIyMDI1LTAxLTAxVDEwOjAwIiwgMV0", "2024-07-01", "2025-07-01")),
+    ("trainings.get_training", lambda c: trainings.get_training(c, 1)),
+    ("trainings.get_training_attendance", lambda c: trainings.get_training_attendance(c, 1, 1)),
+    ("trainings.set_training_attendance", lambda c: trainings.set_training_attendance(c, 1, 1, True)),
+    ("trainings.toggle_training_attendance", lambda c: trainings.toggle_training_attendance(c, 1, 1)),
+    ("trainings.update_training", lambda c: trainings.update_training(c, 1, "2025-01-01T10:00", "X", "")),
+    ("trainings.delete_training", lambda c: trainings.delete_training(c, 999)),
+    ("players.list_players", lambda c: players.list_players(c)),
+    ("players.list_players_page", lambda c: players.list_players_page(c, 10, "WyJBIiwgIkIiLCAxXQ")),
+    ("players.get_player", lambda c: players.get_player(c, 1)),
+    ("players.update_player", lambda c: players.update_player(c, 1, "A", "B", "C", "2000-01-01")),
+    ("players.get_player_events", lambda c: players.get_player_events(c, 1)),
+    ("players.get_player_events[future]", lambda c: players.get_player_events(c, 1, "future", limit=3, now="2025-01-01T10:00")),
+    ("players.get_player_events[range]", lambda c: players.get_player_events(c, 1, "past", "2024-07-01", "2025-07-01", now="2025-01-01T10:00")),
+    ("players.iter_player_events", lambda c: list(players.iter_player_events(c, 1))),
+    *(
+        (f"exports.iter_export[{dataset}]", lambda c, d=dataset: list(exports.iter_export(c, d, "2025-07-01", "2026-07-01", 1)))
+        for dataset in exports.EXPORT_COLUMNS
+    ),
+    ("exports.iter_export[attendance, všetko]", lambda c: list(exports.iter_export(c, "attendance"))),
+    # exports.list_teams číta celú (malú) tabuľku teams pre výber vo formulári - SCAN je tam v poriadku
+    ("players.list_events_window", lambda c: players.list_events_window(c, "2025-07-01", "2026-07-01", 60)),
+    ("players.get_squad_attendance", lambda c: players.get_squad_attendance(c, "2025-07-01", "2026-07-01")),
+    ("players.get_presence", lambda c: players.get_presence(c, [(1, "match", 1), (2, "training", 1)])),
+    ("players.find_presence_targets", lambda c: players.find_presence_targets(c, [1, 2], [1], [1])),
+    ("players.set_player_presence[match]", lambda c: players.set_player_presence(c, 1, "match", 1, True)),
+    ("players.set_player_presence[training]", lambda c: players.set_player_presence(c, 1, "training", 1, True)),
+    ("players.delete_player", lambda c: players.delete_player(c, 999)),
+    ("stats.get_attendance_counters", lambda c: stats.get_attendance_counters(c, 1)),
+    ("stats.get_event_totals", lambda c: stats.get_event_totals(c)),
+    ("session.create_session", lambda c: _sessions(c).create_session(User(1, "explain", "player"))),
+    ("session.get_user", lambda c: _sessions(c).get_user("token")),
+    ("session.touch", lambda c: _sessions(c, touch_interval=0).get_user(_sessions(c).create_session(User(1, "explain", "player")))),
+    ("session.delete_session", lambda c: _sessions(c).delete_session("token")),
+    ("session.purge_expired", lambda c: _sessions(c).purge_expired()),
+    ("session.count", lambda c: _sessions(c).count()),
+    ("users.get_user_by_username", lambda c: users.get_user_by_username(c, "admin")),
+    ("users.get_user_by_id", lambda c: users.get_user_by_id(c, 1)),
+    ("users.get_all_users", lambda c: users.get_all_users(c)),
+    ("users.list_users_page", lambda c: users.list_users_page(c, 10, "WyJwbGF5ZXIiLCAiQSIsICJCIiwgMV0")),
+    ("users.update_user", lambda c: users.update_user(c, 1, "admin", "A", "B")),
+    ("users.delete_user", lambda c: users.delete_user(c, 999)),
+]
+
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "REPLACE")
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    # Minimum riadkov, aby zapisujúce funkcie prešli cez cudzie kľúče
+    conn.execute("INSERT OR IGNORE INTO users(id, username, password_hash, role) VALUES (1, 'explain', '-', 'player')")
+    conn.execute("INSERT OR IGNORE INTO matches(id, date, opponent, location) VALUES (1, '2025-01-01T10:00', 'X', 'Y')")
+    conn.execute("INSERT OR IGNORE INTO trainings(id, date, location) VALUES (1, '2025-01-01T10:00', 'Y')")
+    conn.commit()
+
+
+def open_scratch_db(source_path: str = None) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:", factory=_CapturingConnection)
+    conn.captured = []
+    conn.row_factory = sqlite3.Row
+    if source_path:
+        source = sqlite3.connect(source_path)
+        source.backup(conn)
+        source.close()
+    conn.execute("PRAGMA foreign_keys = ON")
+    migrate(conn)
+    _seed(conn)
+    return conn
+
+
+def explain_all(conn: sqlite3.Connection) -> List[Tuple[str, str, List[str]]]:
+    """Vráti (názov, sql, riadky plánu) pre každý zachytený dotaz."""
+    results = []
+    for name, call in CASES:
+        conn.captured = []
+        try:
+            call(conn)
+        except sqlite3.Error as e:
+            # Zachytené príkazy vysvetlíme aj tak, chyba je dôsledok testovacích dát
+            print(f"   ({name}: {e})", file=sys.stderr)
+            conn.rollback()
+        seen = set()
+        for sql, params in conn.captured:
+            normalized = " ".join(sql.split())
+            if not normalized.upper().startswith(_EXPLAINABLE) or normalized in seen:
+                continue
+            seen.add(normalized)
+            plan = [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+            results.append((name, normalized, plan))
+    return results
+
+
+def is_full_scan(detail: str) -> bool:
+    # "SCAN t USING INDEX ..." prechádza index v poradí (ORDER BY) - to za problém nepovažujeme,
+    # rovnako ako prechod výsledkom poddotazu ("SCAN (subquery-1)") či SELECT bez FROM
+    if detail.startswith(("SCAN (", "SCAN CONSTANT ROW")):
+        return False
+    return detail.startswith("SCAN ") and " USING " not in detail
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN QUERY PLAN nad dotazmi repozitárov")
+    parser.add_argument("--db", help="cesta k databáze, z ktorej sa vezme kópia (default: prázdna schéma)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="vypíše plán každého dotazu")
+    args = parser.parse_args(argv)
+
+    conn = open_scratch_db(args.db)
+    scans = 0
+    for name, sql, plan in explain_all(conn):
+        flagged = [d for d in plan if is_full_scan(d)]
+        scans += len(flagged)
+        if flagged or args.verbose:
+            print(f"{'!!' if flagged else 'ok'} {name}: {sql}")
+            for detail in plan:
+                marker = "   <-- full scan" if detail in flagged else ""
+                print(f"     {detail}{marker}")
+    print(f"\nVolaní repozitára: {len(CASES)}, full scan: {scans}")
+    return 1 if scans else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from database.schema import DDL_CREATE
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: Tuple[str, ...]
+
+
+def split_script(script: str) -> Tuple[str, ...]:
+    """Rozdelí SQL skript na samostatné príkazy (executescript nejde spustiť v transakcii)."""
+    statements = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return tuple(statements)
+
+
+def _generation_statements(tables: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Tabuľka cache_generations + triggre, ktoré pri každom zápise do `tables` zvýšia
+    počítadlo rovnomenného menného priestoru. Keďže počítadlá žijú v DB, cache
+    v každom workeri vidí zmenu z ktoréhokoľvek iného (aj z importu či skriptu).
+    """
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS cache_generations (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL NOT NULL
+        ) WITHOUT ROWID
+        """,
+    ]
+    for table in tables:
+        statements.append(
+            f"INSERT OR IGNORE INTO cache_generations(name, value, updated_at) "
+            f"VALUES ('{table}', 0, (julianday('now') - 2440587.5) * 86400.0)"
+        )
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_generation_{event.lower()} AFTER {event} ON {table}
+        BEGIN
+            UPDATE cache_generations
+            SET value = value + 1, updated_at = (julianday('now') - 2440587.5) * 86400.0
+            WHERE name = '{table}';
+        END
+        """)
+    return tuple(statements)
+
+
+# Verzia schémy je uložená v PRAGMA user_version. Nové zmeny pridávaj VŽDY na koniec
+# ako novú migráciu - existujúce sa už nikdy nemenia.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "základná schéma", split_script(DDL_CREATE)),
+    Migration(2, "indexy a unikátne kľúče pre účasť a hodnotenia", (
+        # Duplicity z čias bez unikátnych kľúčov - necháme najnovší záznam
+        """
+        DELETE FROM attendance WHERE match_id IS NOT NULL AND id NOT IN (
+            SELECT MAX(id) FROM attendance WHERE match_id IS NOT NULL GROUP BY user_id, match_id
+        )
+        """,
+        """
+        DELETE FROM attendance WHERE training_id IS NOT NULL AND id NOT IN (
+            SELECT MAX(id) FROM attendance WHERE training_id IS NOT NULL GROUP BY user_id, training_id
+        )
+        """,
+        """
+        DELETE FROM evaluations WHERE id NOT IN (
+            SELECT MAX(id) FROM evaluations GROUP BY match_id, player_id
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_attendance_user_match ON attendance(user_id, match_id)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_attendance_user_training ON attendance(user_id, training_id)",
+        "CREATE INDEX IF NOT EXISTS ix_attendance_match ON attendance(match_id)",
+        "CREATE INDEX IF NOT EXISTS ix_attendance_training ON attendance(training_id)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_evaluations_match_player ON evaluations(match_id, player_id)",
+        "CREATE INDEX IF NOT EXISTS ix_evaluations_player ON evaluations(player_id)",
+        # Bez neho by kontrola cudzieho kľúča pri mazaní používateľa prechádzala celú tabuľku
+        "CREATE INDEX IF NOT EXISTS ix_evaluations_coach ON evaluations(coach_id)",
+        "CREATE INDEX IF NOT EXISTS ix_users_role_name ON users(role, last_name, first_name)",
+        "CREATE INDEX IF NOT EXISTS ix_matches_date ON matches(date)",
+        "CREATE INDEX IF NOT EXISTS ix_trainings_date ON trainings(date)",
+    )),
+    Migration(3, "mená používateľov bez NULL (stránkovanie podľa mena)", (
+        "UPDATE users SET first_name = '' WHERE first_name IS NULL",
+        "UPDATE users SET last_name = '' WHERE last_name IS NULL",
+    )),
+    Migration(4, "tabuľka sessions", (
+        """
+        CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            touched_at REAL NOT NULL
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_sessions_expires ON sessions(expires_at)",
+        "CREATE INDEX IF NOT EXISTS ix_sessions_user ON sessions(user_id)",
+    )),
+    Migration(5, "počítadlá účasti hráčov (player_stats) udržiavané triggermi", (
+        """
+        CREATE TABLE IF NOT EXISTS player_stats (
+            user_id INTEGER PRIMARY KEY,
+            matches_confirmed INTEGER NOT NULL DEFAULT 0,
+            trainings_confirmed INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        # Počítadlá sa menia pri každom zápise do attendance (aj cez UPSERT - jeho
+        # DO UPDATE spúšťa UPDATE trigger). Riadok hráča sa založí cez INSERT ... WHERE NOT EXISTS:
+        # INSERT OR IGNORE by nestačil, konfliktnú politiku triggera prebije vonkajší príkaz.
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_attendance_stats_insert AFTER INSERT ON attendance
+        WHEN NEW.confirmed
+        BEGIN
+            INSERT INTO player_stats(user_id)
+            SELECT NEW.user_id WHERE NOT EXISTS (SELECT 1 FROM player_stats WHERE user_id = NEW.user_id);
+            UPDATE player_stats
+            SET matches_confirmed = matches_confirmed + (NEW.match_id IS NOT NULL),
+                trainings_confirmed = trainings_confirmed + (NEW.training_id IS NOT NULL)
+            WHERE user_id = NEW.user_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_attendance_stats_update
+        AFTER UPDATE OF user_id, match_id, training_id, confirmed ON attendance
+        WHEN OLD.confirmed OR NEW.confirmed
+        BEGIN
+            UPDATE player_stats
+            SET matches_confirmed = matches_confirmed - (OLD.match_id IS NOT NULL AND OLD.confirmed),
+                trainings_confirmed = trainings_confirmed - (OLD.training_id IS NOT NULL AND OLD.confirmed)
+            WHERE user_id = OLD.user_id;
+            INSERT INTO player_stats(user_id)
+            SELECT NEW.user_id WHERE NOT EXISTS (SELECT 1 FROM player_stats WHERE user_id = NEW.user_id);
+            UPDATE player_stats
+            SET matches_confirmed = matches_confirmed + (NEW.match_id IS NOT NULL AND NEW.confirmed),
+                trainings_confirmed = trainings_confirmed + (NEW.training_id IS NOT NULL AND NEW.confirmed)
+            WHERE user_id = NEW.user_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_attendance_stats_delete AFTER DELETE ON attendance
+        WHEN OLD.confirmed
+        BEGIN
+            UPDATE player_stats
+            SET matches_confirmed = matches_confirmed - (OLD.match_id IS NOT NULL),
+                trainings_confirmed = trainings_confirmed - (OLD.training_id IS NOT NULL)
+            WHERE user_id = OLD.user_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_users_stats_delete AFTER DELETE ON users
+        BEGIN
+            DELETE FROM player_stats WHERE user_id = OLD.id;
+        END
+        """,
+        # Doterajšia história
+        """
+        INSERT OR REPLACE INTO player_stats(user_id, matches_confirmed, trainings_confirmed)
+        SELECT user_id,
+               SUM(match_id IS NOT NULL AND confirmed),
+               SUM(training_id IS NOT NULL AND confirmed)
+        FROM attendance
+        GROUP BY user_id
+        """,
+    )),
+    Migration(6, "generácie pre invalidáciu cache (cache_generations)", _generation_statements(
+        # menný priestor -> tabuľka, ktorej zmeny ho zneplatnia
+        ("matches", "trainings", "users", "attendance", "evaluations")
+    )),
+    Migration(7, "tokeny kalendárových feedov (calendar_tokens)", (
+        """
+        CREATE TABLE IF NOT EXISTS calendar_tokens (
+            user_id INTEGER PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+            token_hash TEXT NOT NULL UNIQUE,
+            created_at REAL NOT NULL
+        )
+        """,
+    )),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection, target: Optional[int] = None) -> List[Migration]:
+    """
+    Aplikuje chýbajúce migrácie, každú v samostatnej transakcii.
+    BEGIN IMMEDIATE zabezpečí, že pri súbežnom štarte viacerých workerov migruje len jeden.
+    Vráti zoznam aplikovaných migrácií.
+    """
+    target = LATEST_VERSION if target is None else target
+    applied = []
+    if current_version(conn) >= target:
+        return applied
+    for migration in MIGRATIONS:
+        if migration.version > target:
+            break
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Verziu čítame až v transakcii - iný proces ju mohol medzitým zvýšiť
+            if current_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {migration.version:d}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(migration)
+    return applied
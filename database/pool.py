@@ -0,0 +1,204 @@
+import queue
+import sqlite3
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import settings
+from database.database import connect
+
+
+class PoolTimeout(Exception):
+    """Do stanoveného času sa neuvoľnilo žiadne spojenie."""
+
+
+class ConnectionPool:
+    """
+    Ohraničený pool dlhožijúcich SQLite spojení.
+
+    Spojenia sa vytvárajú cez `connect` (PRAGMA sa teda nastavia len raz pri vytvorení),
+    požiadavka si jedno spojenie požičia (checkout) a po skončení ho vráti (checkin).
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        size: int = 5,
+        timeout: float = 10.0,
+        health_check_interval: float = 30.0,
+    ):
+        if size < 1:
+            raise ValueError("Pool musí mať aspoň jedno spojenie.")
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        # LIFO - najčastejšie sa používajú "teplé" spojenia, zvyšok môže zostať nečinný
+        self._idle: "queue.LifoQueue[Tuple[sqlite3.Connection, float]]" = queue.LifoQueue()
+        self._lock = Lock()
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+        # Metriky
+        self._checkouts = 0
+        self._timeouts = 0
+        self._replaced = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def warm(self) -> None:
+        """Vopred otvorí všetky spojenia, aby ich prvé požiadavky nemuseli vytvárať."""
+        while self._reserve_slot():
+            self._idle.put((self._open(), time.monotonic()))
+
+    def checkout(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Pool je zatvorený.")
+
+        start = time.perf_counter()
+        conn = self._acquire()
+        waited = time.perf_counter() - start
+
+        with self._lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._wait_total += waited
+            if waited > self._wait_max:
+                self._wait_max = waited
+        return conn
+
+    def checkin(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use -= 1
+
+        try:
+            # Nepotvrdená transakcia (napr. výnimka v strede požiadavky) sa nesmie preniesť ďalej
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        if self._closed:
+            self._discard(conn)
+            return
+        self._idle.put((conn, time.monotonic()))
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.checkout()
+        try:
+            yield conn
+        finally:
+            self.checkin(conn)
+
+    def close(self) -> None:
+        """Zatvorí nečinné spojenia; požičané sa zatvoria pri vrátení."""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "replaced": self._replaced,
+                "wait_seconds_total": self._wait_total,
+                "wait_seconds_max": self._wait_max,
+            }
+
+    #   INTERNÉ
+
+    def _acquire(self) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                conn, returned_at = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve_slot():
+                    return self._open()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    with self._lock:
+                        self._timeouts += 1
+                    raise PoolTimeout(f"Žiadne voľné spojenie do {self.timeout} s (pool size {self.size}).")
+                try:
+                    # Krátke čakanie - slot sa môže uvoľniť aj vyradením pokazeného spojenia
+                    conn, returned_at = self._idle.get(timeout=min(remaining, 0.5))
+                except queue.Empty:
+                    continue
+
+            if time.monotonic() - returned_at < self.health_check_interval or self._is_healthy(conn):
+                return conn
+            # Pokazené spojenie nahradíme novým
+            self._discard(conn)
+            with self._lock:
+                self._replaced += 1
+
+    def _reserve_slot(self) -> bool:
+        with self._lock:
+            if self._closed or self._created >= self.size:
+                return False
+            self._created += 1
+            return True
+
+    def _open(self) -> sqlite3.Connection:
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Vráti (a pri prvom volaní vytvorí) spoločný pool aplikácie."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    connect,
+                    size=settings.DB_POOL_SIZE,
+                    timeout=settings.DB_POOL_TIMEOUT,
+                    health_check_interval=settings.DB_POOL_HEALTH_CHECK_INTERVAL,
+                )
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
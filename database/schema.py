@@ -0,0 +1,83 @@
+# SQL príkazy pre Futbalový projekt (bez DROP TABLE)
+# Používame IF NOT EXISTS, aby sme neprepisovali existujúce tabuľky
+DDL_CREATE = """
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    description TEXT
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL, -- 'admin', 'coach', 'player'
+    first_name TEXT,
+    last_name TEXT,
+    position TEXT,
+    birth_date DATE,
+    team_id INTEGER,
+    FOREIGN KEY (team_id) REFERENCES teams(id)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date DATETIME NOT NULL,
+    opponent TEXT NOT NULL,
+    location TEXT NOT NULL,
+    home_score INTEGER DEFAULT NULL CHECK (home_score IS NULL OR home_score >= 0),
+    away_score INTEGER DEFAULT NULL CHECK (away_score IS NULL OR away_score >= 0),
+    team_id INTEGER,
+    FOREIGN KEY (team_id) REFERENCES teams(id)
+);
+
+CREATE TABLE IF NOT EXISTS trainings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date DATETIME NOT NULL,
+    location TEXT NOT NULL,
+    description TEXT,
+    team_id INTEGER,
+    FOREIGN KEY (team_id) REFERENCES teams(id)
+);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    match_id INTEGER,
+    training_id INTEGER,
+    present BOOLEAN DEFAULT 0,
+    confirmed BOOLEAN DEFAULT 0,
+    FOREIGN KEY (user_id) REFERENCES users(id),
+    FOREIGN KEY (match_id) REFERENCES matches(id),
+    FOREIGN KEY (training_id) REFERENCES trainings(id)
+);
+
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    coach_id INTEGER,
+    rating REAL,
+    comment TEXT,
+    FOREIGN KEY (match_id) REFERENCES matches(id),
+    FOREIGN KEY (player_id) REFERENCES users(id),
+    FOREIGN KEY (coach_id) REFERENCES users(id)
+);
+"""
+
+# Príkaz na vymazanie (len ak ho explicitne chceme)
+DDL_DROP = """
+DROP TABLE IF EXISTS calendar_tokens;
+DROP TABLE IF EXISTS cache_generations;
+DROP TABLE IF EXISTS player_stats;
+DROP TABLE IF EXISTS sessions;
+DROP TABLE IF EXISTS attendance;
+DROP TABLE IF EXISTS evaluations;
+DROP TABLE IF EXISTS matches;
+DROP TABLE IF EXISTS trainings;
+DROP TABLE IF EXISTS users;
+DROP TABLE IF EXISTS teams;
+DROP TABLE IF EXISTS items;
+-- verzia schémy späť na nulu, aby migrácie znovu vytvorili všetko
+PRAGMA user_version = 0;
+"""
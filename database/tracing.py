@@ -0,0 +1,238 @@
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+import settings
+
+logger = logging.getLogger("sql")
+
+TRACE_MODES = ("off", "print", "log")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """Normalizovaný tvar príkazu - literály nahradené '?', zbytočné medzery odstránené."""
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _IN_LIST.sub("(?+)", normalized)
+
+
+def fingerprint_id(sql: str) -> str:
+    return hashlib.sha1(fingerprint(sql).encode()).hexdigest()[:12]
+
+
+@dataclass
+class QueryStats:
+    """Súhrn príkazov vykonaných v rámci jedného bloku `collect_queries()`."""
+    count: int = 0
+    duration: float = 0.0
+    statements: List[str] = field(default_factory=list)
+    # Vonkajší blok collect_queries() - vnorené meranie (napr. MetricsMiddleware v teste) sa počíta aj doň
+    parent: Optional["QueryStats"] = field(default=None, repr=False)
+
+    def add(self, sql: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements.append(sql)
+        if self.parent is not None:
+            self.parent.add(sql, duration)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("sql_query_stats", default=None)
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """
+    Spočíta príkazy vykonané v tomto kontexte (aj v threadpoole, kam sa kontext kopíruje).
+    Funguje len na inštrumentovaných spojeniach (pozri `SqlTracer.instrumented`).
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class SqlTracer:
+    """
+    Rozhoduje, čo sa s nameranými príkazmi stane:
+      off   - nič, spojenia nie sú inštrumentované vôbec
+      print - riadok na stdout (pôvodné správanie, vhodné pri vývoji)
+      log   - štruktúrovaný záznam do loggera "sql"
+    Pomalé príkazy (nad `slow_ms`) sa zapíšu vždy ako WARNING, bez ohľadu na sampling.
+    """
+
+    def __init__(self, mode: str = "off", sample_rate: float = 1.0, slow_ms: float = 100.0, collect: bool = False):
+        if mode not in TRACE_MODES:
+            raise ValueError(f"Neznámy režim SQL trace: {mode!r} (povolené: {', '.join(TRACE_MODES)})")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        # Zber štatistík cez collect_queries() aj pri vypnutom výpise
+        self.collect = collect
+
+    @property
+    def instrumented(self) -> bool:
+        return self.mode != "off" or self.collect
+
+    def record(self, sql: str, duration: float, rows: int) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.add(sql, duration)
+
+        if self.mode == "off":
+            return
+        duration_ms = duration * 1000
+        slow = self.slow_ms > 0 and duration_ms >= self.slow_ms
+        if not slow and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+
+        fp = fingerprint(sql)
+        if self.mode == "print":
+            print(f"[sql]{' SLOW' if slow else ''} {duration_ms:.2f} ms rows={rows} {fp}")
+        else:
+            logger.log(
+                logging.WARNING if slow else logging.DEBUG,
+                "%s %.2f ms rows=%d %s", "slow query" if slow else "query", duration_ms, rows, fp,
+                extra={
+                    "sql_fingerprint": fp,
+                    "sql_id": fingerprint_id(sql),
+                    "duration_ms": round(duration_ms, 3),
+                    "rows": rows,
+                    "slow": slow,
+                },
+            )
+
+
+tracer = SqlTracer(
+    mode=settings.SQL_TRACE,
+    sample_rate=settings.SQL_TRACE_SAMPLE_RATE,
+    slow_ms=settings.SQL_SLOW_QUERY_MS,
+    # Metriky potrebujú počet a čas príkazov na požiadavku (collect_queries)
+    collect=settings.METRICS_ENABLED,
+)
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """
+    Meria čas vykonania a počet vrátených riadkov. Záznam pre SELECT sa odošle až keď
+    je kurzor vyčerpaný, zatvorený alebo znovu použitý - až vtedy poznáme počet riadkov.
+    """
+
+    _pending: Optional[list] = None
+
+    def execute(self, sql, parameters=()):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - start
+        self._started(sql, elapsed)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        finally:
+            elapsed = time.perf_counter() - start
+        self._started(sql, elapsed)
+        return self
+
+    def executescript(self, sql_script):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            super().executescript(sql_script)
+        finally:
+            tracer.record(sql_script, time.perf_counter() - start, 0)
+        return self
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(time.perf_counter() - start, 0 if row is None else 1, exhausted=row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched(time.perf_counter() - start, len(rows), exhausted=not rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(time.perf_counter() - start, len(rows), exhausted=True)
+        return rows
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(time.perf_counter() - start, 0, exhausted=True)
+            raise
+        self._fetched(time.perf_counter() - start, 1, exhausted=False)
+        return row
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def __del__(self):
+        self._flush()
+
+    def _started(self, sql: str, elapsed: float) -> None:
+        if self.description is None:
+            # INSERT/UPDATE/DELETE/DDL - výsledok poznáme hneď
+            tracer.record(sql, elapsed, max(self.rowcount, 0))
+        else:
+            self._pending = [sql, elapsed, 0]
+
+    def _fetched(self, elapsed: float, rows: int, exhausted: bool) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        pending[1] += elapsed
+        pending[2] += rows
+        if exhausted:
+            self._flush()
+
+    def _flush(self) -> None:
+        pending = self._pending
+        if pending is not None:
+            self._pending = None
+            tracer.record(pending[0], pending[1], pending[2])
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
@@ -1,19 +1,24 @@
 import sqlite3
 from typing import Iterator, Optional
 from fastapi import Depends, HTTPException, Request, status
-from database.database import open_connection
+from database.pool import get_pool
 from services.items import ItemsService
 from services.auth import AuthService, User
+from services.cache import PageCache
+from services.dashboard import DashboardService
 from services.matches import MatchesService
 from services.players import PlayersService
-from services.session import session_store, SESSION_COOKIE_NAME
+from services.profiles import resolve_user
+from services.session import SESSION_COOKIE_NAME
 from services.stats import StatsService
 from services.trainings import TrainingsService
 from services.users import UsersService
 
 
 def get_conn() -> Iterator[sqlite3.Connection]:
-    with open_connection() as conn:
+    # Spojenie sa požičia z poolu na celú požiadavku. FastAPI výsledok závislosti
+    # v rámci jednej požiadavky cachuje, takže všetky služby dostanú to isté spojenie.
+    with get_pool().connection() as conn:
         yield conn
 
 def items_service(conn: sqlite3.Connection = Depends(get_conn)) -> ItemsService:
@@ -34,13 +39,41 @@ def players_service(conn: sqlite3.Connection = Depends(get_conn)) -> PlayersServ
 def trainings_service(conn = Depends(get_conn)) -> TrainingsService:
     return TrainingsService(conn)
 
+def dashboard_service(conn: sqlite3.Connection = Depends(get_conn)) -> DashboardService:
+    return DashboardService(conn)
+
 def get_current_user(request: Request) -> Optional[User]:
-    session_id = request.cookies.get(SESSION_COOKIE_NAME)
-    return session_store.get_user(session_id)
+    # Používateľa už našiel AuthMiddleware - tu ho len prevezmeme (aj s profilom)
+    try:
+        return request.state.user
+    except AttributeError:
+        # Aplikácia bez middleware (napr. samostatne pripojený router)
+        return resolve_user(request.cookies.get(SESSION_COOKIE_NAME))
+
+def page_cache(
+    request: Request,
+    conn: sqlite3.Connection = Depends(get_conn),
+    user: Optional[User] = Depends(get_current_user),
+) -> PageCache:
+    return PageCache(request, conn, user)
 
 def stats_service(conn = Depends(get_conn)) -> StatsService:
     return StatsService(conn)
 
+def analytics_service(conn: sqlite3.Connection = Depends(get_conn)):
+    # Import až tu - numpy sa načíta len ak je analytika zapnutá a naozaj použitá
+    from services.analytics import AnalyticsService
+    return AnalyticsService(conn)
+
+def calendar_service(conn: sqlite3.Connection = Depends(get_conn)):
+    # Voliteľné funkcie - modul sa načíta, len ak je funkcia zapnutá a naozaj použitá
+    from services.calendar import CalendarService
+    return CalendarService(conn)
+
+def exports_service(conn: sqlite3.Connection = Depends(get_conn)):
+    from services.exports import ExportsService
+    return ExportsService(conn)
+
 def require_user(user: Optional[User] = Depends(get_current_user)) -> User:
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Login required")
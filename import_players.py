@@ -0,0 +1,39 @@
+"""
+Hromadný import hráčov z CSV súboru.
+
+    python import_players.py hraci.csv [--chunk-size 200] [--workers 4] [--password hrac123]
+
+Stĺpce: username, first_name, last_name (povinné), position, birth_date (RRRR-MM-DD), password.
+Hráči bez stĺpca password dostanú predvolené heslo.
+"""
+import argparse
+import sys
+from database.database import open_connection
+from services.player_import import DEFAULT_PASSWORD, import_players
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Hromadný import hráčov z CSV")
+    parser.add_argument("csv_file", help="cesta k CSV súboru (UTF-8)")
+    parser.add_argument("--chunk-size", type=int, help="počet riadkov v jednej transakcii")
+    parser.add_argument("--workers", type=int, help="počet procesov na hashovanie hesiel")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="heslo pre riadky bez stĺpca password")
+    args = parser.parse_args(argv)
+
+    with open(args.csv_file, encoding="utf-8-sig", newline="") as f, open_connection() as conn:
+        try:
+            result = import_players(conn, f, args.password, args.chunk_size, args.workers)
+        except ValueError as e:
+            print(f"Chyba: {e}")
+            return 1
+
+    print(f"Vytvorených hráčov: {result.created}")
+    if result.errors:
+        print(f"Preskočených riadkov: {len(result.errors)}")
+        for error in result.errors:
+            print(f"  riadok {error.line} ({error.username or '-'}): {error.message}")
+    return 0 if not result.errors else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
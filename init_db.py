@@ -1,85 +1,9 @@
 from database.database import open_connection
+from database.migrations import migrate
+from database.schema import DDL_DROP
 from services.auth import AuthService
 import sqlite3
 
-# SQL príkazy pre Futbalový projekt (bez DROP TABLE)
-# Používame IF NOT EXISTS, aby sme neprepisovali existujúce tabuľky
-DDL_CREATE = """
-CREATE TABLE IF NOT EXISTS teams (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL,
-    description TEXT
-);
-
-CREATE TABLE IF NOT EXISTS users (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    username TEXT UNIQUE NOT NULL,
-    password_hash TEXT NOT NULL,
-    role TEXT NOT NULL, -- 'admin', 'coach', 'player'
-    first_name TEXT,
-    last_name TEXT,
-    position TEXT,
-    birth_date DATE,
-    team_id INTEGER,
-    FOREIGN KEY (team_id) REFERENCES teams(id)
-);
-
-CREATE TABLE IF NOT EXISTS matches (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    date DATETIME NOT NULL,
-    opponent TEXT NOT NULL,
-    location TEXT NOT NULL,
-    home_score INTEGER DEFAULT NULL CHECK (home_score IS NULL OR home_score >= 0),
-    away_score INTEGER DEFAULT NULL CHECK (away_score IS NULL OR away_score >= 0),
-    team_id INTEGER,
-    FOREIGN KEY (team_id) REFERENCES teams(id)
-);
-
-CREATE TABLE IF NOT EXISTS trainings (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    date DATETIME NOT NULL,
-    location TEXT NOT NULL,
-    description TEXT,
-    team_id INTEGER,
-    FOREIGN KEY (team_id) REFERENCES teams(id)
-);
-
-CREATE TABLE IF NOT EXISTS attendance (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    user_id INTEGER NOT NULL,
-    match_id INTEGER,
-    training_id INTEGER,
-    present BOOLEAN DEFAULT 0,
-    confirmed BOOLEAN DEFAULT 0,
-    FOREIGN KEY (user_id) REFERENCES users(id),
-    FOREIGN KEY (match_id) REFERENCES matches(id),
-    FOREIGN KEY (training_id) REFERENCES trainings(id)
-);
-
-CREATE TABLE IF NOT EXISTS evaluations (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    match_id INTEGER NOT NULL,
-    player_id INTEGER NOT NULL,
-    coach_id INTEGER,
-    rating REAL,
-    comment TEXT,
-    FOREIGN KEY (match_id) REFERENCES matches(id),
-    FOREIGN KEY (player_id) REFERENCES users(id),
-    FOREIGN KEY (coach_id) REFERENCES users(id)
-);
-"""
-
-# Príkaz na vymazanie (len ak ho explicitne chceme)
-DDL_DROP = """
-DROP TABLE IF EXISTS attendance;
-DROP TABLE IF EXISTS evaluations;
-DROP TABLE IF EXISTS matches;
-DROP TABLE IF EXISTS trainings;
-DROP TABLE IF EXISTS users;
-DROP TABLE IF EXISTS teams;
-DROP TABLE IF EXISTS items;
-"""
-
 if __name__ == "__main__":
     print("Spúšťam inicializáciu databázy...")
 
@@ -91,7 +15,7 @@ if __name__ == "__main__":
             print("Vymazávam staré tabuľky...")
             conn.executescript(DDL_DROP)
             print("Vytváram nové tabuľky...")
-            conn.executescript(DDL_CREATE)
+            migrate(conn)
 
             # Seedovanie dát (len pri resete)
             print("Vkladám základné dáta (Admin, Tréner, Hráč)...")
@@ -114,7 +38,8 @@ if __name__ == "__main__":
 
         else:
             print("Aktualizujem štruktúru tabuliek (bez straty dát)...")
-            conn.executescript(DDL_CREATE)
+            for migration in migrate(conn):
+                print(f"  migrácia {migration.version}: {migration.name}")
 
             # Kontrola, či existuje admin, ak nie, vytvoríme ho (pre istotu)
             try:
@@ -126,7 +51,7 @@ if __name__ == "__main__":
                     admin_pass = auth_service.hash_password("admin123")
                     cur.execute("INSERT INTO users(username, password_hash, role, first_name, last_name) VALUES (?, ?, ?, ?, ?)", ("admin", admin_pass, "admin", "Hlavný", "Admin"))
             except sqlite3.OperationalError:
-                pass # Tabuľka users možno ešte neexistovala pred DDL_CREATE
+                pass # Tabuľka users možno ešte neexistovala pred migráciou
 
             print("Hotovo! Databáza je pripravená na použitie.")
 
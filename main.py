@@ -1,61 +1,90 @@
 # app/main.py
-from fastapi import FastAPI, Request
+import time
+
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from typing import Optional
+import anyio
+from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from starlette.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
-# from pages.items import router as items_router  # ← DŮLEŽITÉ: přímý import modulu
-from pages.matches import router as match_router
-from pages.dashboard import router as dashboard_router  # ← DŮLEŽITÉ: přímý import modulu
-from pages.auth import router as auth_router
-from dependencies import auth_service, get_current_user, matches_service, players_service, trainings_service
-from services.items import ItemsService
-from services.auth import AuthService
-from services.matches import MatchesService
-from pages.players import router as players_router
-from services.players import PlayersService
-from pages.trainings import router as trainings_router
-from services.trainings import TrainingsService
-from pages.profile import router as profile_router
-from pages.users import router as users_router
-
-def create_app() -> FastAPI:
-    app = FastAPI(title="Futbalový Manažer", version="1.0.0")
+from database.migrations import migrate
+from database.pool import close_pool, get_pool
+import settings
+from services.session import session_store
+from services.startup import StartupProfile
+from services.templates import create_templates, precompile
+from middleware.auth import AuthMiddleware
+from pages import load_router, select_features
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    profile: StartupProfile = app.state.startup
+    if profile.ready_after is not None:
+        # Opätovné spustenie tej istej aplikácie (testy) - merať len tento štart
+        profile = app.state.startup = StartupProfile()
+    # Synchrónne handlery bežia v threadpoole anyio - jeho veľkosť nastavíme podľa konfigurácie
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    # Spojenia otvoríme pri štarte, aby ich neplatili prvé požiadavky
+    with profile.step("pool"):
+        pool = get_pool()
+        pool.warm()
+    # Schéma musí byť aktuálna skôr, než príde prvá požiadavka
+    with profile.step("migrácie"):
+        with pool.connection() as conn:
+            migrate(conn)
+    # Všetky šablóny skompilujeme hneď (z bytecode cache, ak už existuje)
+    with profile.step("šablóny"):
+        report = precompile(app.state.templates.env)
+    for name, error in report.errors:
+        print(f"Chyba v šablóne {name}: {error}")
+    profile.mark_ready()
+    print(profile.summary())
+    yield
+    # Počas vypínania už nové požiadavky neprijímame (readiness vráti 503)
+    profile.stopping = True
+    session_store.close()
+    close_pool()
+
+
+def create_app(profile: Optional[StartupProfile] = None) -> FastAPI:
+    profile = profile or StartupProfile()
+    app = FastAPI(title="Futbalový Manažer", version="1.0.0", lifespan=lifespan)
+    app.state.startup = profile
 
     app.mount("/static", StaticFiles(directory="static"), name="static")
-    app.state.templates = Jinja2Templates(directory="templates")
-
-    app.include_router(dashboard_router, prefix="", tags=["homepage"])
-    app.include_router(match_router, prefix="/matches", tags=["mathces"])
-    app.include_router(auth_router, prefix="", tags=["auth"])
-    app.include_router(players_router, prefix="/players", tags=["players"])
-    app.include_router(trainings_router, prefix="/trainings", tags=["trainings"])
-    app.include_router(profile_router, prefix="/profile", tags=["profile"])
-    app.include_router(users_router, prefix="/users", tags=["users"])
-    # DEBUG: vypiš zaregistrované cesty
-    print("=== ROUTES ===")
-    for r in app.routes:
-        try:
-            print(getattr(r, "methods", ""), getattr(r, "path", ""))
-        except Exception:
-            pass
-
-    # Pokud používáš override přes třídu, nech, jinak ho klidně vyhoď
-    app.dependency_overrides[MatchesService] = matches_service
-    app.dependency_overrides[AuthService] = auth_service
-    app.dependency_overrides[PlayersService] = players_service
-    app.dependency_overrides[TrainingsService] = trainings_service
+    app.state.templates = create_templates()
 
+    # Importujú sa len routery zapnutých častí (settings.ENABLED_FEATURES)
+    enabled = set(settings.ENABLED_FEATURES)
+    if not settings.METRICS_ENABLED:
+        enabled.discard("metrics")
+    features = select_features(enabled)
+    with profile.step("routery"):
+        for feature in features:
+            app.include_router(load_router(feature), prefix=feature.prefix, tags=list(feature.tags))
+    app.state.features = frozenset(f.name for f in features)
 
     app.add_middleware(SessionMiddleware, secret_key="dev-secret")
 
-    app.state.templates.env.globals.update(get_user=lambda request: getattr(request.state, "user", None))
+    app.state.templates.env.globals.update(
+        get_user=lambda request: getattr(request.state, "user", None),
+        # Odkazy na vypnuté časti šablóny nevykreslia (url_for by zlyhal)
+        feature_enabled=lambda name: name in app.state.features,
+    )
 
-    @app.middleware("http")
-    async def inject_user(request: Request, call_next):
-        request.state.user = get_current_user(request)
-        response = await call_next(request)
-        return response
+    # Pridané ako posledné = vonkajšie, používateľ je známy skôr než čokoľvek ďalšie
+    app.add_middleware(AuthMiddleware)
+    # Úplne vonku - meria aj čas a dotazy AuthMiddleware (načítanie session a profilu)
+    if settings.METRICS_ENABLED:
+        from middleware.metrics import MetricsMiddleware
+        app.add_middleware(MetricsMiddleware)
 
     return app
 
-app = create_app()
+
+_startup = StartupProfile(started=_import_started)
+_startup.record("import", time.perf_counter() - _import_started)
+app = create_app(_startup)
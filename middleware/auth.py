@@ -0,0 +1,29 @@
+from typing import Sequence
+import anyio
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+from services.profiles import resolve_user
+from services.session import SESSION_COOKIE_NAME
+
+
+class AuthMiddleware:
+    """
+    Čisté ASGI middleware (bez BaseHTTPMiddleware a jeho tasku/streamu navyše).
+    Raz za požiadavku nájde prihláseného používateľa a uloží ho do request.state.user,
+    odkiaľ ho berú závislosti (get_current_user) aj šablóny. Statické súbory preskočí.
+    """
+
+    def __init__(self, app: ASGIApp, skip_prefixes: Sequence[str] = ("/static",)) -> None:
+        self.app = app
+        self.skip_prefixes = tuple(skip_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        session_id = HTTPConnection(scope).cookies.get(SESSION_COOKIE_NAME)
+        # Bez cookie netreba ani vlákno; inak môže ísť o dotaz do DB - mimo event loopu
+        user = await anyio.to_thread.run_sync(resolve_user, session_id) if session_id else None
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
@@ -0,0 +1,50 @@
+import time
+from typing import Sequence
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from database.tracing import collect_queries
+from services.metrics import request_duration, request_queries, request_query_time, requests_in_progress
+
+# Label pre požiadavky, ktoré nezachytila žiadna route (404) - nie cesta, aby
+# náhodné URL nevytvárali nové časové rady
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Čisté ASGI middleware, ktoré každej požiadavke zmeria latenciu a počet/čas SQL príkazov.
+    Label `route` je meno route (napr. matches_ui), nie URL - počet radov je ohraničený.
+    Počítanie SQL beží cez contextvar (collect_queries), ktorý sa kopíruje aj do threadpoolu.
+    """
+
+    # /live sú dlhé SSE spojenia - ich "latencia" by histogram skreslila (počet je v live_subscribers)
+    def __init__(self, app: ASGIApp, skip_prefixes: Sequence[str] = ("/static", "/metrics", "/health", "/live")) -> None:
+        self.app = app
+        self.skip_prefixes = tuple(skip_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        requests_in_progress.inc()
+        start = time.perf_counter()
+        try:
+            with collect_queries() as queries:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            requests_in_progress.dec()
+            # Router zapíše zvolenú route do scope (FastAPI APIRoute)
+            route = scope.get("route")
+            name = getattr(route, "name", None) or UNMATCHED_ROUTE
+            request_duration.observe(elapsed, name, scope["method"], str(status_code))
+            request_queries.observe(queries.count, name)
+            request_query_time.observe(queries.duration, name)
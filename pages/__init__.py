@@ -0,0 +1,44 @@
+import importlib
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class Feature:
+    """Skupina stránok s vlastným routerom. Modul sa importuje, len ak je funkcia zapnutá."""
+    name: str
+    module: str
+    prefix: str
+    tags: Tuple[str, ...]
+    # Základ aplikácie (prihlásenie, dashboard, ...) sa vypnúť nedá
+    optional: bool = True
+
+
+FEATURES: Tuple[Feature, ...] = (
+    Feature("health", "pages.health", "/health", ("health",), optional=False),
+    Feature("dashboard", "pages.dashboard", "", ("homepage",), optional=False),
+    Feature("auth", "pages.auth", "", ("auth",), optional=False),
+    Feature("profile", "pages.profile", "/profile", ("profile",), optional=False),
+    Feature("matches", "pages.matches", "/matches", ("matches",)),
+    Feature("players", "pages.players", "/players", ("players",)),
+    Feature("trainings", "pages.trainings", "/trainings", ("trainings",)),
+    Feature("users", "pages.users", "/users", ("users",)),
+    Feature("analytics", "pages.analytics", "/analytics", ("analytics",)),
+    Feature("exports", "pages.exports", "/exports", ("exports",)),
+    Feature("calendar", "pages.calendar", "/calendar", ("calendar",)),
+    Feature("live", "pages.live", "/live", ("live",)),
+    Feature("metrics", "pages.metrics", "/metrics", ("metrics",)),
+)
+
+
+def select_features(enabled: Iterable[str]) -> List[Feature]:
+    """Povinné funkcie + zapnuté voliteľné, v poradí FEATURES. Neznáme meno je chyba konfigurácie."""
+    enabled = set(enabled)
+    unknown = enabled - {f.name for f in FEATURES}
+    if unknown:
+        raise ValueError(f"Neznáme funkcie v ENABLED_FEATURES: {', '.join(sorted(unknown))}")
+    return [f for f in FEATURES if not f.optional or f.name in enabled]
+
+
+def load_router(feature: Feature):
+    return importlib.import_module(feature.module).router
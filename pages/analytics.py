@@ -0,0 +1,46 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette import status
+from services.auth import User
+from services.cache import PageCache
+from repositories.pagination import current_season, recent_seasons
+from dependencies import analytics_service, require_admin_or_coach, page_cache
+
+router = APIRouter()
+
+@router.get("/", name="analytics_ui")
+def analytics_ui(
+    request: Request,
+    season: Optional[str] = None,
+    position: Optional[str] = None,
+    window: int = 5,
+    min_matches: int = 1,
+    svc = Depends(analytics_service),
+    user: User = Depends(require_admin_or_coach),
+    cache: PageCache = Depends(page_cache),
+):
+    # Bez parametra aktuálna sezóna, prázdna hodnota (voľba "Všetky") = všetky sezóny
+    selected = current_season() if season is None else (season or None)
+
+    def render():
+        try:
+            analytics = svc.get_season_analytics(selected, window)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        peak = max((count for _, _, count in analytics.histogram), default=0)
+        return request.app.state.templates.TemplateResponse(
+            "analytics.html",
+            {
+                "request": request,
+                "user": user,
+                "analytics": analytics,
+                "leaderboard": analytics.leaderboard(position, max(1, min_matches)),
+                "by_position": analytics.by_position(max(1, min_matches)),
+                "histogram_peak": peak,
+                "filters": {"season": selected, "position": position, "window": analytics.window, "min_matches": min_matches},
+                "seasons": recent_seasons(),
+            },
+        )
+
+    # Prepočet len po zápise hodnotení, zápasov alebo hráčov (a aj potom z cache analytiky)
+    return cache.respond(("evaluations", "matches", "users"), render)
@@ -0,0 +1,21 @@
+# Spoločné pre prepínače účasti v zápasoch aj tréningoch (nie je samostatná funkcia - nemá router)
+from typing import Any
+from fastapi import Request
+from fastapi.responses import JSONResponse, RedirectResponse, Response
+from starlette import status
+
+
+def toggle_response(request: Request, action: str, confirmed: bool, redirect_url: Any) -> Response:
+    """
+    Odpoveď na prepnutie účasti podľa toho, kto sa pýta: JSON pre skripty (Accept),
+    HTML útržok tlačidla pre stránku s live.js (X-Fragment: 1), inak presmerovanie
+    na zoznam ako doteraz (funguje aj bez JavaScriptu).
+    """
+    if "application/json" in request.headers.get("accept", ""):
+        return JSONResponse({"confirmed": confirmed})
+    if request.headers.get("x-fragment") == "1":
+        return request.app.state.templates.TemplateResponse(
+            "_attendance_toggle.html",
+            {"request": request, "action": action, "confirmed": confirmed},
+        )
+    return RedirectResponse(url=redirect_url, status_code=status.HTTP_303_SEE_OTHER)
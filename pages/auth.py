@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, Form, Request
+from fastapi import APIRouter, Form, Request
 from fastapi.responses import RedirectResponse
 from starlette import status
-from dependencies import auth_service
+from database.pool import get_pool
 from services.auth import AuthService
 from services.session import SESSION_COOKIE_NAME, session_store
 
@@ -9,7 +9,7 @@ router = APIRouter()
 
 
 @router.get("/login", name="login_ui")
-async def login_ui(request: Request):
+def login_ui(request: Request):
     return request.app.state.templates.TemplateResponse(
         "login.html",
         {"request": request, "error": None},
@@ -17,13 +17,17 @@ async def login_ui(request: Request):
 
 
 @router.post("/login", name="login_post")
-async def login_post(
+def login_post(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
-    svc: AuthService = Depends(auth_service),
 ):
-    user = svc.authenticate(username, password)
+    # Spojenie z poolu držíme len počas vyhľadania používateľa. Overenie hesla (bcrypt)
+    # trvá stovky ms a keby pri ňom čakalo aj spojenie, pár prihlásení naraz by
+    # vyčerpalo pool pre všetky ostatné požiadavky.
+    with get_pool().connection() as conn:
+        record = AuthService(conn).lookup(username)
+    user = AuthService.verify(record, password)
     if not user:
         return request.app.state.templates.TemplateResponse(
             "login.html",
@@ -44,7 +48,7 @@ async def login_post(
 
 
 @router.post("/logout", name="logout")
-async def logout(request: Request):
+def logout(request: Request):
     session_id = request.cookies.get(SESSION_COOKIE_NAME)
     session_store.delete_session(session_id)
     response = RedirectResponse(
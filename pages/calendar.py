@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import RedirectResponse
+from starlette import status
+from services.auth import User
+from services.calendar import NEW_TOKEN_KEY, CalendarService
+from dependencies import calendar_service, require_user
+
+router = APIRouter()
+
+# Bez prihlásenia - kalendárová aplikácia sa preukáže tokenom v adrese
+@router.get("/{token}.ics", name="calendar_feed")
+def calendar_feed(
+    request: Request,
+    token: str,
+    svc: CalendarService = Depends(calendar_service),
+):
+    feed = svc.get_feed(token)
+    if feed is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Kalendár neexistuje.")
+    return feed.response(request)
+
+@router.post("/token", name="calendar_token_post")
+def calendar_token_post(
+    request: Request,
+    svc: CalendarService = Depends(calendar_service),
+    user: User = Depends(require_user),
+):
+    request.session[NEW_TOKEN_KEY] = svc.create_token(user.id)
+    return RedirectResponse(url=request.url_for("profile_ui"), status_code=status.HTTP_303_SEE_OTHER)
+
+@router.post("/token/revoke", name="calendar_token_revoke_post")
+def calendar_token_revoke_post(
+    request: Request,
+    svc: CalendarService = Depends(calendar_service),
+    user: User = Depends(require_user),
+):
+    svc.revoke_token(user.id)
+    request.session.pop(NEW_TOKEN_KEY, None)
+    return RedirectResponse(url=request.url_for("profile_ui"), status_code=status.HTTP_303_SEE_OTHER)
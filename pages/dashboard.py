@@ -1,87 +1,35 @@
-from datetime import datetime
 from typing import Optional
-import sqlite3  # <--- 1. Import sqlite3
 
 from fastapi import APIRouter, Depends, Request
 from services.auth import User
-from services.matches import MatchesService
-from services.players import PlayersService
-from services.trainings import TrainingsService
-# 2. Pridané 'get_conn' do importov
-from dependencies import (get_current_user, matches_service, players_service, trainings_service, get_conn)
-# 3. Import funkcie na získanie dát
-from repositories.users import get_user_by_id
+from services.dashboard import DashboardService
+from dependencies import get_current_user, dashboard_service
 
 router = APIRouter()
 
 @router.get("/", name="dashboard_ui")
-async def dashboard_ui(
+def dashboard_ui(
     request: Request,
     user: Optional[User] = Depends(get_current_user),
-    matches_svc: MatchesService = Depends(matches_service),
-    players_svc: PlayersService = Depends(players_service),
-    trainings_svc: TrainingsService = Depends(trainings_service),
-    conn: sqlite3.Connection = Depends(get_conn)  # <--- 4. Pridané pripojenie k DB
+    dashboard_svc: DashboardService = Depends(dashboard_service),
 ):
-    # --- OPRAVA MENA: Načítame plné dáta z DB ---
-    template_user = user
-    if user:
-        full_user_data = get_user_by_id(conn, user.id)
-        if full_user_data:
-            template_user = full_user_data # Toto obsahuje first_name aj last_name
-    # --------------------------------------------
-
+    # `user` už obsahuje aj meno a pozíciu (profil z AuthMiddleware), netreba ho znovu načítať
     data = {}
 
+    # Každá rola potrebuje len pár agregačných dotazov (COUNT / LIMIT), nie celé tabuľky
     if user:
-        # ADMIN
         if user.role == 'admin':
-            all_matches = matches_svc.get_all_matches()
-            all_players = players_svc.get_all_players()
-            data = {
-                "matches_count": len(all_matches),
-                "players_count": len(all_players),
-                "trainings_count": len(trainings_svc.get_all_trainings()),
-                "recent_matches": all_matches[:3]
-            }
-
-        # TRÉNER
+            data = dashboard_svc.admin_overview()
         elif user.role == 'coach':
-            matches = matches_svc.get_all_matches()
-            trainings = trainings_svc.get_all_trainings()
-            now_str = datetime.now().strftime("%Y-%m-%dT%H:%M")
-
-            future_matches = [m for m in matches if m['date'] >= now_str]
-            future_matches.sort(key=lambda x: x['date'])
-
-            future_trainings = [t for t in trainings if t['date'] >= now_str]
-            future_trainings.sort(key=lambda x: x['date'])
-
-            data = {
-                "next_match": future_matches[0] if future_matches else None,
-                "next_training": future_trainings[0] if future_trainings else None,
-                "matches_count": len(matches),
-                "players_count": len(players_svc.get_all_players())
-            }
-
-        # HRÁČ
+            data = dashboard_svc.coach_overview()
         elif user.role == 'player':
-            events = players_svc.get_events_for_player(user.id)
-            now_str = datetime.now().strftime("%Y-%m-%dT%H:%M")
-
-            future_events = [e for e in events if e['date'] >= now_str]
-            future_events.sort(key=lambda x: x['date'])
-
-            data = {
-                "upcoming_events": future_events,
-                "total_events": len(events)
-            }
+            data = dashboard_svc.player_overview(user.id)
 
     return request.app.state.templates.TemplateResponse(
         "dashboard.html",
         {
             "request": request,
-            "user": template_user, # <--- 5. Posielame plné dáta (nie pôvodný 'user')
+            "user": user,
             "data": data
         }
     )
\ No newline at end of file
@@ -0,0 +1,59 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette import status
+from services.auth import User
+from services.exports import FORMATS, ExportRequest, ExportsService
+from repositories.exports import EXPORT_COLUMNS
+from repositories.pagination import recent_seasons
+from dependencies import exports_service, require_admin_or_coach
+
+router = APIRouter()
+
+TITLES = {"matches": "Zápasy", "trainings": "Tréningy", "attendance": "Dochádzka", "evaluations": "Hodnotenia"}
+
+@router.get("/", name="exports_ui")
+def exports_ui(
+    request: Request,
+    svc: ExportsService = Depends(exports_service),
+    user: User = Depends(require_admin_or_coach),
+):
+    return request.app.state.templates.TemplateResponse(
+        "exports.html",
+        {
+            "request": request,
+            "datasets": EXPORT_COLUMNS,
+            "titles": TITLES,
+            "formats": list(FORMATS),
+            "teams": svc.list_teams(),
+            "seasons": recent_seasons(),
+            "user": user,
+        },
+    )
+
+# Bez závislosti na get_conn - spojenie si berie až generátor (pozri ExportRequest.stream)
+@router.get("/{dataset}.{fmt}", name="export_data")
+def export_data(
+    dataset: str,
+    fmt: str,
+    season: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    team_id: Optional[str] = None,
+    user: User = Depends(require_admin_or_coach),
+):
+    try:
+        if team_id and not team_id.isdigit():
+            raise ValueError(f"Neplatný tím: {team_id}")
+        export = ExportRequest(
+            dataset, fmt, season or None, date_from or None, date_to or None,
+            int(team_id) if team_id else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return StreamingResponse(
+        export.stream(),
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'},
+    )
@@ -0,0 +1,24 @@
+import sqlite3
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from database.pool import PoolTimeout, get_pool
+
+router = APIRouter()
+
+@router.get("/live", name="health_live", include_in_schema=False)
+def health_live():
+    # Proces beží a event loop odpovedá - nič iné sa nekontroluje (ani DB)
+    return {"status": "ok"}
+
+@router.get("/ready", name="health_ready", include_in_schema=False)
+def health_ready(request: Request):
+    # Pripravená = štart dobehol (migrácie, šablóny) a databáza odpovedá
+    profile = request.app.state.startup
+    if not profile.ready:
+        return JSONResponse({"status": "stopping" if profile.stopping else "starting"}, status_code=503)
+    try:
+        with get_pool().connection() as conn:
+            conn.execute("SELECT 1").fetchone()
+    except (PoolTimeout, sqlite3.Error) as e:
+        return JSONResponse({"status": "unavailable", "error": str(e)}, status_code=503)
+    return {"status": "ok", "startup": profile.as_dict()}
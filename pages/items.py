@@ -10,7 +10,7 @@ router = APIRouter()
 
 
 @router.get("/", name="items_ui")
-async def items_ui(
+def items_ui(
     request: Request,
     svc: ItemsService = Depends(items_service),
     user: Optional[User] = Depends(get_current_user),
@@ -24,7 +24,7 @@ async def items_ui(
     )
 
 @router.get("/new", name="create_item_ui")
-async def create_item_ui(
+def create_item_ui(
     request: Request,
     user: User = Depends(require_admin),
 ):
@@ -39,7 +39,7 @@ async def create_item_ui(
     )
 
 @router.post("/new", name="create_item_post")
-async def create_item_post(
+def create_item_post(
     request: Request,
     name: str = Form(...),
     price: float = Form(...),
@@ -0,0 +1,47 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+from services.auth import User
+from services.events import Topic, event_exists, parse_last_event_id, stream_topic
+from dependencies import require_admin_or_coach
+
+router = APIRouter()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # nginx by inak odpoveď bufferoval a zmeny by chodili v dávkach
+    "X-Accel-Buffering": "no",
+}
+
+
+async def _live_response(request: Request, topic: Topic, since: Optional[int]) -> StreamingResponse:
+    if not await run_in_threadpool(event_exists, *topic):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Udalosť neexistuje.")
+    # Po výpadku pošle prehliadač číslo poslednej prijatej správy sám (EventSource)
+    last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+    return StreamingResponse(
+        stream_topic(topic, last_event_id if last_event_id is not None else since),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+# Zmeny dochádzky zápasu naživo (Server-Sent Events) - obsahujú účasť celej súpisky, preto len pre trénera
+@router.get("/matches/{match_id}", name="match_live_events")
+async def match_live_events(
+    request: Request,
+    match_id: int,
+    since: Optional[int] = None,
+    user: User = Depends(require_admin_or_coach),
+):
+    return await _live_response(request, ("match", match_id), since)
+
+@router.get("/trainings/{training_id}", name="training_live_events")
+async def training_live_events(
+    request: Request,
+    training_id: int,
+    since: Optional[int] = None,
+    user: User = Depends(require_admin_or_coach),
+):
+    return await _live_response(request, ("training", training_id), since)
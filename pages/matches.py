@@ -1,43 +1,54 @@
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, Form, Request
+from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from starlette import status
 from services.matches import MatchesService
 from services.auth import User
-from dependencies import matches_service, get_current_user, require_admin, require_admin_or_coach, require_user
+from services.cache import PageCache
+from services.events import event_bus
+from pages.attendance import toggle_response
+from repositories.pagination import recent_seasons
+from dependencies import matches_service, get_current_user, require_admin, require_admin_or_coach, require_user, page_cache
 
 router = APIRouter()
 
 @router.get("/", name="matches_ui")
-async def matches_ui(
+def matches_ui(
     request: Request,
+    cursor: Optional[str] = None,
+    season: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: Optional[int] = None,
     svc: MatchesService = Depends(matches_service),
     user: Optional[User] = Depends(get_current_user),
+    cache: PageCache = Depends(page_cache),
 ):
-    # Získame zápasy cez service
-    matches = svc.get_all_matches()
-
-    matches_with_attendance = []
-    if user and user.role == 'player':
-        for m in matches:
-            m_copy = dict(m)
-            # Zavoláme service metódu get_player_attendance
-            m_copy['attendance_confirmed'] = svc.get_player_attendance(user.id, m['id'])
-            matches_with_attendance.append(m_copy)
-    else:
-        matches_with_attendance = matches
+    def render():
+        # Hráč vidí aj svoju účasť - načítame ju jedným dotazom spolu so zápasmi
+        player_id = user.id if user and user.role == 'player' else None
+        try:
+            page = svc.get_matches_page(limit, cursor, season, date_from, date_to, user_id=player_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return request.app.state.templates.TemplateResponse(
-        "matches.html",
-        {
-            "request": request,
-            "matches": matches_with_attendance,
-            "user": user
-        },
-    )
+        return request.app.state.templates.TemplateResponse(
+            "matches.html",
+            {
+                "request": request,
+                "matches": page.items,
+                "page": page,
+                "filters": {"season": season, "date_from": date_from, "date_to": date_to},
+                "seasons": recent_seasons(),
+                "user": user
+            },
+        )
+
+    # Zoznam sa mení len pri zápise do zápasov alebo účasti - inak ide z cache (alebo 304)
+    return cache.respond(("matches", "attendance"), render)
 
 @router.post("/new", name="create_match_post")
-async def create_match_post(
+def create_match_post(
     request: Request,
     opponent: str = Form(...),
     location: str = Form(...),
@@ -54,10 +65,11 @@ async def create_match_post(
         errors.append("Dátum je povinný.")
 
     if errors:
-        matches_list = svc.get_all_matches()
+        page = svc.get_matches_page()
         return request.app.state.templates.TemplateResponse(
             "matches.html",
-            {"request": request, "matches": matches_list, "user": user, "error": errors[0]},
+            {"request": request, "matches": page.items, "page": page, "seasons": recent_seasons(),
+             "user": user, "error": errors[0]},
             status_code=status.HTTP_400_BAD_REQUEST
         )
 
@@ -68,7 +80,7 @@ async def create_match_post(
     return RedirectResponse(url=request.url_for("matches_ui"), status_code=status.HTTP_303_SEE_OTHER)
 
 @router.get("/edit/{match_id}", name="edit_match_ui")
-async def edit_match_ui(
+def edit_match_ui(
     request: Request,
     match_id: int,
     svc: MatchesService = Depends(matches_service),
@@ -83,7 +95,7 @@ async def edit_match_ui(
     )
 
 @router.post("/edit/{match_id}", name="edit_match_post")
-async def edit_match_post(
+def edit_match_post(
     request: Request,
     match_id: int,
     opponent: str = Form(...),
@@ -120,7 +132,7 @@ async def edit_match_post(
 
 
 @router.post("/delete/{match_id}", name="delete_match_post")
-async def delete_match_post(
+def delete_match_post(
     request: Request,
     match_id: int,
     svc: MatchesService = Depends(matches_service),
@@ -131,22 +143,24 @@ async def delete_match_post(
 
 # Endpoint pre tlačidlo "Potvrdiť účasť"
 @router.post("/attend/{match_id}", name="toggle_attendance_post")
-async def toggle_attendance_post(
+def toggle_attendance_post(
     request: Request,
     match_id: int,
     svc: MatchesService = Depends(matches_service),
     user: User = Depends(require_user), # Toto môže spustiť akýkoľvek prihlásený užívateľ (hráč)
 ):
-    # Zistíme aktuálny stav
-    current_status = svc.get_player_attendance(user.id, match_id)
-    # A prepneme ho na opačný (ak potvrdil -> zruší, ak nie -> potvrdí)
-    svc.confirm_attendance(user.id, match_id, not current_status)
+    # Prepneme stav na opačný (ak potvrdil -> zruší, ak nie -> potvrdí) priamo v DB,
+    # takže ani dvojklik nespôsobí preteky medzi čítaním a zápisom
+    confirmed = svc.toggle_attendance(user.id, match_id)
 
-    return RedirectResponse(url=request.url_for("matches_ui"), status_code=status.HTTP_303_SEE_OTHER)
+    # So skriptom stačí vrátiť nové tlačidlo - celý zoznam sa znova nenačítava
+    return toggle_response(
+        request, request.url_for("toggle_attendance_post", match_id=match_id).path, confirmed, request.url_for("matches_ui")
+    )
 
 # Endpoint pre správu zápasu (Detail pre Trénera)
 @router.get("/{match_id}/manage", name="manage_match_ui")
-async def manage_match_ui(
+def manage_match_ui(
     request: Request,
     match_id: int,
     svc: MatchesService = Depends(matches_service),
@@ -156,6 +170,8 @@ async def manage_match_ui(
     if not match:
         return RedirectResponse(url=request.url_for("matches_ui"))
 
+    # Číslo poslednej zmeny ešte pred načítaním súpisky - čo príde neskôr, doručí SSE
+    live_since = event_bus.last_id
     participants = svc.get_match_participants(match_id)
 
     return request.app.state.templates.TemplateResponse(
@@ -164,13 +180,14 @@ async def manage_match_ui(
             "request": request,
             "match": match,
             "participants": participants,
+            "live_since": live_since,
             "user": user
         }
     )
 
 # Endpoint pre hodnotenie hráča
 @router.post("/{match_id}/evaluate/{player_id}", name="evaluate_player_post")
-async def evaluate_player_post(
+def evaluate_player_post(
     request: Request,
     match_id: int,
     player_id: int,
@@ -195,7 +212,7 @@ async def evaluate_player_post(
 
 # Detail zápasu pre Hráča (Štatistiky)
 @router.get("/{match_id}/detail", name="match_detail_ui")
-async def match_detail_ui(
+def match_detail_ui(
     request: Request,
     match_id: int,
     svc: MatchesService = Depends(matches_service),
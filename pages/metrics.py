@@ -0,0 +1,27 @@
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response
+import settings
+from services.auth import User
+from services.metrics import CONTENT_TYPE, registry
+from dependencies import get_current_user
+
+router = APIRouter()
+
+@router.get("", name="metrics", include_in_schema=False)
+def metrics(
+    request: Request,
+    user: Optional[User] = Depends(get_current_user),
+):
+    if settings.METRICS_TOKEN:
+        # Scraper (Prometheus) sa preukáže tokenom
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not hmac.compare_digest(request.headers.get("authorization", ""), expected):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Neplatný token pre metriky.")
+    elif not user:
+        # Bez tokenu metriky nie sú verejné - vidí ich len prihlásený admin
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Metriky vyžadujú prihlásenie.")
+    elif user.role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Metriky sú dostupné len administrátorovi.")
+    return Response(registry.render(), media_type=CONTENT_TYPE)
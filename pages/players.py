@@ -1,28 +1,76 @@
-from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import RedirectResponse
+import csv
+import io
+from typing import List, Dict, Any, Optional, Tuple
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import JSONResponse, RedirectResponse
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 from services.players import PlayersService
 from services.auth import User
-from dependencies import get_conn, get_current_user, require_admin_or_coach, players_service
+from services.cache import PageCache
+from repositories.pagination import current_season, recent_seasons
+from dependencies import get_conn, get_current_user, require_admin_or_coach, players_service, page_cache
 
 router = APIRouter()
 
 
 @router.get("/", name="players_ui")
-async def players_ui(
+def players_ui(
     request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     svc: PlayersService = Depends(players_service),
     user: User = Depends(require_admin_or_coach),
+    cache: PageCache = Depends(page_cache),
 ):
-    players = svc.get_all_players()
-    return request.app.state.templates.TemplateResponse(
-        "players.html",
-        {"request": request, "players": players, "user": user},
-    )
+    def render():
+        try:
+            page = svc.get_players_page(limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return request.app.state.templates.TemplateResponse(
+            "players.html",
+            {"request": request, "players": page.items, "page": page, "user": user},
+        )
+
+    # Súpiska sa mení len pri zápise do tabuľky users
+    return cache.respond(("users",), render)
+
+@router.get("/matrix", name="attendance_matrix_ui")
+def attendance_matrix_ui(
+    request: Request,
+    season: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: Optional[int] = None,
+    svc: PlayersService = Depends(players_service),
+    user: User = Depends(require_admin_or_coach),
+    cache: PageCache = Depends(page_cache),
+):
+    # Bez parametra aktuálna sezóna, prázdna hodnota z formulára = všetky sezóny
+    if season is None and not (date_from or date_to):
+        season = current_season()
+
+    def render():
+        try:
+            matrix = svc.get_attendance_matrix(season or None, date_from, date_to, limit)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        return request.app.state.templates.TemplateResponse(
+            "attendance_matrix.html",
+            {
+                "request": request,
+                "matrix": matrix,
+                "filters": {"season": season, "date_from": date_from, "date_to": date_to},
+                "seasons": recent_seasons(),
+                "user": user,
+            },
+        )
+
+    return cache.respond(("users", "matches", "trainings", "attendance"), render)
 
 @router.get("/new", name="create_player_ui")
-async def create_player_ui(
+def create_player_ui(
     request: Request,
     user: User = Depends(require_admin_or_coach)
 ):
@@ -32,7 +80,7 @@ async def create_player_ui(
     )
 
 @router.post("/new", name="create_player_post")
-async def create_player_post(
+def create_player_post(
     request: Request,
     username: str = Form(...),
     first_name: str = Form(...),
@@ -66,8 +114,43 @@ async def create_player_post(
             {"request": request, "player": None, "user": user, "errors": {"global": str(e)}}
         )
 
+@router.get("/import", name="import_players_ui")
+def import_players_ui(
+    request: Request,
+    user: User = Depends(require_admin_or_coach)
+):
+    return request.app.state.templates.TemplateResponse(
+        "import_players.html",
+        {"request": request, "user": user, "result": None, "error": None}
+    )
+
+@router.post("/import", name="import_players_post")
+def import_players_post(
+    request: Request,
+    file: UploadFile = File(...),
+    svc: PlayersService = Depends(players_service),
+    user: User = Depends(require_admin_or_coach),
+):
+    # Súbor sa číta prúdovo (po riadkoch), celý sa do pamäte nenačíta
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        result = svc.import_players(lines)
+    except (ValueError, csv.Error) as e:
+        return request.app.state.templates.TemplateResponse(
+            "import_players.html",
+            {"request": request, "user": user, "result": None, "error": f"Súbor sa nedá spracovať: {e}"},
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+    finally:
+        lines.detach()
+
+    return request.app.state.templates.TemplateResponse(
+        "import_players.html",
+        {"request": request, "user": user, "result": result, "error": None}
+    )
+
 @router.get("/edit/{player_id}", name="edit_player_ui")
-async def edit_player_ui(
+def edit_player_ui(
     request: Request,
     player_id: int,
     svc: PlayersService = Depends(players_service),
@@ -83,7 +166,7 @@ async def edit_player_ui(
     )
 
 @router.post("/edit/{player_id}", name="edit_player_post")
-async def edit_player_post(
+def edit_player_post(
     request: Request,
     player_id: int,
     first_name: str = Form(...),
@@ -115,7 +198,7 @@ async def edit_player_post(
         )
 
 @router.post("/delete/{player_id}", name="delete_player_post")
-async def delete_player_post(
+def delete_player_post(
     request: Request,
     player_id: int,
     svc: PlayersService = Depends(players_service),
@@ -126,7 +209,7 @@ async def delete_player_post(
 
 # NOVÉ: Zoznam účastí pre konkrétneho hráča (Tréner)
 @router.get("/{player_id}/attendance", name="player_attendance_ui")
-async def player_attendance_ui(
+def player_attendance_ui(
     request: Request,
     player_id: int,
     svc: PlayersService = Depends(players_service),
@@ -150,23 +233,81 @@ async def player_attendance_ui(
 
 # NOVÉ: Potvrdenie prítomnosti (Tréner klikne)
 @router.post("/{player_id}/attendance/{event_type}/{event_id}", name="toggle_presence_post")
-async def toggle_presence_post(
+def toggle_presence_post(
     request: Request,
     player_id: int,
     event_type: str,
     event_id: int,
+    present: Optional[str] = Form(None),
     svc: PlayersService = Depends(players_service),
     user: User = Depends(require_admin_or_coach),
 ):
-    form = await request.form()
-
-    present_value = form.get("present")
     # Ak je value "1", nastavujeme True (prítomný), inak False
-    is_present = True if present_value == "1" else False
+    is_present = True if present == "1" else False
 
-    svc.confirm_presence(player_id, event_type, event_id, is_present)
+    try:
+        svc.confirm_presence(player_id, event_type, event_id, is_present)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    # Zaškrtnutie na stránke so skriptom - stačí potvrdenie, stránka sa nemení
+    if "application/json" in request.headers.get("accept", ""):
+        return JSONResponse({"present": is_present})
     return RedirectResponse(
         url=request.url_for("player_attendance_ui", player_id=player_id),
         status_code=status.HTTP_303_SEE_OTHER
-    )
\ No newline at end of file
+    )
+
+def _parse_cell(cell: str) -> Tuple[int, str, int]:
+    # Formát "hráč:typ:udalosť", napr. "7:training:12"
+    player_id, event_type, event_id = cell.split(":")
+    return int(player_id), event_type, int(event_id)
+
+def _json_bool(value: Any) -> bool:
+    # bool("false") je True - reťazce a čísla z JSONu neprijímame
+    if not isinstance(value, bool):
+        raise TypeError(f"present musí byť true/false, nie {value!r}")
+    return value
+
+# NOVÉ: Hromadné potvrdenie prítomnosti (viac hráčov aj udalostí v jednej požiadavke)
+@router.post("/presence/bulk", name="bulk_presence_post")
+async def bulk_presence_post(
+    request: Request,
+    svc: PlayersService = Depends(players_service),
+    user: User = Depends(require_admin_or_coach),
+):
+    is_json = request.headers.get("content-type", "").startswith("application/json")
+    next_url = None
+    try:
+        if is_json:
+            # {"entries": [{"player_id": 7, "event_type": "match", "event_id": 3, "present": true}, ...]}
+            payload = await request.json()
+            entries = [
+                (int(e["player_id"]), e["event_type"], int(e["event_id"]), _json_bool(e["present"]))
+                for e in payload["entries"]
+            ]
+        else:
+            # Formulár: každý riadok pošle skryté pole "cell", zaškrtnuté checkboxy pošlú "present"
+            # a pôvodne zaškrtnuté "was_present" - zapíšu sa len bunky, ktoré tréner zmenil
+            # (inak by uloženie prepísalo zmeny od iných urobené po načítaní stránky)
+            form = await request.form()
+            checked = set(form.getlist("present"))
+            was_present = set(form.getlist("was_present"))
+            entries = [
+                (*_parse_cell(cell), cell in checked)
+                for cell in form.getlist("cell")
+                if (cell in checked) != (cell in was_present)
+            ]
+            next_url = form.get("next")
+        # Handler je async kvôli čítaniu tela požiadavky - zápis do DB pustíme mimo event loopu
+        updated = await run_in_threadpool(svc.confirm_presence_bulk, entries)
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Neplatné údaje: {e}")
+
+    if is_json:
+        return JSONResponse({"updated": updated})
+
+    # Len relatívna adresa v rámci aplikácie (žiadny open redirect)
+    if not next_url or not next_url.startswith("/") or next_url.startswith("//"):
+        next_url = request.url_for("players_ui")
+    return RedirectResponse(url=next_url, status_code=status.HTTP_303_SEE_OTHER)
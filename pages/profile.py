@@ -2,43 +2,39 @@ import sqlite3
 from fastapi import APIRouter, Depends, Request
 from services.auth import User
 from services.stats import StatsService
-from services.players import PlayersService
-from repositories.users import get_user_by_id
-from dependencies import get_conn, require_user, stats_service, players_service
+from dependencies import get_conn, require_user, stats_service
 
 router = APIRouter()
 
 @router.get("/", name="profile_ui")
-async def profile_ui(
+def profile_ui(
     request: Request,
-    current_user: User = Depends(require_user), #
+    current_user: User = Depends(require_user), # Plný profil z AuthMiddleware
     stats_svc: StatsService = Depends(stats_service),
-    players_svc: PlayersService = Depends(players_service),
-    conn: sqlite3.Connection = Depends(get_conn) # Potrebujeme DB spojenie
+    conn: sqlite3.Connection = Depends(get_conn),
 ):
-    full_user_data = get_user_by_id(conn, current_user.id)
+    # Ak je to hráč, načítame aj štatistiky
+    stats = None
+    if current_user.role == 'player':
+        stats = stats_svc.get_my_stats(current_user.id)
 
-    if not full_user_data:
-        # Vytvoríme provizórny slovník z objektu User
-        full_user_data = {
-            "id": current_user.id,
-            "username": current_user.username,
-            "role": current_user.role,
-            "first_name": "",
-            "last_name": ""
+    # Kalendárový feed - adresa s tokenom je známa len hneď po vygenerovaní
+    calendar = None
+    if "calendar" in request.app.state.features:
+        # Import až tu - pri vypnutom kalendári sa modul nenačíta (profil je vždy zapnutý)
+        from services.calendar import NEW_TOKEN_KEY, CalendarService
+        new_token = request.session.pop(NEW_TOKEN_KEY, None)
+        calendar = {
+            "token": CalendarService(conn).get_token_info(current_user.id),
+            "url": str(request.url_for("calendar_feed", token=new_token)) if new_token else None,
         }
 
-    # 2. Ak je to hráč, načítame aj štatistiky
-    stats = None
-    if full_user_data['role'] == 'player':
-        stats = stats_svc.get_my_stats(full_user_data['id'])
-
-    # 3. Renderujeme šablónu a posielame 'user' ako plný slovník dát
     return request.app.state.templates.TemplateResponse(
         "profile.html",
         {
             "request": request,
-            "user": full_user_data, # <--- Tu posielame kompletné dáta
-            "stats": stats
+            "user": current_user,
+            "stats": stats,
+            "calendar": calendar,
         },
-    )
\ No newline at end of file
+    )
@@ -1,41 +1,56 @@
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, Form, Request
+from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from starlette import status
 from services.trainings import TrainingsService
 from services.auth import User
-from dependencies import get_conn, get_current_user, require_admin_or_coach, require_user, trainings_service
+from services.cache import PageCache
+from pages.attendance import toggle_response
+from repositories.pagination import recent_seasons
+from dependencies import get_conn, get_current_user, require_admin_or_coach, require_user, trainings_service, page_cache
 
 router = APIRouter()
 
 
 @router.get("/", name="trainings_ui")
-async def trainings_ui(
+def trainings_ui(
     request: Request,
+    cursor: Optional[str] = None,
+    season: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: Optional[int] = None,
     svc: TrainingsService = Depends(trainings_service),
     user: Optional[User] = Depends(get_current_user),
+    cache: PageCache = Depends(page_cache),
 ):
-    trainings = svc.get_all_trainings()
-
-    # Pridanie informácie o účasti pre hráčov
-    trainings_with_attendance = []
-    if user and user.role == 'player':
-        for t in trainings:
-            t_copy = dict(t)
-            t_copy['attendance_confirmed'] = svc.get_player_attendance(user.id, t['id'])
-            trainings_with_attendance.append(t_copy)
-    else:
-        trainings_with_attendance = trainings
+    def render():
+        # Pridanie informácie o účasti pre hráčov (jeden dotaz spolu s tréningami)
+        player_id = user.id if user and user.role == 'player' else None
+        try:
+            page = svc.get_trainings_page(limit, cursor, season, date_from, date_to, user_id=player_id)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return request.app.state.templates.TemplateResponse(
-        "trainings.html",
-        {"request": request, "trainings": trainings_with_attendance, "user": user},
-    )
+        return request.app.state.templates.TemplateResponse(
+            "trainings.html",
+            {
+                "request": request,
+                "trainings": page.items,
+                "page": page,
+                "filters": {"season": season, "date_from": date_from, "date_to": date_to},
+                "seasons": recent_seasons(),
+                "user": user,
+            },
+        )
+
+    #                VYTVORENIE
 
-#                VYTVORENIE
+    # Zoznam sa mení len pri zápise do tréningov alebo účasti - inak ide z cache (alebo 304)
+    return cache.respond(("trainings", "attendance"), render)
 
 @router.post("/new", name="create_training_post")
-async def create_training_post(
+def create_training_post(
     request: Request,
     location: str = Form(...),
     date: str = Form(...),
@@ -45,12 +60,14 @@ async def create_training_post(
 ):
 
     if not location.strip() or not date:
-        trainings_list = svc.get_all_trainings()
+        page = svc.get_trainings_page()
         return request.app.state.templates.TemplateResponse(
             "trainings.html",
             {
                 "request": request,
-                "trainings": trainings_list,
+                "trainings": page.items,
+                "page": page,
+                "seasons": recent_seasons(),
                 "user": user,
                 "error": "Dátum a miesto sú povinné údaje."
             },
@@ -63,7 +80,7 @@ async def create_training_post(
 #           ÚPRAVA
 
 @router.get("/edit/{training_id}", name="edit_training_ui")
-async def edit_training_ui(
+def edit_training_ui(
     request: Request,
     training_id: int,
     svc: TrainingsService = Depends(trainings_service),
@@ -79,7 +96,7 @@ async def edit_training_ui(
     )
 
 @router.post("/edit/{training_id}", name="edit_training_post")
-async def edit_training_post(
+def edit_training_post(
     request: Request,
     training_id: int,
     location: str = Form(...),
@@ -108,7 +125,7 @@ async def edit_training_post(
 #           ZMAZANIE
 
 @router.post("/delete/{training_id}", name="delete_training_post")
-async def delete_training_post(
+def delete_training_post(
     request: Request,
     training_id: int,
     svc: TrainingsService = Depends(trainings_service),
@@ -120,12 +137,14 @@ async def delete_training_post(
 #           ÚČASŤ
 
 @router.post("/attend/{training_id}", name="toggle_training_attendance_post")
-async def toggle_training_attendance_post(
+def toggle_training_attendance_post(
     request: Request,
     training_id: int,
     svc: TrainingsService = Depends(trainings_service),
     user: User = Depends(require_user),
 ):
-    current_status = svc.get_player_attendance(user.id, training_id)
-    svc.confirm_attendance(user.id, training_id, not current_status)
-    return RedirectResponse(url=request.url_for("trainings_ui"), status_code=status.HTTP_303_SEE_OTHER)
\ No newline at end of file
+    confirmed = svc.toggle_attendance(user.id, training_id)
+    return toggle_response(
+        request, request.url_for("toggle_training_attendance_post", training_id=training_id).path, confirmed,
+        request.url_for("trainings_ui"),
+    )
\ No newline at end of file
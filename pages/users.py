@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, Form, Request
+from typing import Optional
+from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from starlette import status
 from services.users import UsersService
@@ -11,19 +12,24 @@ def users_service(conn=Depends(get_conn)):
     return UsersService(conn)
 
 @router.get("/", name="users_ui")
-async def users_ui(
+def users_ui(
     request: Request,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     svc: UsersService = Depends(users_service),
     user: User = Depends(require_admin), # Len ADMIN
 ):
-    users_list = svc.get_all_users()
+    try:
+        page = svc.get_users_page(limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     return request.app.state.templates.TemplateResponse(
         "users.html",
-        {"request": request, "users": users_list, "user": user},
+        {"request": request, "users": page.items, "page": page, "user": user},
     )
 
 @router.get("/new", name="create_user_ui")
-async def create_user_ui(
+def create_user_ui(
     request: Request,
     user: User = Depends(require_admin)
 ):
@@ -33,7 +39,7 @@ async def create_user_ui(
     )
 
 @router.post("/new", name="create_user_post")
-async def create_user_post(
+def create_user_post(
     request: Request,
     username: str = Form(...),
     password: str = Form(...),
@@ -55,7 +61,7 @@ async def create_user_post(
         )
 
 @router.get("/edit/{user_id}", name="edit_user_ui")
-async def edit_user_ui(
+def edit_user_ui(
     request: Request,
     user_id: int,
     svc: UsersService = Depends(users_service),
@@ -71,7 +77,7 @@ async def edit_user_ui(
     )
 
 @router.post("/edit/{user_id}", name="edit_user_post")
-async def edit_user_post(
+def edit_user_post(
     request: Request,
     user_id: int,
     role: str = Form(...),
@@ -86,7 +92,7 @@ async def edit_user_post(
     return RedirectResponse(url=request.url_for("users_ui"), status_code=status.HTTP_303_SEE_OTHER)
 
 @router.post("/delete/{user_id}", name="delete_user_post")
-async def delete_user_post(
+def delete_user_post(
     request: Request,
     user_id: int,
     svc: UsersService = Depends(users_service),
@@ -0,0 +1,60 @@
+import itertools
+import sqlite3
+from typing import Any, Dict, List, Optional
+import numpy as np
+from repositories.pagination import window_conditions
+
+
+def _fetch_array(conn: sqlite3.Connection, sql: str, params: List[Any], width: int) -> np.ndarray:
+    # Riadky ako obyčajné n-tice (bez sqlite3.Row) rovno do jedného poľa - jedna alokácia
+    cur = conn.execute(sql, params)
+    cur.row_factory = None
+    rows = cur.fetchall()
+    data = np.fromiter(itertools.chain.from_iterable(rows), dtype=np.float64, count=len(rows) * width)
+    return data.reshape(len(rows), width)
+
+
+def load_evaluation_columns(
+    conn: sqlite3.Connection,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Všetky hodnotenia zápasov v intervale [date_from, date_before) jedným dotazom, po stĺpcoch
+    (player_id, match_id, rating). Bez dátumového filtra sa matches ani nepripája.
+    """
+    conditions, params = window_conditions("m.date", "m.id", date_from, date_before, None)
+    if conditions:
+        sql = f"""
+            SELECT e.player_id, e.match_id, e.rating
+            FROM matches m
+            JOIN evaluations e ON e.match_id = m.id
+            WHERE e.rating IS NOT NULL AND {" AND ".join(conditions)}
+        """
+    else:
+        sql = "SELECT player_id, match_id, rating FROM evaluations WHERE rating IS NOT NULL"
+    data = _fetch_array(conn, sql, params, 3)
+    return {
+        "player_id": data[:, 0].astype(np.int64),
+        "match_id": data[:, 1].astype(np.int64),
+        "rating": data[:, 2],
+    }
+
+
+def load_match_order(
+    conn: sqlite3.Connection,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+) -> np.ndarray:
+    """Id zápasov v chronologickom poradí - podľa neho sa radia hodnotenia (forma hráča)."""
+    conditions, params = window_conditions("date", "id", date_from, date_before, None)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    data = _fetch_array(conn, f"SELECT id FROM matches {where} ORDER BY date, id", params, 1)
+    return data[:, 0].astype(np.int64)
+
+
+def get_players_by_id(conn: sqlite3.Connection) -> Dict[int, Dict[str, Any]]:
+    rows = conn.execute(
+        "SELECT id, first_name, last_name, position FROM users WHERE role = 'player'"
+    ).fetchall()
+    return {r["id"]: dict(r) for r in rows}
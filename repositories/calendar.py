@@ -0,0 +1,27 @@
+import sqlite3
+from typing import Any, Dict, Optional
+
+# V DB je len SHA-256 z tokenu (ako pri sessions) - token pozná iba kalendár používateľa
+
+def set_calendar_token(conn: sqlite3.Connection, user_id: int, token_hash: str, created_at: float) -> None:
+    # Jeden token na používateľa - nový nahradí starý (ten tým prestane platiť)
+    conn.execute(
+        """
+        INSERT INTO calendar_tokens(user_id, token_hash, created_at) VALUES (?, ?, ?)
+        ON CONFLICT(user_id) DO UPDATE SET token_hash = excluded.token_hash, created_at = excluded.created_at
+        """,
+        (user_id, token_hash, created_at)
+    )
+    conn.commit()
+
+def delete_calendar_token(conn: sqlite3.Connection, user_id: int) -> None:
+    conn.execute("DELETE FROM calendar_tokens WHERE user_id = ?", (user_id,))
+    conn.commit()
+
+def get_calendar_token(conn: sqlite3.Connection, user_id: int) -> Optional[Dict[str, Any]]:
+    row = conn.execute("SELECT user_id, created_at FROM calendar_tokens WHERE user_id = ?", (user_id,)).fetchone()
+    return dict(row) if row else None
+
+def find_calendar_user(conn: sqlite3.Connection, token_hash: str) -> Optional[int]:
+    row = conn.execute("SELECT user_id FROM calendar_tokens WHERE token_hash = ?", (token_hash,)).fetchone()
+    return row[0] if row else None
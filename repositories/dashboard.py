@@ -0,0 +1,55 @@
+import sqlite3
+from typing import List, Dict, Any, Optional
+
+# Dotazy pre dashboard - všetko agreguje alebo obmedzuje priamo SQLite (COUNT, LIMIT,
+# podmienky na indexovaný dátum), takže cena nezávisí od dĺžky histórie.
+# `now` je reťazec v tvare 'YYYY-MM-DDTHH:MM', rovnako ako dátumy v DB.
+
+def get_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    row = conn.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM matches) AS matches_count,
+            (SELECT COUNT(*) FROM trainings) AS trainings_count,
+            (SELECT COUNT(*) FROM users WHERE role = 'player') AS players_count
+        """
+    ).fetchone()
+    return dict(row)
+
+def get_next_match(conn: sqlite3.Connection, now: str) -> Optional[Dict[str, Any]]:
+    row = conn.execute(
+        """
+        SELECT id, date, opponent, location, home_score, away_score
+        FROM matches
+        WHERE date >= ?
+        ORDER BY date, id
+        LIMIT 1
+        """,
+        (now,)
+    ).fetchone()
+    return dict(row) if row else None
+
+def get_next_training(conn: sqlite3.Connection, now: str) -> Optional[Dict[str, Any]]:
+    row = conn.execute(
+        """
+        SELECT id, date, location, description
+        FROM trainings
+        WHERE date >= ?
+        ORDER BY date, id
+        LIMIT 1
+        """,
+        (now,)
+    ).fetchone()
+    return dict(row) if row else None
+
+def get_recent_matches(conn: sqlite3.Connection, limit: int = 3) -> List[Dict[str, Any]]:
+    rows = conn.execute(
+        """
+        SELECT id, date, opponent, location, home_score, away_score
+        FROM matches
+        ORDER BY date DESC
+        LIMIT ?
+        """,
+        (limit,)
+    ).fetchall()
+    return [dict(r) for r in rows]
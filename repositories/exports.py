@@ -0,0 +1,103 @@
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from repositories.pagination import window_conditions
+
+# Stĺpce exportu v poradí, v akom ich vracia SQL - zároveň hlavička CSV a kľúče JSON
+EXPORT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "matches": ("id", "date", "opponent", "location", "home_score", "away_score", "team_id"),
+    "trainings": ("id", "date", "location", "description", "team_id"),
+    "attendance": ("event_type", "event_id", "date", "team_id", "user_id", "username",
+                   "first_name", "last_name", "confirmed", "present"),
+    "evaluations": ("match_id", "date", "opponent", "team_id", "player_id", "username",
+                    "first_name", "last_name", "rating", "comment", "coach_id"),
+}
+
+
+def _where(alias: str, date_from: Optional[str], date_before: Optional[str], team_id: Optional[int]) -> Tuple[str, List[Any]]:
+    conditions, params = window_conditions(f"{alias}.date", f"{alias}.id", date_from, date_before, None)
+    if team_id is not None:
+        conditions.append(f"{alias}.team_id = ?")
+        params.append(team_id)
+    return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+
+def _attendance_branch(alias: str, table: str, fk: str, event_type: str, where: str) -> str:
+    return f"""
+        SELECT '{event_type}', {alias}.id, {alias}.date, {alias}.team_id, u.id, u.username,
+               u.first_name, u.last_name, a.confirmed, a.present
+        FROM {table} {alias}
+        CROSS JOIN attendance a ON a.{fk} = {alias}.id
+        CROSS JOIN users u ON u.id = a.user_id
+        {where}"""
+
+
+def export_query(
+    dataset: str,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    team_id: Optional[int] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    SQL exportu v okne [date_from, date_before), voliteľne len pre jeden tím. Riadky idú
+    v poradí dátumu udalosti cez index na date - SQLite ich nemusí pred prvým riadkom triediť.
+    CROSS JOIN drží udalosti ako vonkajšiu tabuľku (plánovač by inak mohol začať
+    prechodom celej attendance a výsledok triediť).
+    """
+    if dataset == "matches":
+        where, params = _where("m", date_from, date_before, team_id)
+        sql = f"""
+            SELECT m.id, m.date, m.opponent, m.location, m.home_score, m.away_score, m.team_id
+            FROM matches m {where}
+            ORDER BY m.date, m.id"""
+    elif dataset == "trainings":
+        where, params = _where("t", date_from, date_before, team_id)
+        sql = f"""
+            SELECT t.id, t.date, t.location, t.description, t.team_id
+            FROM trainings t {where}
+            ORDER BY t.date, t.id"""
+    elif dataset == "attendance":
+        match_where, params = _where("m", date_from, date_before, team_id)
+        training_where, training_params = _where("t", date_from, date_before, team_id)
+        params += training_params
+        sql = (_attendance_branch("m", "matches", "match_id", "match", match_where)
+               + "\n UNION ALL " + _attendance_branch("t", "trainings", "training_id", "training", training_where)
+               + "\n ORDER BY 3, 2, 1, 5")
+    elif dataset == "evaluations":
+        where, params = _where("m", date_from, date_before, team_id)
+        sql = f"""
+            SELECT m.id, m.date, m.opponent, m.team_id, u.id, u.username, u.first_name, u.last_name,
+                   e.rating, e.comment, e.coach_id
+            FROM matches m
+            CROSS JOIN evaluations e ON e.match_id = m.id
+            CROSS JOIN users u ON u.id = e.player_id
+            {where}
+            ORDER BY m.date, m.id"""
+    else:
+        raise ValueError(f"Neznámy export: {dataset}")
+    return sql, params
+
+
+def iter_export(
+    conn: sqlite3.Connection,
+    dataset: str,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    team_id: Optional[int] = None,
+    batch_size: int = 500,
+) -> Iterator[List[Tuple[Any, ...]]]:
+    """Riadky exportu po dávkach (fetchmany) ako n-tice - v pamäti je vždy len jedna dávka."""
+    sql, params = export_query(dataset, date_from, date_before, team_id)
+    cursor = conn.execute(sql, params)
+    cursor.row_factory = None
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cursor.close()
+
+
+def list_teams(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    return [dict(r) for r in conn.execute("SELECT id, name FROM teams ORDER BY name").fetchall()]
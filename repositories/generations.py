@@ -0,0 +1,22 @@
+import sqlite3
+from typing import Dict, Sequence, Tuple
+
+# Počítadlá v cache_generations zvyšujú triggre pri každom zápise do rovnomennej
+# tabuľky (migrácia 6). Kto si niečo odvodené z tabuľky cachuje, porovná generáciu.
+
+def get_generations(conn: sqlite3.Connection, names: Sequence[str]) -> Dict[str, int]:
+    placeholders = ", ".join("?" * len(names))
+    rows = conn.execute(
+        f"SELECT name, value FROM cache_generations WHERE name IN ({placeholders})",
+        tuple(names)
+    ).fetchall()
+    return {r[0]: r[1] for r in rows}
+
+def get_generation_stamps(conn: sqlite3.Connection, names: Sequence[str]) -> Dict[str, Tuple[int, float]]:
+    """Ako get_generations, aj s časom poslednej zmeny (unix sekundy) - pre Last-Modified."""
+    placeholders = ", ".join("?" * len(names))
+    rows = conn.execute(
+        f"SELECT name, value, updated_at FROM cache_generations WHERE name IN ({placeholders})",
+        tuple(names)
+    ).fetchall()
+    return {r[0]: (r[1], r[2]) for r in rows}
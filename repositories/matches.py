@@ -1,5 +1,25 @@
 import sqlite3
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
+from repositories.pagination import DEFAULT_PAGE_SIZE, Page, build_page, clamp_limit, decode_cursor, window_conditions
+
+
+@dataclass(frozen=True, slots=True)
+class Evaluation:
+    rating: Optional[float]
+    comment: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class Participant:
+    """Hráč na súpiske zápasu - účasť a hodnotenie v jednom riadku."""
+    id: int
+    first_name: Optional[str]
+    last_name: Optional[str]
+    position: Optional[str]
+    confirmed: bool
+    present: bool
+    evaluation: Optional[Evaluation]
 
 # Získanie všetkých zápasov
 def list_matches(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
@@ -12,6 +32,35 @@ def list_matches(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     ).fetchall()
     return [dict(r) for r in rows]
 
+def list_matches_page(
+    conn: sqlite3.Connection,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    user_id: Optional[int] = None,
+) -> Page:
+    """
+    Jedna strana zápasov od najnovších (keyset podľa date, id) v okne [date_from, date_before).
+    S user_id obsahuje aj 'attendance_confirmed' daného hráča.
+    """
+    limit = clamp_limit(limit)
+    columns = "m.id, m.date, m.opponent, m.location, m.home_score, m.away_score"
+    join = ""
+    params: List[Any] = []
+    if user_id is not None:
+        columns += ", COALESCE(a.confirmed, 0) AS attendance_confirmed"
+        join = "LEFT JOIN attendance a ON a.match_id = m.id AND a.user_id = ?"
+        params.append(user_id)
+
+    conditions, window_params = window_conditions("m.date", "m.id", date_from, date_before, decode_cursor(cursor, 2))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    rows = conn.execute(
+        f"SELECT {columns} FROM matches m {join} {where} ORDER BY m.date DESC, m.id DESC LIMIT ?",
+        (*params, *window_params, limit + 1)
+    ).fetchall()
+    return build_page(rows, limit, key=lambda m: (m["date"], m["id"]))
+
 #  Vloženie nového zápasu
 def insert_match(
     conn: sqlite3.Connection,
@@ -93,21 +142,29 @@ def get_attendance(conn: sqlite3.Connection, user_id: int, match_id: int) -> Opt
 def set_attendance(conn: sqlite3.Connection, user_id: int, match_id: int, confirmed: bool) -> None:
     """
     Nastaví alebo aktualizuje stav účasti (potvrdenie).
-    Ak záznam neexistuje, vytvorí ho. Ak existuje, aktualizuje stĺpec 'confirmed'.
+    Jeden UPSERT nad unikátnym kľúčom (user_id, match_id) - žiadne SELECT + INSERT/UPDATE.
     """
-    existing = get_attendance(conn, user_id, match_id)
+    conn.execute(
+        """
+        INSERT INTO attendance(user_id, match_id, confirmed) VALUES (?, ?, ?)
+        ON CONFLICT(user_id, match_id) DO UPDATE SET confirmed = excluded.confirmed
+        """,
+        (user_id, match_id, confirmed)
+    )
+    conn.commit()
 
-    if existing:
-        conn.execute(
-            "UPDATE attendance SET confirmed = ? WHERE id = ?",
-            (confirmed, existing['id'])
-        )
-    else:
-        conn.execute(
-            "INSERT INTO attendance(user_id, match_id, confirmed) VALUES (?, ?, ?)",
-            (user_id, match_id, confirmed)
-        )
+def toggle_attendance(conn: sqlite3.Connection, user_id: int, match_id: int) -> bool:
+    """Prepne potvrdenie účasti priamo v databáze a vráti nový stav."""
+    rows = conn.execute(
+        """
+        INSERT INTO attendance(user_id, match_id, confirmed) VALUES (?, ?, 1)
+        ON CONFLICT(user_id, match_id) DO UPDATE SET confirmed = NOT COALESCE(attendance.confirmed, 0)
+        RETURNING confirmed
+        """,
+        (user_id, match_id)
+    ).fetchall()
     conn.commit()
+    return bool(rows[0]["confirmed"])
 
 def get_match_attendees(conn: sqlite3.Connection, match_id: int) -> List[Dict[str, Any]]:
     """Vráti zoznam hráčov, ktorí potvrdili účasť na zápase."""
@@ -123,6 +180,33 @@ def get_match_attendees(conn: sqlite3.Connection, match_id: int) -> List[Dict[st
     ).fetchall()
     return [dict(r) for r in rows]
 
+def get_match_participants(conn: sqlite3.Connection, match_id: int) -> List[Participant]:
+    """Všetci hráči s účasťou a hodnotením na danom zápase - jeden dotaz namiesto N+1."""
+    rows = conn.execute(
+        """
+        SELECT u.id, u.first_name, u.last_name, u.position, a.confirmed, a.present,
+               e.id AS evaluation_id, e.rating, e.comment
+        FROM users u
+        LEFT JOIN attendance a ON a.user_id = u.id AND a.match_id = ?
+        LEFT JOIN evaluations e ON e.player_id = u.id AND e.match_id = ?
+        WHERE u.role = 'player'
+        ORDER BY u.last_name
+        """,
+        (match_id, match_id)
+    ).fetchall()
+    return [
+        Participant(
+            id=r["id"],
+            first_name=r["first_name"],
+            last_name=r["last_name"],
+            position=r["position"],
+            confirmed=bool(r["confirmed"]),
+            present=bool(r["present"]),
+            evaluation=Evaluation(r["rating"], r["comment"]) if r["evaluation_id"] is not None else None,
+        )
+        for r in rows
+    ]
+
 #        HODNOTENIA
 
 def get_evaluation(conn: sqlite3.Connection, match_id: int, player_id: int) -> Optional[Dict[str, Any]]:
@@ -133,15 +217,12 @@ def get_evaluation(conn: sqlite3.Connection, match_id: int, player_id: int) -> O
     return dict(row) if row else None
 
 def set_evaluation(conn: sqlite3.Connection, match_id: int, player_id: int, coach_id: int, rating: float, comment: str) -> None:
-    existing = get_evaluation(conn, match_id, player_id)
-    if existing:
-        conn.execute(
-            "UPDATE evaluations SET rating = ?, comment = ?, coach_id = ? WHERE id = ?",
-            (rating, comment, coach_id, existing['id'])
-        )
-    else:
-        conn.execute(
-            "INSERT INTO evaluations(match_id, player_id, coach_id, rating, comment) VALUES (?, ?, ?, ?, ?)",
-            (match_id, player_id, coach_id, rating, comment)
-        )
-    conn.commit()
\ No newline at end of file
+    conn.execute(
+        """
+        INSERT INTO evaluations(match_id, player_id, coach_id, rating, comment) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(match_id, player_id) DO UPDATE
+        SET rating = excluded.rating, comment = excluded.comment, coach_id = excluded.coach_id
+        """,
+        (match_id, player_id, coach_id, rating, comment)
+    )
+    conn.commit()
@@ -0,0 +1,113 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass
+class Page:
+    """Jedna strana výsledkov. `next_cursor` je None, ak ďalšia strana neexistuje."""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    return max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """Kurzor = hodnoty radiaceho kľúča posledného riadku predošlej strany."""
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, binascii.Error):
+        raise ValueError("Neplatný kurzor stránkovania.")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Neplatný kurzor stránkovania.")
+    return values
+
+
+def build_page(rows: Sequence[Any], limit: int, key: Callable[[Dict[str, Any]], Sequence[Any]]) -> Page:
+    # Dotaz načíta limit + 1 riadkov - ten navyše len prezradí, že existuje ďalšia strana
+    items = [dict(r) for r in rows[:limit]]
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+#   SEZÓNY A DÁTUMY
+
+# Futbalová sezóna "2025/2026" trvá od 1. júla 2025 do 30. júna 2026
+SEASON_START_MONTH = 7
+
+
+def current_season(today: Optional[date] = None) -> str:
+    today = today or date.today()
+    start = today.year if today.month >= SEASON_START_MONTH else today.year - 1
+    return f"{start}/{start + 1}"
+
+
+def recent_seasons(count: int = 5, today: Optional[date] = None) -> List[str]:
+    start = int(current_season(today).split("/")[0])
+    return [f"{year}/{year + 1}" for year in range(start, start - count, -1)]
+
+
+def season_range(season: str) -> Tuple[str, str]:
+    """'2025/2026' -> ('2025-07-01', '2026-07-01'), horná hranica je exkluzívna."""
+    try:
+        start, end = (int(part) for part in season.split("/"))
+    except ValueError:
+        raise ValueError(f"Neplatná sezóna: {season}")
+    if end != start + 1:
+        raise ValueError(f"Neplatná sezóna: {season}")
+    return f"{start:04d}-{SEASON_START_MONTH:02d}-01", f"{end:04d}-{SEASON_START_MONTH:02d}-01"
+
+
+def date_window(
+    season: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Spojí filter sezóny a dátumov (YYYY-MM-DD, oba vrátane) do intervalu [od, pred).
+    Dátumy v DB sú reťazce 'YYYY-MM-DDTHH:MM', takže stačí porovnanie reťazcov.
+    """
+    lower, upper = season_range(season) if season else (None, None)
+    if date_from:
+        first_day = date.fromisoformat(date_from).isoformat()
+        lower = max(lower, first_day) if lower else first_day
+    if date_to:
+        day_after = (date.fromisoformat(date_to) + timedelta(days=1)).isoformat()
+        upper = min(upper, day_after) if upper else day_after
+    return lower, upper
+
+
+def window_conditions(
+    date_column: str,
+    id_column: str,
+    date_from: Optional[str],
+    date_before: Optional[str],
+    after: Optional[List[Any]],
+) -> Tuple[List[str], List[Any]]:
+    """WHERE podmienky pre udalosti radené od najnovších: dátumové okno + keyset (date, id)."""
+    conditions: List[str] = []
+    params: List[Any] = []
+    if date_from:
+        conditions.append(f"{date_column} >= ?")
+        params.append(date_from)
+    if date_before:
+        conditions.append(f"{date_column} < ?")
+        params.append(date_before)
+    if after:
+        conditions.append(f"({date_column}, {id_column}) < (?, ?)")
+        params.extend(after)
+    return conditions, params
@@ -1,5 +1,7 @@
 import sqlite3
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+from repositories.pagination import DEFAULT_PAGE_SIZE, Page, build_page, clamp_limit, decode_cursor, window_conditions
 
 def list_players(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     rows = conn.execute(
@@ -10,6 +12,21 @@ def list_players(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     ).fetchall()
     return [dict(r) for r in rows]
 
+def list_players_page(conn: sqlite3.Connection, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+    """Jedna strana hráčov podľa priezviska (keyset podľa last_name, first_name, id)."""
+    limit = clamp_limit(limit)
+    after = decode_cursor(cursor, 3)
+    condition = "AND (last_name, first_name, id) > (?, ?, ?)" if after else ""
+    rows = conn.execute(
+        f"""
+        SELECT * FROM users WHERE role = 'player' {condition}
+        ORDER BY last_name, first_name, id
+        LIMIT ?
+        """,
+        (*(after or ()), limit + 1)
+    ).fetchall()
+    return build_page(rows, limit, key=lambda p: (p["last_name"], p["first_name"], p["id"]))
+
 def get_player(conn: sqlite3.Connection, player_id: int) -> Optional[Dict[str, Any]]:
     row = conn.execute("SELECT * FROM users WHERE id = ? AND role = 'player'", (player_id,)).fetchone()
     return dict(row) if row else None
@@ -33,6 +50,26 @@ def insert_player(
     conn.commit()
     return cur.lastrowid
 
+def insert_players_bulk(conn: sqlite3.Connection, rows: Iterable[Tuple[str, str, str, str, Optional[str], Optional[str]]]) -> int:
+    """
+    Vloží viac hráčov v jednej transakcii.
+    rows: (username, password_hash, first_name, last_name, position, birth_date)
+    """
+    rows = list(rows)
+    try:
+        conn.executemany(
+            """
+            INSERT INTO users (username, password_hash, role, first_name, last_name, position, birth_date)
+            VALUES (?, ?, 'player', ?, ?, ?, ?)
+            """,
+            rows
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return len(rows)
+
 def update_player(
         conn: sqlite3.Connection,
         player_id: int,
@@ -56,63 +93,257 @@ def delete_player(conn: sqlite3.Connection, player_id: int) -> None:
     conn.commit()
 
 # Získanie všetkých udalostí (zápasy + tréningy) pre hráča
-def get_player_events(conn: sqlite3.Connection, player_id: int) -> List[Dict[str, Any]]:
-    #   Zápasy
-    matches = conn.execute(
-        """
-        SELECT 
-            'match' as type, 
-            m.id as event_id, 
-            m.date, 
-            'Zápas: ' || m.opponent as title, 
-            a.confirmed, 
-            a.present 
-        FROM matches m
-        LEFT JOIN attendance a ON m.id = a.match_id AND a.user_id = ?
-        ORDER BY m.date DESC
+def _player_events_query(
+    player_id: int,
+    when: Optional[str],
+    date_from: Optional[str],
+    date_before: Optional[str],
+    limit: Optional[int],
+    order: Optional[str],
+    now: Optional[str],
+) -> Tuple[str, List[Any]]:
+    """Zostaví jeden UNION ALL dotaz nad zápasmi a tréningmi hráča (filter aj poradie rieši SQLite)."""
+    if when not in (None, 'past', 'future'):
+        raise ValueError(f"Neznámy filter udalostí: {when}")
+    # Budúce udalosti chceme od najbližšej, minulé (a všetky) od najnovšej
+    order = (order or ('asc' if when == 'future' else 'desc')).upper()
+    if order not in ('ASC', 'DESC'):
+        raise ValueError(f"Neznáme poradie: {order}")
+    if when:
+        now = now or datetime.now().strftime("%Y-%m-%dT%H:%M")
+
+    def branch(alias: str, table: str, fk: str, event_type: str, title: str) -> Tuple[str, List[Any]]:
+        conditions, params = [], [player_id]
+        if when == 'future':
+            conditions.append(f"{alias}.date >= ?")
+            params.append(now)
+        elif when == 'past':
+            conditions.append(f"{alias}.date < ?")
+            params.append(now)
+        if date_from:
+            conditions.append(f"{alias}.date >= ?")
+            params.append(date_from)
+        if date_before:
+            conditions.append(f"{alias}.date < ?")
+            params.append(date_before)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        limit_sql = ""
+        if limit:
+            # Každá vetva vráti najviac `limit` riadkov - výsledok sa potom len zlúči
+            limit_sql = f"ORDER BY {alias}.date {order}, {alias}.id {order} LIMIT ?"
+            params.append(limit)
+        sql = f"""
+            SELECT * FROM (
+                SELECT '{event_type}' AS type, {alias}.id AS event_id, {alias}.date,
+                       {title} AS title, {alias}.location, a.confirmed, a.present
+                FROM {table} {alias}
+                LEFT JOIN attendance a ON a.{fk} = {alias}.id AND a.user_id = ?
+                {where}
+                {limit_sql}
+            )"""
+        return sql, params
+
+    matches_sql, matches_params = branch('m', 'matches', 'match_id', 'match', "'Zápas: ' || m.opponent")
+    trainings_sql, trainings_params = branch('t', 'trainings', 'training_id', 'training', "'Tréning: ' || t.location")
+    sql = f"{matches_sql}\n UNION ALL {trainings_sql}\n ORDER BY date {order}, event_id {order}"
+    params = matches_params + trainings_params
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, params
+
+def get_player_events(
+    conn: sqlite3.Connection,
+    player_id: int,
+    when: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    limit: Optional[int] = None,
+    order: Optional[str] = None,
+    now: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Zápasy a tréningy hráča s jeho účasťou, zoradené podľa dátumu.
+    when: None = všetky, 'past' = pred `now`, 'future' = od `now` (default teraz).
+    date_from / date_before ohraničujú interval [od, pred).
+    """
+    sql, params = _player_events_query(player_id, when, date_from, date_before, limit, order, now)
+    return [dict(r) for r in conn.execute(sql, params).fetchall()]
+
+def iter_player_events(
+    conn: sqlite3.Connection,
+    player_id: int,
+    when: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    order: Optional[str] = None,
+    now: Optional[str] = None,
+    batch_size: int = 200,
+) -> Iterator[Dict[str, Any]]:
+    """Ako get_player_events, ale udalosti číta po dávkach - celá história nie je naraz v pamäti."""
+    sql, params = _player_events_query(player_id, when, date_from, date_before, None, order, now)
+    cursor = conn.execute(sql, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    finally:
+        cursor.close()
+
+#  Nastavenie prítomnosti (present) - potvrdzuje tréner
+def set_player_presence(conn: sqlite3.Connection, user_id: int, event_type: str, event_id: int, present: bool) -> None:
+    # Ak záznam neexistuje (hráč ani neklikol účasť), vytvorí sa - všetko jedným UPSERTom
+    col_name = 'match_id' if event_type == 'match' else 'training_id'
+    conn.execute(
+        f"""
+        INSERT INTO attendance(user_id, {col_name}, present) VALUES (?, ?, ?)
+        ON CONFLICT(user_id, {col_name}) DO UPDATE SET present = excluded.present
         """,
-        (player_id,)
+        (user_id, event_id, present)
+    )
+    conn.commit()
+
+# Ktoré z daných id existujú - hráči (len rola player), zápasy a tréningy jedným dotazom
+def find_presence_targets(
+    conn: sqlite3.Connection,
+    player_ids: Iterable[int],
+    match_ids: Iterable[int],
+    training_ids: Iterable[int],
+) -> Dict[str, Set[int]]:
+    player_ids, match_ids, training_ids = list(player_ids), list(match_ids), list(training_ids)
+
+    def placeholders(ids: List[int]) -> str:
+        return ", ".join("?" * len(ids))
+
+    rows = conn.execute(
+        f"""
+        SELECT 'player', id FROM users WHERE role = 'player' AND id IN ({placeholders(player_ids)})
+        UNION ALL
+        SELECT 'match', id FROM matches WHERE id IN ({placeholders(match_ids)})
+        UNION ALL
+        SELECT 'training', id FROM trainings WHERE id IN ({placeholders(training_ids)})
+        """,
+        (*player_ids, *match_ids, *training_ids)
     ).fetchall()
+    found: Dict[str, Set[int]] = {'player': set(), 'match': set(), 'training': set()}
+    for kind, id_ in rows:
+        found[kind].add(id_)
+    return found
 
-    # Tréningy
-    trainings = conn.execute(
-        """
-        SELECT 
-            'training' as type, 
-            t.id as event_id, 
-            t.date, 
-            'Tréning: ' || t.location as title, 
-            a.confirmed, 
-            a.present 
-        FROM trainings t
-        LEFT JOIN attendance a ON t.id = a.training_id AND a.user_id = ?
-        ORDER BY t.date DESC
+# Aktuálna prítomnosť pre dvojice (hráč, udalosť) - chýbajúci záznam = neprítomný
+def get_presence(
+    conn: sqlite3.Connection,
+    entries: Iterable[Tuple[int, str, int]],
+) -> Dict[Tuple[int, str, int], bool]:
+    entries = list(entries)
+    if not entries:
+        return {}
+    user_ids = list({user_id for user_id, _, _ in entries})
+    match_ids = list({event_id for _, event_type, event_id in entries if event_type == 'match'})
+    training_ids = list({event_id for _, event_type, event_id in entries if event_type == 'training'})
+
+    def placeholders(ids: List[int]) -> str:
+        return ", ".join("?" * len(ids))
+
+    rows = conn.execute(
+        f"""
+        SELECT user_id, 'match', match_id, present FROM attendance
+        WHERE user_id IN ({placeholders(user_ids)}) AND match_id IN ({placeholders(match_ids)})
+        UNION ALL
+        SELECT user_id, 'training', training_id, present FROM attendance
+        WHERE user_id IN ({placeholders(user_ids)}) AND training_id IN ({placeholders(training_ids)})
         """,
-        (player_id,)
+        (*user_ids, *match_ids, *user_ids, *training_ids)
     ).fetchall()
+    wanted = set(entries)
+    current = {entry: False for entry in wanted}
+    for user_id, event_type, event_id, present in rows:
+        if (user_id, event_type, event_id) in wanted:
+            current[(user_id, event_type, event_id)] = bool(present)
+    return current
 
-    # Spojíme a zoradíme podľa dátumu
-    all_events = [dict(r) for r in matches] + [dict(r) for r in trainings]
-    all_events.sort(key=lambda x: x['date'], reverse=True)
+# Hromadné nastavenie prítomnosti - (user_id, event_type, event_id, present) pre každý záznam
+def set_presence_bulk(conn: sqlite3.Connection, entries: Iterable[Tuple[int, str, int, bool]]) -> int:
+    by_column: Dict[str, List[Tuple[int, int, bool]]] = {'match_id': [], 'training_id': []}
+    for user_id, event_type, event_id, present in entries:
+        col_name = 'match_id' if event_type == 'match' else 'training_id'
+        by_column[col_name].append((user_id, event_id, present))
 
-    return all_events
+    # Všetko v jednej transakcii = jeden commit (fsync) namiesto jedného na každý záznam
+    try:
+        for col_name, rows in by_column.items():
+            if rows:
+                conn.executemany(
+                    f"""
+                    INSERT INTO attendance(user_id, {col_name}, present) VALUES (?, ?, ?)
+                    ON CONFLICT(user_id, {col_name}) DO UPDATE SET present = excluded.present
+                    """,
+                    rows
+                )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return sum(len(rows) for rows in by_column.values())
 
-#  Nastavenie prítomnosti (present) - potvrdzuje tréner
-def set_player_presence(conn: sqlite3.Connection, user_id: int, event_type: str, event_id: int, present: bool) -> None:
-    # Zistíme, či záznam v attendance existuje
-    if event_type == 'match':
-        row = conn.execute("SELECT id FROM attendance WHERE user_id = ? AND match_id = ?", (user_id, event_id)).fetchone()
-        col_name = 'match_id'
-    else:
-        row = conn.execute("SELECT id FROM attendance WHERE user_id = ? AND training_id = ?", (user_id, event_id)).fetchone()
-        col_name = 'training_id'
-
-    if row:
-        conn.execute("UPDATE attendance SET present = ? WHERE id = ?", (present, row['id']))
-    else:
-        # Ak záznam neexistuje (hráč ani neklikol účasť), vytvoríme ho
-        conn.execute(
-            f"INSERT INTO attendance(user_id, {col_name}, present) VALUES (?, ?, ?)",
-            (user_id, event_id, present)
-        )
-    conn.commit()
\ No newline at end of file
+# Udalosti (zápasy + tréningy) v okne [date_from, date_before), najnovšie prvé - stĺpce dochádzkovej matice
+def list_events_window(
+    conn: sqlite3.Connection,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    def branch(table: str, event_type: str, title: str) -> Tuple[str, List[Any]]:
+        conditions, params = window_conditions("date", "id", date_from, date_before, None)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        limit_sql = ""
+        if limit:
+            limit_sql = "ORDER BY date DESC, id DESC LIMIT ?"
+            params.append(limit)
+        sql = f"""
+            SELECT * FROM (
+                SELECT '{event_type}' AS type, id AS event_id, date, {title} AS title
+                FROM {table} {where} {limit_sql}
+            )"""
+        return sql, params
+
+    matches_sql, matches_params = branch("matches", "match", "'Zápas: ' || opponent")
+    trainings_sql, trainings_params = branch("trainings", "training", "'Tréning: ' || location")
+    sql = f"{matches_sql}\n UNION ALL {trainings_sql}\n ORDER BY date DESC, event_id DESC"
+    params = matches_params + trainings_params
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return [dict(r) for r in conn.execute(sql, params).fetchall()]
+
+def get_squad_attendance(
+    conn: sqlite3.Connection,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    """
+    Dochádzka celej súpisky v okne jedným zoskupeným dotazom - riadok na hráča, nie na
+    (hráč, udalosť). Udalosti sú v reťazcoch ako kľúče oddelené čiarkou: id zápasu kladné,
+    id tréningu záporné. Vracia (user_id, potvrdené, prítomný).
+    """
+    match_conditions, match_params = window_conditions("date", "id", date_from, date_before, None)
+    training_conditions, training_params = window_conditions("date", "id", date_from, date_before, None)
+    match_where = f"WHERE {' AND '.join(match_conditions)}" if match_conditions else ""
+    training_where = f"WHERE {' AND '.join(training_conditions)}" if training_conditions else ""
+    cursor = conn.execute(
+        f"""
+        SELECT a.user_id,
+               group_concat(CASE WHEN a.confirmed THEN coalesce(a.match_id, -a.training_id) END),
+               group_concat(CASE WHEN a.present THEN coalesce(a.match_id, -a.training_id) END)
+        FROM attendance a
+        WHERE a.match_id IN (SELECT id FROM matches {match_where})
+           OR a.training_id IN (SELECT id FROM trainings {training_where})
+        GROUP BY a.user_id
+        """,
+        match_params + training_params
+    )
+    cursor.row_factory = None
+    return cursor.fetchall()
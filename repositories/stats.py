@@ -1,25 +1,29 @@
 import sqlite3
 from typing import Dict, Any
 
-def get_player_stats(conn: sqlite3.Connection, player_id: int) -> Dict[str, Any]:
-    # Počet odohraných zápasov (kde potvrdil účasť)
-    matches_count = conn.execute(
-        "SELECT COUNT(*) FROM attendance WHERE user_id = ? AND match_id IS NOT NULL AND confirmed = 1",
-        (player_id,)
-    ).fetchone()[0]
-
-    # Počet tréningov (kde potvrdil účasť)
-    trainings_count = conn.execute(
-        "SELECT COUNT(*) FROM attendance WHERE user_id = ? AND training_id IS NOT NULL AND confirmed = 1",
+def get_attendance_counters(conn: sqlite3.Connection, player_id: int) -> Dict[str, int]:
+    # Počítadlá potvrdených účastí udržiavajú triggre nad attendance (migrácia 5)
+    row = conn.execute(
+        "SELECT matches_confirmed, trainings_confirmed FROM player_stats WHERE user_id = ?",
         (player_id,)
-    ).fetchone()[0]
-
-    # Celkový počet naplánovaných zápasov
-    total_matches = conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+    ).fetchone()
+    return {
+        "matches_attended": row[0] if row else 0,
+        "trainings_attended": row[1] if row else 0,
+    }
 
-    #  Celkový počet naplánovaných tréningov
-    total_trainings = conn.execute("SELECT COUNT(*) FROM trainings").fetchone()[0]
+def get_event_totals(conn: sqlite3.Connection) -> Dict[str, int]:
+    # Celkový počet naplánovaných zápasov a tréningov - rovnaký pre všetkých hráčov
+    row = conn.execute(
+        "SELECT (SELECT COUNT(*) FROM matches), (SELECT COUNT(*) FROM trainings)"
+    ).fetchone()
+    return {"total_matches": row[0], "total_trainings": row[1]}
 
+def build_player_stats(counters: Dict[str, int], totals: Dict[str, int]) -> Dict[str, Any]:
+    matches_count = counters["matches_attended"]
+    trainings_count = counters["trainings_attended"]
+    total_matches = totals["total_matches"]
+    total_trainings = totals["total_trainings"]
     return {
         "matches_attended": matches_count,
         "trainings_attended": trainings_count,
@@ -27,4 +31,7 @@ def get_player_stats(conn: sqlite3.Connection, player_id: int) -> Dict[str, Any]
         "total_trainings": total_trainings,
         "matches_percentage": round((matches_count / total_matches * 100) if total_matches > 0 else 0),
         "trainings_percentage": round((trainings_count / total_trainings * 100) if total_trainings > 0 else 0)
-    }
\ No newline at end of file
+    }
+
+def get_player_stats(conn: sqlite3.Connection, player_id: int) -> Dict[str, Any]:
+    return build_player_stats(get_attendance_counters(conn, player_id), get_event_totals(conn))
@@ -1,5 +1,6 @@
 import sqlite3
 from typing import List, Dict, Any, Optional
+from repositories.pagination import DEFAULT_PAGE_SIZE, Page, build_page, clamp_limit, decode_cursor, window_conditions
 
 def list_trainings(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
 
@@ -12,6 +13,32 @@ def list_trainings(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     ).fetchall()
     return [dict(r) for r in rows]
 
+def list_trainings_page(
+    conn: sqlite3.Connection,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_before: Optional[str] = None,
+    user_id: Optional[int] = None,
+) -> Page:
+    """Jedna strana tréningov od najnovších (keyset podľa date, id), voliteľne s účasťou hráča."""
+    limit = clamp_limit(limit)
+    columns = "t.id, t.date, t.location, t.description"
+    join = ""
+    params: List[Any] = []
+    if user_id is not None:
+        columns += ", COALESCE(a.confirmed, 0) AS attendance_confirmed"
+        join = "LEFT JOIN attendance a ON a.training_id = t.id AND a.user_id = ?"
+        params.append(user_id)
+
+    conditions, window_params = window_conditions("t.date", "t.id", date_from, date_before, decode_cursor(cursor, 2))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    rows = conn.execute(
+        f"SELECT {columns} FROM trainings t {join} {where} ORDER BY t.date DESC, t.id DESC LIMIT ?",
+        (*params, *window_params, limit + 1)
+    ).fetchall()
+    return build_page(rows, limit, key=lambda t: (t["date"], t["id"]))
+
 def get_training(conn: sqlite3.Connection, training_id: int) -> Optional[Dict[str, Any]]:
     row = conn.execute(
         "SELECT * FROM trainings WHERE id = ?",
@@ -62,16 +89,24 @@ def get_training_attendance(conn: sqlite3.Connection, user_id: int, training_id:
     return dict(row) if row else None
 
 def set_training_attendance(conn: sqlite3.Connection, user_id: int, training_id: int, confirmed: bool) -> None:
-    existing = get_training_attendance(conn, user_id, training_id)
+    conn.execute(
+        """
+        INSERT INTO attendance(user_id, training_id, confirmed) VALUES (?, ?, ?)
+        ON CONFLICT(user_id, training_id) DO UPDATE SET confirmed = excluded.confirmed
+        """,
+        (user_id, training_id, confirmed)
+    )
+    conn.commit()
 
-    if existing:
-        conn.execute(
-            "UPDATE attendance SET confirmed = ? WHERE id = ?",
-            (confirmed, existing['id'])
-        )
-    else:
-        conn.execute(
-            "INSERT INTO attendance(user_id, training_id, confirmed) VALUES (?, ?, ?)",
-            (user_id, training_id, confirmed)
-        )
-    conn.commit()
\ No newline at end of file
+def toggle_training_attendance(conn: sqlite3.Connection, user_id: int, training_id: int) -> bool:
+    """Prepne potvrdenie účasti na tréningu priamo v databáze a vráti nový stav."""
+    rows = conn.execute(
+        """
+        INSERT INTO attendance(user_id, training_id, confirmed) VALUES (?, ?, 1)
+        ON CONFLICT(user_id, training_id) DO UPDATE SET confirmed = NOT COALESCE(attendance.confirmed, 0)
+        RETURNING confirmed
+        """,
+        (user_id, training_id)
+    ).fetchall()
+    conn.commit()
+    return bool(rows[0]["confirmed"])
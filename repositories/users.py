@@ -1,5 +1,6 @@
 import sqlite3
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+from repositories.pagination import DEFAULT_PAGE_SIZE, Page, build_page, clamp_limit, decode_cursor
 
 def get_user_by_username(conn: sqlite3.Connection, username: str) -> Optional[Dict[str, Any]]:
     row = conn.execute(
@@ -21,6 +22,28 @@ def get_all_users(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
     ).fetchall()
     return [dict(r) for r in rows]
 
+def list_users_page(conn: sqlite3.Connection, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page:
+    """Jedna strana používateľov v poradí rola, priezvisko, meno (keyset aj podľa id)."""
+    limit = clamp_limit(limit)
+    after = decode_cursor(cursor, 4)
+    condition = "WHERE (role, last_name, first_name, id) > (?, ?, ?, ?)" if after else ""
+    rows = conn.execute(
+        f"SELECT * FROM users {condition} ORDER BY role, last_name, first_name, id LIMIT ?",
+        (*(after or ()), limit + 1)
+    ).fetchall()
+    return build_page(rows, limit, key=lambda u: (u["role"], u["last_name"], u["first_name"], u["id"]))
+
+def find_existing_usernames(conn: sqlite3.Connection, usernames: List[str]) -> Set[str]:
+    """Ktoré z daných mien sú už obsadené (jeden dotaz na celú dávku)."""
+    if not usernames:
+        return set()
+    placeholders = ", ".join("?" * len(usernames))
+    rows = conn.execute(
+        f"SELECT username FROM users WHERE username IN ({placeholders})",
+        usernames
+    ).fetchall()
+    return {r[0] for r in rows}
+
 def insert_user(
     conn: sqlite3.Connection,
     username: str,
@@ -36,7 +59,8 @@ def insert_user(
         INSERT INTO users(username, password_hash, role, first_name, last_name, position, birth_date) 
         VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
-        (username, password_hash, role, first_name, last_name, position, birth_date),
+        # Mená ukladáme ako '' namiesto NULL - stránkovanie podľa mena NULL nevie porovnať
+        (username, password_hash, role, first_name or "", last_name or "", position, birth_date),
     )
     conn.commit()
     return cur.lastrowid
@@ -56,7 +80,7 @@ def update_user(
         SET role = ?, first_name = ?, last_name = ?, position = ?, birth_date = ?
         WHERE id = ?
         """,
-        (role, first_name, last_name, position, birth_date, user_id)
+        (role, first_name or "", last_name or "", position, birth_date, user_id)
     )
     conn.commit()
 
@@ -0,0 +1,203 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+import settings
+from repositories.analytics import get_players_by_id as repo_get_players_by_id
+from repositories.analytics import load_evaluation_columns as repo_load_evaluation_columns
+from repositories.analytics import load_match_order as repo_load_match_order
+from repositories.generations import get_generations as repo_get_generations
+from repositories.pagination import season_range
+
+DEFAULT_FORM_WINDOW = 5
+MAX_FORM_WINDOW = 20
+# Koľko posledných hodnôt kĺzavého priemeru zobraziť ako trend formy
+FORM_HISTORY = 10
+# Rozdelenie hodnotení 0-10 po jednom bode
+HISTOGRAM_BINS = 10
+# Výsledok závisí od týchto tabuliek - zápis do nich zmení generáciu a cache sa prepočíta
+NAMESPACES = ("evaluations", "matches", "users")
+
+
+@dataclass
+class PlayerRating:
+    player_id: int
+    first_name: str
+    last_name: str
+    position: Optional[str]
+    matches: int
+    average: float
+    std: float
+    best: float
+    worst: float
+    # Priemer posledných `window` hodnotení a jeho rozdiel oproti priemeru sezóny
+    form: float
+    trend: float
+    form_history: List[float] = field(default_factory=list)
+
+
+@dataclass
+class SeasonAnalytics:
+    season: Optional[str]
+    window: int
+    evaluations: int
+    average: Optional[float]
+    # Zoradené od najlepšieho priemeru
+    players: List[PlayerRating]
+    # (od, do, počet hodnotení)
+    histogram: List[Tuple[float, float, int]]
+
+    def leaderboard(self, position: Optional[str] = None, min_matches: int = 1) -> List[PlayerRating]:
+        return [
+            p for p in self.players
+            if p.matches >= min_matches and (not position or p.position == position)
+        ]
+
+    def by_position(self, min_matches: int = 1, top: int = 3) -> Dict[str, List[PlayerRating]]:
+        ranking: Dict[str, List[PlayerRating]] = {}
+        for p in self.leaderboard(min_matches=min_matches):
+            group = ranking.setdefault(p.position or "Bez pozície", [])
+            if len(group) < top:
+                group.append(p)
+        return ranking
+
+    @property
+    def positions(self) -> List[str]:
+        return sorted({p.position for p in self.players if p.position})
+
+
+def compute_season_analytics(
+    columns: Dict[str, np.ndarray],
+    match_order: np.ndarray,
+    players: Dict[int, Dict[str, Any]],
+    season: Optional[str] = None,
+    window: int = DEFAULT_FORM_WINDOW,
+) -> SeasonAnalytics:
+    """
+    Agregáty nad všetkými hodnoteniami naraz. Hodnotenia sa zoradia podľa (hráč, dátum)
+    a každý hráč je potom súvislý úsek poľa - súčty, priemery aj kĺzavý priemer sa
+    počítajú cez kumulatívne súčty, bez cyklu cez riadky. V Pythone sa iteruje len
+    cez hráčov (stovky), nie cez hodnotenia (stovky tisíc).
+    """
+    ratings = columns["rating"]
+    histogram_counts, edges = np.histogram(ratings, bins=HISTOGRAM_BINS, range=(0.0, 10.0))
+    histogram = [(float(edges[i]), float(edges[i + 1]), int(c)) for i, c in enumerate(histogram_counts)]
+    if ratings.size == 0:
+        return SeasonAnalytics(season, window, 0, None, [], histogram)
+
+    # Poradie zápasu v čase (match_order = id zoradené podľa dátumu) namiesto dátumu v každom riadku
+    sequence = np.zeros(int(max(match_order.max(initial=0), columns["match_id"].max())) + 1, dtype=np.int64)
+    sequence[match_order] = np.arange(match_order.size)
+    order = np.lexsort((sequence[columns["match_id"]], columns["player_id"]))
+    player_ids = columns["player_id"][order]
+    ratings = ratings[order]
+
+    ids, starts, counts = np.unique(player_ids, return_index=True, return_counts=True)
+    ends = starts + counts
+    csum = np.concatenate(([0.0], np.cumsum(ratings)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(ratings * ratings)))
+
+    means = (csum[ends] - csum[starts]) / counts
+    variance = (csum_sq[ends] - csum_sq[starts]) / counts - means * means
+    stds = np.sqrt(np.maximum(variance, 0.0))
+    best = np.maximum.reduceat(ratings, starts)
+    worst = np.minimum.reduceat(ratings, starts)
+
+    form_starts = np.maximum(starts, ends - window)
+    form = (csum[ends] - csum[form_starts]) / (ends - form_starts)
+
+    # Kĺzavý priemer v každom bode (okno nepresahuje do predošlého hráča)
+    index = np.arange(ratings.size)
+    window_starts = np.maximum(np.repeat(starts, counts), index - window + 1)
+    rolling = (csum[index + 1] - csum[window_starts]) / (index + 1 - window_starts)
+
+    rank = np.lexsort((-counts, -means))
+    result = []
+    for i in rank:
+        info = players.get(int(ids[i]))
+        if info is None:
+            continue
+        history_start = max(starts[i], ends[i] - FORM_HISTORY)
+        result.append(PlayerRating(
+            player_id=int(ids[i]),
+            first_name=info["first_name"] or "",
+            last_name=info["last_name"] or "",
+            position=info["position"],
+            matches=int(counts[i]),
+            average=round(float(means[i]), 2),
+            std=round(float(stds[i]), 2),
+            best=float(best[i]),
+            worst=float(worst[i]),
+            form=round(float(form[i]), 2),
+            trend=round(float(form[i] - means[i]), 2),
+            form_history=[round(float(v), 2) for v in rolling[history_start:ends[i]]],
+        ))
+    return SeasonAnalytics(
+        season=season,
+        window=window,
+        evaluations=int(ratings.size),
+        average=round(float(ratings.mean()), 2),
+        players=result,
+        histogram=histogram,
+    )
+
+
+class AnalyticsCache:
+    """
+    LRU cache výsledkov podľa (sezóna, okno). Položka platí, kým sa nezmenia generácie
+    tabuliek v NAMESPACES - platí teda aj naprieč workermi bez explicitnej invalidácie.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._items: "OrderedDict[Hashable, Tuple[Hashable, SeasonAnalytics]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, generation: Hashable, compute: Callable[[], SeasonAnalytics]) -> SeasonAnalytics:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None and entry[0] == generation:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._items[key] = (generation, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self._size:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+analytics_cache = AnalyticsCache(settings.ANALYTICS_CACHE_SIZE)
+
+
+class AnalyticsService:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def get_season_analytics(self, season: Optional[str] = None, window: int = DEFAULT_FORM_WINDOW) -> SeasonAnalytics:
+        """Analytika hodnotení jednej sezóny (alebo všetkých, ak `season` je None)."""
+        window = max(1, min(window, MAX_FORM_WINDOW))
+        date_from, date_before = season_range(season) if season else (None, None)
+        generations = repo_get_generations(self.conn, NAMESPACES)
+        return analytics_cache.get(
+            (season, window),
+            tuple(sorted(generations.items())),
+            lambda: compute_season_analytics(
+                repo_load_evaluation_columns(self.conn, date_from, date_before),
+                repo_load_match_order(self.conn, date_from, date_before),
+                repo_get_players_by_id(self.conn),
+                season,
+                window,
+            ),
+        )
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Počet stĺpcov (posledných udalostí v okne) - viac sa na obrazovku rozumne nezmestí
+DEFAULT_MATRIX_EVENTS = 60
+MAX_MATRIX_EVENTS = 200
+
+
+@dataclass
+class MatrixRow:
+    player: Dict[str, Any]
+    # Bitové množiny cez stĺpce matice: bit i = udalosť events[i]
+    confirmed: int
+    present: int
+    # Stav bunky pre šablónu ako znak reťazca: "0" nič, "1" potvrdil, "2" prítomný, "3" oboje
+    # (reťazec namiesto zoznamu čísel - Jinja ho nemusí pri výpise konvertovať)
+    cells: str
+    confirmed_pct: Optional[int]
+    present_pct: Optional[int]
+
+
+@dataclass
+class AttendanceMatrix:
+    # Od najstaršej - poradie stĺpcov
+    events: List[Dict[str, Any]]
+    rows: List[MatrixRow]
+    # Percentá po stĺpcoch (udalostiach); prítomnosť len pre už odohrané udalosti
+    event_confirmed_pct: List[Optional[int]]
+    event_present_pct: List[Optional[int]]
+    held: int
+
+
+# (potvrdil, prítomný) ako dve binárne číslice -> stav bunky
+_CELL_STATE = {("0", "0"): "0", ("1", "0"): "1", ("0", "1"): "2", ("1", "1"): "3"}
+
+
+def _percent(part: int, whole: int) -> Optional[int]:
+    return round(100 * part / whole) if whole else None
+
+
+def _event_key(event: Dict[str, Any]) -> int:
+    # Rovnaký kľúč ako v repositories.players.get_squad_attendance
+    return event["event_id"] if event["type"] == "match" else -event["event_id"]
+
+
+def build_attendance_matrix(
+    players: Sequence[Dict[str, Any]],
+    events: Sequence[Dict[str, Any]],
+    attendance: Sequence[Tuple[int, Optional[str], Optional[str]]],
+    now: Optional[str] = None,
+) -> AttendanceMatrix:
+    """
+    Poskladá maticu hráč x udalosť z výsledku jedného zoskupeného dotazu. Každý hráč má
+    potvrdenia a prítomnosť ako dve celé čísla (bitové množiny), súčty po riadkoch sú
+    bit_count(), súčty po stĺpcoch sa napočítajú už pri rozbaľovaní kľúčov.
+    """
+    now = now or datetime.now().strftime("%Y-%m-%dT%H:%M")
+    events = sorted(events, key=lambda e: (e["date"], e["type"], e["event_id"]))
+    column = {_event_key(e): i for i, e in enumerate(events)}
+    size = len(events)
+    # Udalosti sú zoradené podľa dátumu - odohrané tvoria súvislý začiatok
+    held = sum(1 for e in events if e["date"] < now)
+    held_mask = (1 << held) - 1
+    confirmed_counts = [0] * size
+    present_counts = [0] * size
+
+    def bits(keys: Optional[str], counts: List[int]) -> int:
+        value = 0
+        if keys:
+            for key in keys.split(","):
+                i = column.get(int(key))
+                # Udalosť mimo načítaných stĺpcov (napr. rovnaký dátum ako najstaršia)
+                if i is not None:
+                    value |= 1 << i
+                    counts[i] += 1
+        return value
+
+    by_player = {
+        user_id: (bits(confirmed, confirmed_counts), bits(present, present_counts))
+        for user_id, confirmed, present in attendance
+    }
+
+    rows = []
+    for player in players:
+        confirmed, present = by_player.get(player["id"], (0, 0))
+        # Bit i ako číslica i-teho znaku - rýchlejšie ako testovať bity po jednom
+        confirmed_digits = format(confirmed, f"0{size}b")[::-1] if size else ""
+        present_digits = format(present, f"0{size}b")[::-1] if size else ""
+        rows.append(MatrixRow(
+            player=player,
+            confirmed=confirmed,
+            present=present,
+            cells="".join(map(_CELL_STATE.__getitem__, zip(confirmed_digits, present_digits))),
+            confirmed_pct=_percent(confirmed.bit_count(), size),
+            present_pct=_percent((present & held_mask).bit_count(), held),
+        ))
+
+    squad = len(players)
+    return AttendanceMatrix(
+        events=events,
+        rows=rows,
+        event_confirmed_pct=[_percent(c, squad) for c in confirmed_counts],
+        event_present_pct=[_percent(p, squad) if i < held else None for i, p in enumerate(present_counts)],
+        held=held,
+    )
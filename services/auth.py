@@ -1,10 +1,8 @@
 import sqlite3
 from dataclasses import dataclass
-from typing import Optional
-from passlib.context import CryptContext
+from typing import Any, Dict, Optional
 from repositories.users import get_user_by_username
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from services.security import hash_password, verify_password
 
 
 @dataclass
@@ -12,6 +10,19 @@ class User:
     id: int
     username: str
     role: str
+    # Profil - vyplní ho services.profiles (session samotná pozná len id, meno a rolu)
+    first_name: str = ""
+    last_name: str = ""
+    position: Optional[str] = None
+    birth_date: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "User":
+        return cls(
+            id=row["id"], username=row["username"], role=row["role"],
+            first_name=row.get("first_name") or "", last_name=row.get("last_name") or "",
+            position=row.get("position"), birth_date=row.get("birth_date"),
+        )
 
 
 class AuthService:
@@ -19,13 +30,20 @@ class AuthService:
         self.conn = conn
 
     def authenticate(self, username: str, password: str) -> Optional[User]:
-        user = get_user_by_username(self.conn, username)
+        return self.verify(self.lookup(username), password)
+
+    def lookup(self, username: str) -> Optional[Dict[str, Any]]:
+        """Jediná časť prihlásenia, ktorá potrebuje databázu."""
+        return get_user_by_username(self.conn, username)
+
+    @staticmethod
+    def verify(user: Optional[Dict[str, Any]], password: str) -> Optional[User]:
         if not user:
             return None
-        if not pwd_context.verify(password, user["password_hash"]):
+        if not verify_password(password, user["password_hash"]):
             return None
         return User(id=user["id"], username=user["username"], role=user["role"])
 
     def hash_password(self, password: str) -> str:
-        return pwd_context.hash(password)
+        return hash_password(password)
 
@@ -0,0 +1,125 @@
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Sequence
+from starlette.requests import Request
+from starlette.responses import Response
+import settings
+from repositories.generations import get_generations as repo_get_generations
+from services.auth import User
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    etag: str
+    media_type: str
+
+
+class RenderCache:
+    """LRU cache vyrenderovaných stránok s limitom na celkovú veľkosť tiel (v bajtoch)."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Hashable, CachedPage]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[CachedPage]:
+        with self._lock:
+            page = self._items.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, key: Hashable, page: CachedPage) -> None:
+        size = len(page.body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._items[key] = page
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+render_cache = RenderCache(settings.RENDER_CACHE_MAX_BYTES)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    # Slabé porovnanie (W/"...") - stačí pre GET
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+class PageCache:
+    """
+    Cache celej HTML odpovede jednej požiadavky. Kľúč tvorí cesta + query string,
+    rola a id používateľa (stránka obsahuje aj jeho účasť a meno v menu) a generácie
+    menných priestorov, z ktorých stránka čerpá. Zápis do ktorejkoľvek z tých tabuliek
+    zvýši generáciu (trigger v DB), takže stará položka sa už nikdy netrafí a časom vypadne z LRU.
+    """
+
+    CACHE_CONTROL = "private, no-cache"
+
+    def __init__(self, request: Request, conn: sqlite3.Connection, user: Optional[User],
+                 cache: RenderCache = render_cache) -> None:
+        self.request = request
+        self.conn = conn
+        self.user = user
+        self.cache = cache
+
+    def respond(self, namespaces: Sequence[str], render: Callable[[], Response]) -> Response:
+        if not settings.RENDER_CACHE_ENABLED:
+            return render()
+
+        generations = repo_get_generations(self.conn, namespaces)
+        key = (
+            self.request.url.path,
+            str(self.request.query_params),
+            self.user.role if self.user else None,
+            self.user.id if self.user else None,
+            tuple(sorted(generations.items())),
+        )
+        page = self.cache.get(key)
+        if page is None:
+            response = render()
+            if response.status_code != 200:
+                return response
+            body = bytes(response.body)
+            page = CachedPage(
+                body=body,
+                etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+                media_type=response.media_type or "text/html",
+            )
+            self.cache.put(key, page)
+
+        headers = {"ETag": page.etag, "Cache-Control": self.CACHE_CONTROL, "Vary": "Cookie"}
+        if etag_matches(self.request.headers.get("if-none-match"), page.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=page.body, media_type=page.media_type, headers=headers)
@@ -0,0 +1,222 @@
+import hashlib
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from starlette.requests import Request
+from starlette.responses import Response
+import settings
+from repositories.calendar import delete_calendar_token as repo_delete_calendar_token
+from repositories.calendar import find_calendar_user as repo_find_calendar_user
+from repositories.calendar import get_calendar_token as repo_get_calendar_token
+from repositories.calendar import set_calendar_token as repo_set_calendar_token
+from repositories.generations import get_generation_stamps as repo_get_generation_stamps
+from repositories.pagination import recent_seasons, season_range
+from repositories.players import iter_player_events as repo_iter_player_events
+from services.cache import etag_matches
+
+# Feed sa mení len so zápasmi, tréningami a účasťou (stav účasti je v popise udalosti)
+NAMESPACES = ("matches", "trainings", "attendance")
+DURATIONS = {"match": timedelta(hours=2), "training": timedelta(minutes=90)}
+MEDIA_TYPE = "text/calendar; charset=utf-8"
+UID_DOMAIN = "futbalovy-manazer"
+# Kľúč v podpísanej session cookie - nový token sa na profile zobrazí len raz
+NEW_TOKEN_KEY = "calendar_token"
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _escape(text: Any) -> str:
+    return (str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _fold(line: str) -> str:
+    """RFC 5545: riadok najviac 75 bajtov, pokračovanie začína medzerou. Nedelí UTF-8 znaky."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while len(encoded) > limit:
+        cut = limit
+        while (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        # Ďalšie riadky majú na začiatku medzeru
+        limit = 74
+    parts.append(encoded.decode("utf-8"))
+    return "\r\n ".join(parts)
+
+
+def _utc(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_calendar(events: Iterable[Dict[str, Any]], stamp: float, tz: Optional[ZoneInfo] = None) -> str:
+    """VCALENDAR z udalostí v tvare get_player_events; `stamp` (DTSTAMP) je čas poslednej zmeny feedu."""
+    tz = tz or ZoneInfo(settings.CALENDAR_TIMEZONE)
+    refresh = f"PT{max(1, settings.CALENDAR_MAX_AGE // 60)}M"
+    dtstamp = _utc(datetime.fromtimestamp(stamp, timezone.utc))
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{UID_DOMAIN}//SK",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        "X-WR-CALNAME:Futbal - zápasy a tréningy",
+        f"X-WR-TIMEZONE:{tz.key}",
+        f"REFRESH-INTERVAL;VALUE=DURATION:{refresh}",
+        f"X-PUBLISHED-TTL:{refresh}",
+    ]
+    for e in events:
+        start = datetime.fromisoformat(e["date"]).replace(tzinfo=tz)
+        description = "Účasť: potvrdená" if e["confirmed"] else "Účasť: nepotvrdená"
+        if e["present"]:
+            description += "\nPrítomnosť potvrdil tréner"
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{e['type']}-{e['event_id']}@{UID_DOMAIN}",
+            f"DTSTAMP:{dtstamp}",
+            f"DTSTART:{_utc(start)}",
+            f"DTEND:{_utc(start + DURATIONS[e['type']])}",
+            f"SUMMARY:{_escape(e['title'])}",
+            f"LOCATION:{_escape(e['location'] or '')}",
+            f"DESCRIPTION:{_escape(description)}",
+            "STATUS:CONFIRMED",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "".join(_fold(line) + "\r\n" for line in lines)
+
+
+@dataclass(frozen=True)
+class CalendarFeed:
+    body: bytes
+    etag: str
+    # Unix čas poslednej zmeny obsahu feedu
+    last_modified: float
+
+    def response(self, request: Request) -> Response:
+        """Podmienený GET - If-None-Match má prednosť, If-Modified-Since len bez neho."""
+        headers = {
+            "ETag": self.etag,
+            "Last-Modified": formatdate(self.last_modified, usegmt=True),
+            "Cache-Control": f"private, max-age={settings.CALENDAR_MAX_AGE}",
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            not_modified = etag_matches(if_none_match, self.etag)
+        else:
+            not_modified = self._not_modified_since(request.headers.get("if-modified-since"))
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type=MEDIA_TYPE, headers=headers)
+
+    def _not_modified_since(self, value: Optional[str]) -> bool:
+        if not value:
+            return False
+        try:
+            since = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # Last-Modified má presnosť na sekundy
+        return int(self.last_modified) <= since
+
+
+class CalendarCache:
+    """
+    LRU cache feedov podľa používateľa. Položka platí pre konkrétne generácie NAMESPACES;
+    po ich zmene sa udalosti načítajú znova, ale ak sú rovnaké (zmena sa hráča netýka),
+    feed sa neprekresľuje a zostane mu ETag aj Last-Modified - klienti dostanú ďalej 304.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._items: "OrderedDict[int, Tuple[Hashable, CalendarFeed]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        user_id: int,
+        key: Hashable,
+        modified: float,
+        load: Callable[[], List[Dict[str, Any]]],
+        render: Callable[[List[Dict[str, Any]], float], str],
+    ) -> CalendarFeed:
+        with self._lock:
+            entry = self._items.get(user_id)
+            if entry is not None and entry[0] == key:
+                self._items.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        events = load()
+        # ETag z dát, nie z tela - telo obsahuje aj DTSTAMP (čas zmeny)
+        etag = f'"{hashlib.blake2b(repr(events).encode(), digest_size=16).hexdigest()}"'
+        if entry is not None and entry[1].etag == etag:
+            feed = entry[1]
+        else:
+            feed = CalendarFeed(body=render(events, modified).encode("utf-8"), etag=etag, last_modified=modified)
+        with self._lock:
+            self._items[user_id] = (key, feed)
+            self._items.move_to_end(user_id)
+            while len(self._items) > self._size:
+                self._items.popitem(last=False)
+        return feed
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._items.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+calendar_cache = CalendarCache(settings.CALENDAR_CACHE_SIZE)
+
+
+class CalendarService:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def create_token(self, user_id: int) -> str:
+        """Nový token (starý prestane platiť). Vráti sa len raz - v DB je iba jeho hash."""
+        token = secrets.token_urlsafe(32)
+        repo_set_calendar_token(self.conn, user_id, hash_token(token), time.time())
+        return token
+
+    def revoke_token(self, user_id: int) -> None:
+        repo_delete_calendar_token(self.conn, user_id)
+        calendar_cache.invalidate(user_id)
+
+    def get_token_info(self, user_id: int) -> Optional[Dict[str, Any]]:
+        return repo_get_calendar_token(self.conn, user_id)
+
+    def get_feed(self, token: str) -> Optional[CalendarFeed]:
+        """Feed pre token, None ak token neplatí. Bez zmeny dát len dva malé dotazy a cache."""
+        user_id = repo_find_calendar_user(self.conn, hash_token(token))
+        if user_id is None:
+            return None
+        stamps = repo_get_generation_stamps(self.conn, NAMESPACES)
+        # Aktuálna a predošlá sezóna - hranica sa posunie raz za rok
+        date_from = season_range(recent_seasons(2)[-1])[0]
+        key = (tuple(sorted((name, value) for name, (value, _) in stamps.items())), date_from)
+        modified = max((updated_at for _, updated_at in stamps.values()), default=0.0)
+        return calendar_cache.get(
+            user_id, key, modified,
+            lambda: list(repo_iter_player_events(self.conn, user_id, date_from=date_from, order="asc")),
+            render_calendar,
+        )
@@ -0,0 +1,39 @@
+import sqlite3
+from datetime import datetime
+from typing import Dict, Any, Optional
+from repositories.dashboard import (get_counts as repo_get_counts, get_next_match as repo_get_next_match,
+                                    get_next_training as repo_get_next_training,
+                                    get_recent_matches as repo_get_recent_matches)
+from repositories.players import get_player_events as repo_get_player_events
+
+class DashboardService:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    @staticmethod
+    def _now() -> str:
+        # Rovnaký formát ako <input type="datetime-local">, v ktorom sú dátumy uložené
+        return datetime.now().strftime("%Y-%m-%dT%H:%M")
+
+    def admin_overview(self) -> Dict[str, Any]:
+        data = repo_get_counts(self.conn)
+        data["recent_matches"] = repo_get_recent_matches(self.conn, 3)
+        return data
+
+    def coach_overview(self, now: Optional[str] = None) -> Dict[str, Any]:
+        now = now or self._now()
+        counts = repo_get_counts(self.conn)
+        return {
+            "next_match": repo_get_next_match(self.conn, now),
+            "next_training": repo_get_next_training(self.conn, now),
+            "matches_count": counts["matches_count"],
+            "players_count": counts["players_count"],
+        }
+
+    def player_overview(self, player_id: int, now: Optional[str] = None, limit: int = 3) -> Dict[str, Any]:
+        counts = repo_get_counts(self.conn)
+        return {
+            "upcoming_events": repo_get_player_events(self.conn, player_id, when='future', limit=limit, now=now or self._now()),
+            # Hráčovi sa zobrazujú všetky zápasy aj tréningy tímu
+            "total_events": counts["matches_count"] + counts["trainings_count"],
+        }
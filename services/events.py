@@ -0,0 +1,201 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+import settings
+from database.pool import get_pool
+from repositories.matches import get_match as repo_get_match
+from repositories.trainings import get_training as repo_get_training
+
+# Téma = udalosť, ktorej dochádzka sa zmenila: ("match", 12) alebo ("training", 7)
+Topic = Tuple[str, int]
+
+
+@dataclass(frozen=True)
+class AttendanceChange:
+    """Zmena dochádzky jedného hráča. None = pole sa nemenilo."""
+    event_type: str
+    event_id: int
+    user_id: int
+    confirmed: Optional[bool] = None
+    present: Optional[bool] = None
+
+    @property
+    def topic(self) -> Topic:
+        return (self.event_type, self.event_id)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+class Subscription:
+    """Fronta jedného odberateľa (SSE spojenia). Žije v event loope, ktorý ju vytvoril."""
+
+    def __init__(self, topic: Topic, loop: asyncio.AbstractEventLoop, size: int) -> None:
+        self.topic = topic
+        self.loop = loop
+        self.queue: "asyncio.Queue[Tuple[int, Dict[str, Any]]]" = asyncio.Queue(size)
+        # Fronta pretiekla (pomalý klient) - stav sa už nedá doskladať z rozdielov
+        self.overflowed = False
+
+    def _put(self, item: Tuple[int, Dict[str, Any]]) -> None:
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class EventBus:
+    """
+    Pub/sub v rámci jedného procesu. Zápisy dochádzky bežia v threadpoole, odberatelia
+    (SSE) v event loope - publish preto odovzdáva správy cez call_soon_threadsafe.
+    Každá správa má poradové číslo; posledné správy každej témy sa pamätajú, aby klient
+    po výpadku spojenia (Last-Event-ID) dostal len to, čo zmeškal.
+    Pri viacerých workeroch vidí odberateľ len zmeny z vlastného procesu.
+    """
+
+    def __init__(self, queue_size: int, history_size: int, history_topics: int) -> None:
+        self.queue_size = queue_size
+        self.history_size = history_size
+        self.history_topics = history_topics
+        self._subscribers: Dict[Topic, Set[Subscription]] = {}
+        self._history: "OrderedDict[Topic, Deque[Tuple[int, Dict[str, Any]]]]" = OrderedDict()
+        # Najvyššie číslo správy, ktorú už história nepamätá - po témach a pre témy vyradené celé
+        self._forgotten: Dict[Topic, int] = {}
+        self._forgotten_topics = 0
+        self._sequence = itertools.count(1)
+        self._last = 0
+        self._lock = threading.Lock()
+        self.published = 0
+
+    @property
+    def last_id(self) -> int:
+        """Číslo poslednej správy - stránka ho pošle klientovi ako východisko odberu."""
+        return self._last
+
+    def subscribe(self, topic: Topic, since: Optional[int] = None) -> Tuple[Subscription, Optional[List[Tuple[int, Dict[str, Any]]]]]:
+        """
+        Zaregistruje odberateľa (volať z event loopu). Vráti aj zmeškané správy po `since`;
+        None znamená, že história už nesiaha tak ďaleko a klient musí načítať celý stav.
+        """
+        subscription = Subscription(topic, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+            missed: Optional[List[Tuple[int, Dict[str, Any]]]] = []
+            if since is not None and since > self._last:
+                # Číslo z iného behu procesu (reštart) - história naň nenadväzuje
+                missed = None
+            elif since is not None and since < self._last:
+                history = self._history.get(topic)
+                forgotten = self._forgotten.get(topic, 0) if history is not None else self._forgotten_topics
+                if since < forgotten:
+                    missed = None
+                elif history is not None:
+                    missed = [item for item in history if item[0] > since]
+        return subscription, missed
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.topic]
+
+    def publish(self, topic: Topic, payload: Dict[str, Any]) -> int:
+        """Odošle správu všetkým odberateľom témy (z ľubovoľného vlákna). Vráti jej číslo."""
+        with self._lock:
+            event_id = next(self._sequence)
+            self._last = event_id
+            self.published += 1
+            history = self._history.get(topic)
+            if history is None:
+                history = self._history[topic] = deque(maxlen=self.history_size)
+                self._forgotten[topic] = self._forgotten_topics
+                while len(self._history) > self.history_topics:
+                    evicted, evicted_history = self._history.popitem(last=False)
+                    self._forgotten.pop(evicted, None)
+                    self._forgotten_topics = max(self._forgotten_topics, evicted_history[-1][0])
+            else:
+                self._history.move_to_end(topic)
+            if len(history) == history.maxlen:
+                self._forgotten[topic] = history[0][0]
+            history.append((event_id, payload))
+            subscribers = list(self._subscribers.get(topic, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, (event_id, payload))
+            except RuntimeError:
+                # Event loop odberateľa už skončil (vypínanie) - odber zanikne s ním
+                pass
+        return event_id
+
+    def publish_change(self, change: AttendanceChange) -> int:
+        return self.publish(change.topic, change.as_dict())
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
+
+
+event_bus = EventBus(settings.LIVE_QUEUE_SIZE, settings.LIVE_HISTORY_SIZE, settings.LIVE_HISTORY_TOPICS)
+
+
+#   SSE
+
+def event_exists(event_type: str, event_id: int) -> bool:
+    """Krátke požičanie spojenia - stream samotný spojenie z poolu nedrží."""
+    with get_pool().connection() as conn:
+        if event_type == "match":
+            return repo_get_match(conn, event_id) is not None
+        return repo_get_training(conn, event_id) is not None
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+def sse_message(data: Dict[str, Any], event: str, event_id: Optional[int] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append("data: " + json.dumps(data, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_topic(topic: Topic, since: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    Telo SSE odpovede: najprv zmeškané správy po `since`, potom zmeny naživo. Udalosť
+    "reset" znamená, že rozdiely nestačia a klient má načítať celý stav znova. Odpojenie
+    klienta zistí StreamingResponse a generátor zruší - odber sa odhlási vo finally.
+    """
+    subscription, missed = event_bus.subscribe(topic, since)
+    try:
+        yield f"retry: {settings.LIVE_RETRY_MS}\n\n"
+        if missed is None:
+            yield sse_message({}, "reset", event_bus.last_id)
+        else:
+            for event_id, payload in missed:
+                yield sse_message(payload, "attendance", event_id)
+        while True:
+            if subscription.overflowed:
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                subscription.overflowed = False
+                yield sse_message({}, "reset", event_bus.last_id)
+            try:
+                event_id, payload = await asyncio.wait_for(subscription.queue.get(), settings.LIVE_HEARTBEAT)
+            except asyncio.TimeoutError:
+                # Komentár - prehliadač ho ignoruje, proxy nezavrie nečinné spojenie
+                yield ": heartbeat\n\n"
+                continue
+            yield sse_message(payload, "attendance", event_id)
+    finally:
+        event_bus.unsubscribe(subscription)
+
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import sqlite3
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import settings
+from database.pool import get_pool
+from repositories.exports import EXPORT_COLUMNS
+from repositories.exports import list_teams as repo_list_teams
+from repositories.exports import export_query as repo_export_query
+from repositories.exports import iter_export as repo_iter_export
+from repositories.pagination import date_window
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "json": "application/json",
+}
+
+
+def csv_chunks(columns: Sequence[str], batches: Iterable[List[Tuple[Any, ...]]]) -> Iterator[str]:
+    """CSV po dávkach - jeden kus textu na dávku riadkov, nie na každý riadok."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Hlavička aj pre prázdny export
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def json_chunks(columns: Sequence[str], batches: Iterable[List[Tuple[Any, ...]]]) -> Iterator[str]:
+    """JSON pole objektov skladané postupne - celý dokument nikdy nie je v pamäti."""
+    separator = "[\n"
+    for rows in batches:
+        yield separator + ",\n".join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) for row in rows
+        )
+        separator = ",\n"
+    yield "[]\n" if separator == "[\n" else "\n]\n"
+
+
+class ExportRequest:
+    """Overené parametre exportu - chyby sa ohlásia ešte pred odoslaním hlavičiek odpovede."""
+
+    def __init__(self, dataset: str, fmt: str, season: Optional[str] = None, date_from: Optional[str] = None,
+                 date_to: Optional[str] = None, team_id: Optional[int] = None):
+        if dataset not in EXPORT_COLUMNS:
+            raise ValueError(f"Neznámy export: {dataset}")
+        if fmt not in FORMATS:
+            raise ValueError(f"Nepodporovaný formát: {fmt}")
+        self.dataset = dataset
+        self.fmt = fmt
+        self.date_from, self.date_before = date_window(season, date_from, date_to)
+        self.team_id = team_id
+        self.columns = EXPORT_COLUMNS[dataset]
+        # Zostavenie SQL overí aj kombináciu filtrov
+        repo_export_query(dataset, self.date_from, self.date_before, team_id)
+
+    @property
+    def media_type(self) -> str:
+        return FORMATS[self.fmt]
+
+    @property
+    def filename(self) -> str:
+        parts = [self.dataset]
+        if self.team_id is not None:
+            parts.append(f"tim{self.team_id}")
+        if self.date_from or self.date_before:
+            parts.append(f"{self.date_from or ''}_{self.date_before or ''}")
+        else:
+            parts.append(date.today().isoformat())
+        return "-".join(parts) + "." + self.fmt
+
+    def stream(self) -> Iterator[bytes]:
+        """
+        Generátor tela odpovede. Spojenie si požičia z poolu sám a drží ho len počas
+        čítania - nie je viazané na závislosti požiadavky, ktoré môžu skončiť skôr než
+        stream. Pri prerušení klientom sa generátor zatvorí a spojenie sa vráti do poolu.
+        """
+        with get_pool().connection() as conn:
+            batches = repo_iter_export(conn, self.dataset, self.date_from, self.date_before,
+                                       self.team_id, settings.EXPORT_BATCH_SIZE)
+            chunks = csv_chunks(self.columns, batches) if self.fmt == "csv" else json_chunks(self.columns, batches)
+            for chunk in chunks:
+                yield chunk.encode("utf-8")
+
+
+class ExportsService:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def list_teams(self) -> List[Dict[str, Any]]:
+        return repo_list_teams(self.conn)
@@ -1,10 +1,15 @@
 import sqlite3
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 # Importujeme funkcie, ktoré sme práve vytvorili
 from repositories.matches import (list_matches as repo_list_matches, insert_match as repo_insert_match, delete_match as repo_delete_match,
                                   update_score as repo_update_score, get_attendance as repo_get_attendance, set_attendance as repo_set_attendance,
-                                  get_match as repo_get_match, update_match as repo_update_match, get_evaluation as repo_get_evaluation,
-                                  set_evaluation as repo_set_evaluation, get_match_attendees as repo_get_match_attendees,)
+                                  get_match as repo_get_match, update_match as repo_update_match,
+                                  set_evaluation as repo_set_evaluation,
+                                  get_match_participants as repo_get_match_participants, Participant,
+                                  toggle_attendance as repo_toggle_attendance,
+                                  list_matches_page as repo_list_matches_page,)
+from repositories.pagination import Page, date_window
+from services.events import AttendanceChange, event_bus
 
 class MatchesService:
     def __init__(self, conn: sqlite3.Connection):
@@ -13,9 +18,24 @@ class MatchesService:
     def get_all_matches(self) -> List[Dict[str, Any]]:
         return repo_list_matches(self.conn)
 
+    def get_matches_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, season: Optional[str] = None,
+                         date_from: Optional[str] = None, date_to: Optional[str] = None,
+                         user_id: Optional[int] = None) -> Page:
+        """
+        Jedna strana zápasov (od najnovších) vo zvolenej sezóne / rozsahu dátumov.
+        S user_id obsahuje aj 'attendance_confirmed' hráča. Pri zlom filtri alebo kurzore vyhodí ValueError.
+        """
+        lower, upper = date_window(season, date_from, date_to)
+        page = repo_list_matches_page(self.conn, limit, cursor, lower, upper, user_id)
+        if user_id is not None:
+            for m in page.items:
+                m['attendance_confirmed'] = bool(m['attendance_confirmed'])
+        return page
+
     def create_match(self, date: str, opponent: str, location: str, team_id: int = 1) -> int:
         # Prednastavené team_id=1, lebo predpokladáme, že hrá náš hlavný tím (FK Lokomotíva)
-        return repo_insert_match(self.conn, date, opponent, location, team_id)
+        match_id = repo_insert_match(self.conn, date, opponent, location, team_id)
+        return match_id
 
     def remove_match(self, match_id: int):
         repo_delete_match(self.conn, match_id)
@@ -37,15 +57,17 @@ class MatchesService:
 
     def confirm_attendance(self, user_id: int, match_id: int, confirmed: bool = True):
         repo_set_attendance(self.conn, user_id, match_id, confirmed)
+        event_bus.publish_change(AttendanceChange("match", match_id, user_id, confirmed=bool(confirmed)))
+
+    def toggle_attendance(self, user_id: int, match_id: int) -> bool:
+        """Prepne potvrdenie účasti (jedným príkazom) a vráti nový stav."""
+        confirmed = repo_toggle_attendance(self.conn, user_id, match_id)
+        event_bus.publish_change(AttendanceChange("match", match_id, user_id, confirmed=confirmed))
+        return confirmed
 
-    def get_match_participants(self, match_id: int) -> List[Dict[str, Any]]:
+    def get_match_participants(self, match_id: int) -> List[Participant]:
         """Vráti zoznam hráčov a ich stav účasti + hodnotenie ak existuje."""
-        players = repo_get_match_attendees(self.conn, match_id)
-        # Obohatíme o existujúce hodnotenia
-        for p in players:
-            evaluation = repo_get_evaluation(self.conn, match_id, p['id'])
-            p['evaluation'] = evaluation
-        return players
+        return repo_get_match_participants(self.conn, match_id)
 
     def save_evaluation(self, match_id: int, player_id: int, coach_id: int, rating: float, comment: str):
         repo_set_evaluation(self.conn, match_id, player_id, coach_id, rating, comment)
\ No newline at end of file
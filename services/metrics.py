@@ -0,0 +1,366 @@
+import bisect
+import math
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Formát textovej expozície Prometheus (verzia 0.0.4)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latencia požiadaviek v sekundách - od rýchlych odpovedí z cache po pomalé stránky
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Počet SQL príkazov na jednu požiadavku
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+# Čas strávený v SQL na jednu požiadavku
+QUERY_TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """Spoločný základ: meno, popis a názvy labelov. Hodnoty sú uložené podľa n-tice labelov."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"Metrika {self.name} očakáva labely {self.labelnames}.")
+        return tuple(str(label) for label in labels)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """(meno vzorky, labely v texte, hodnota)"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    """Hodnota, ktorá len rastie (počet požiadaviek, zásahov cache, ...)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Histogram(Metric):
+    """
+    Rozdelenie hodnôt do pevných košov. Zápis je O(log košov) pod krátkym zámkom,
+    kumulatívne súčty sa počítajú až pri exporte.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        if "le" in labelnames:
+            raise ValueError("Label 'le' je v histograme vyhradený.")
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labely -> [počty v košoch (posledný = +Inf), súčet]
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._values.items())
+        names = self.labelnames + ("le",)
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", _format_labels(names, labels + (_format_value(bound),)), cumulative
+            plain = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum", plain, total
+            yield f"{self.name}_count", plain, cumulative
+
+
+class Gauge(Metric):
+    """
+    Okamžitá hodnota. Buď sa nastavuje priamo (`set`), alebo ju pri každom exporte
+    vráti `callback` - vhodné pre stav, ktorý už niekde existuje (pool, cache).
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+
+    def set(self, value: float, *labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        if self._callback is not None:
+            values = self._callback()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        for labels, value in sorted(values.items()):
+            if value is None:
+                continue
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class CallbackCounter(Counter):
+    """Počítadlo, ktoré už vedie iný objekt (napr. pool) - pri exporte sa len prečíta."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Dict[LabelValues, float]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        raise TypeError(f"Metrika {self.name} sa číta z callbacku.")
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        for labels, value in sorted(self._callback().items()):
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Registry:
+    """Zoznam metrík jedného procesu a ich export do textového formátu."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metrika {metric.name} už je zaregistrovaná.")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+#   POŽIADAVKY (plní middleware.metrics.MetricsMiddleware)
+
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Latencia HTTP požiadaviek podľa pomenovanej route.",
+    ("route", "method", "status"),
+    LATENCY_BUCKETS,
+)
+request_queries = registry.histogram(
+    "http_request_sql_statements",
+    "Počet SQL príkazov vykonaných počas jednej požiadavky.",
+    ("route",),
+    QUERY_COUNT_BUCKETS,
+)
+request_query_time = registry.histogram(
+    "http_request_sql_seconds",
+    "Čas strávený v SQL počas jednej požiadavky.",
+    ("route",),
+    QUERY_TIME_BUCKETS,
+)
+requests_in_progress = registry.gauge(
+    "http_requests_in_progress",
+    "Počet práve spracovávaných požiadaviek.",
+)
+
+#   STAV PROCESU (čítané až pri exporte, za behu nič nestoja)
+
+
+def _pool_stats() -> Dict[str, float]:
+    # Import až tu - metriky sa dajú použiť aj bez databázy (napr. v testoch registra)
+    from database.pool import get_pool
+    return get_pool().stats()
+
+
+def _cache_counters(attribute: str) -> Dict[LabelValues, float]:
+    from services.cache import render_cache
+    from services.profiles import profile_cache
+    from services.session import session_store
+    caches = {"render": render_cache, "profile": profile_cache, "session": session_store}
+    # Analytika (numpy) sa kvôli metrikám nenačíta - len ak ju už používa niektorá stránka
+    analytics = sys.modules.get("services.analytics")
+    if analytics is not None:
+        caches["analytics"] = analytics.analytics_cache
+    calendar = sys.modules.get("services.calendar")
+    if calendar is not None:
+        caches["calendar"] = calendar.calendar_cache
+    return {
+        (name,): getattr(cache, attribute)
+        for name, cache in caches.items()
+        if getattr(cache, attribute, None) is not None
+    }
+
+
+def _session_count() -> Dict[LabelValues, float]:
+    from services.session import session_store
+    return {(): session_store.count()}
+
+
+def _render_cache_state() -> Dict[LabelValues, float]:
+    from services.cache import render_cache
+    return {("entries",): len(render_cache), ("bytes",): render_cache.size_bytes}
+
+
+registry.gauge(
+    "db_pool_connections",
+    "Spojenia v poole podľa stavu.",
+    ("state",),
+    callback=lambda: {(state,): _pool_stats()[state] for state in ("in_use", "idle", "size")},
+)
+registry.register(CallbackCounter(
+    "db_pool_checkouts_total",
+    "Počet požičaní spojenia z poolu.",
+    lambda: {(): _pool_stats()["checkouts"]},
+))
+registry.register(CallbackCounter(
+    "db_pool_checkout_timeouts_total",
+    "Počet požiadaviek, ktoré sa spojenia nedočkali.",
+    lambda: {(): _pool_stats()["timeouts"]},
+))
+registry.register(CallbackCounter(
+    "db_pool_checkout_wait_seconds_total",
+    "Celkový čas čakania na spojenie (priemer = rate(tohto) / rate(db_pool_checkouts_total)).",
+    lambda: {(): _pool_stats()["wait_seconds_total"]},
+))
+registry.gauge(
+    "db_pool_checkout_wait_seconds_max",
+    "Najdlhšie čakanie na spojenie od štartu procesu.",
+    callback=lambda: {(): _pool_stats()["wait_seconds_max"]},
+)
+registry.register(CallbackCounter(
+    "cache_hits_total", "Zásahy in-process cache.", lambda: _cache_counters("hits"), ("cache",),
+))
+registry.register(CallbackCounter(
+    "cache_misses_total", "Výpadky in-process cache.", lambda: _cache_counters("misses"), ("cache",),
+))
+registry.gauge(
+    "render_cache_size",
+    "Obsadenie cache vyrenderovaných stránok.",
+    ("unit",),
+    callback=_render_cache_state,
+)
+registry.gauge(
+    "sessions_active",
+    "Počet platných sessions v úložisku.",
+    callback=_session_count,
+)
+
+
+def _live_subscribers() -> Dict[LabelValues, float]:
+    from services.events import event_bus
+    return {(): event_bus.subscriber_count()}
+
+
+def _live_published() -> Dict[LabelValues, float]:
+    from services.events import event_bus
+    return {(): event_bus.published}
+
+
+registry.gauge(
+    "live_subscribers",
+    "Otvorené SSE spojenia (živá dochádzka) v tomto procese.",
+    callback=_live_subscribers,
+)
+registry.register(CallbackCounter(
+    "live_events_published_total",
+    "Zmeny dochádzky odoslané cez event bus.",
+    _live_published,
+))
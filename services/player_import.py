@@ -0,0 +1,145 @@
+import csv
+import multiprocessing
+import sqlite3
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+import settings
+from repositories.players import insert_players_bulk as repo_insert_players_bulk
+from repositories.users import find_existing_usernames as repo_find_existing_usernames
+
+REQUIRED_COLUMNS = ("username", "first_name", "last_name")
+# Rovnaké predvolené heslo ako pri zakladaní hráča cez formulár
+DEFAULT_PASSWORD = "hrac123"
+
+
+@dataclass
+class RowError:
+    line: int
+    username: str
+    message: str
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+
+@dataclass
+class _Candidate:
+    line: int
+    username: str
+    first_name: str
+    last_name: str
+    position: Optional[str]
+    birth_date: Optional[str]
+    password: str
+
+
+def _hash_password(password: str) -> str:
+    # Beží v samostatnom procese (ProcessPoolExecutor) - bcrypt tak nevyťaží webový proces
+    from services.security import password_context
+    return password_context().hash(password)
+
+
+def read_rows(lines: Iterable[str], default_password: str = DEFAULT_PASSWORD) -> Iterator[Union[_Candidate, RowError]]:
+    """Číta CSV po riadkoch a každý riadok rovno overí. Chybný riadok import nezastaví."""
+    reader = csv.DictReader(lines)
+    missing = [c for c in REQUIRED_COLUMNS if c not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"V CSV chýbajú povinné stĺpce: {', '.join(missing)}")
+
+    seen = set()
+    for raw in reader:
+        line = reader.line_num
+        username = (raw.get("username") or "").strip()
+        first_name = (raw.get("first_name") or "").strip()
+        last_name = (raw.get("last_name") or "").strip()
+        birth_date = (raw.get("birth_date") or "").strip() or None
+
+        if len(username) < 3:
+            yield RowError(line, username, "Username musí mať aspoň 3 znaky.")
+            continue
+        if username in seen:
+            yield RowError(line, username, "Username sa v súbore opakuje.")
+            continue
+        if not first_name or not last_name:
+            yield RowError(line, username, "Meno a priezvisko sú povinné.")
+            continue
+        if birth_date:
+            try:
+                date.fromisoformat(birth_date)
+            except ValueError:
+                yield RowError(line, username, f"Neplatný dátum narodenia: {birth_date} (očakáva sa RRRR-MM-DD).")
+                continue
+
+        seen.add(username)
+        yield _Candidate(
+            line=line, username=username, first_name=first_name, last_name=last_name,
+            position=(raw.get("position") or "").strip() or None, birth_date=birth_date,
+            password=(raw.get("password") or "").strip() or default_password,
+        )
+
+
+def _import_chunk(conn: sqlite3.Connection, chunk: List[Union[_Candidate, RowError]],
+                  pool: Executor, workers: int, result: ImportResult) -> None:
+    candidates = []
+    for item in chunk:
+        if isinstance(item, RowError):
+            result.errors.append(item)
+        else:
+            candidates.append(item)
+
+    # Obsadené mená zistíme jedným dotazom ešte pred drahým hashovaním
+    taken = repo_find_existing_usernames(conn, [c.username for c in candidates])
+    valid = []
+    for c in candidates:
+        if c.username in taken:
+            result.errors.append(RowError(c.line, c.username, "Používateľ s týmto username už existuje."))
+        else:
+            valid.append(c)
+    if not valid:
+        return
+
+    hashes = pool.map(_hash_password, [c.password for c in valid], chunksize=max(1, len(valid) // (workers * 4)))
+    rows = [(c.username, h, c.first_name, c.last_name, c.position, c.birth_date) for c, h in zip(valid, hashes)]
+    try:
+        result.created += repo_insert_players_bulk(conn, rows)
+    except sqlite3.IntegrityError:
+        # Meno medzitým obsadil niekto iný - dávku vložíme po jednom a chyby priradíme riadkom
+        for c, row in zip(valid, rows):
+            try:
+                result.created += repo_insert_players_bulk(conn, [row])
+            except sqlite3.IntegrityError as e:
+                result.errors.append(RowError(c.line, c.username, str(e)))
+
+
+def import_players(
+    conn: sqlite3.Connection,
+    lines: Iterable[str],
+    default_password: str = DEFAULT_PASSWORD,
+    chunk_size: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> ImportResult:
+    """
+    Importuje hráčov z CSV (username, first_name, last_name, [position], [birth_date], [password]).
+    Súbor sa číta prúdovo po dávkach `chunk_size` riadkov; heslá každej dávky sa hashujú
+    paralelne v `workers` procesoch a dávka sa vloží jednou transakciou (executemany).
+    Vyhodí ValueError, ak CSV nemá povinné stĺpce.
+    """
+    chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+    workers = workers or settings.IMPORT_HASH_WORKERS
+    result = ImportResult()
+    rows = read_rows(lines, default_password)
+    # "spawn" namiesto fork - webový proces má bežiace vlákna (threadpool, pool spojení)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            _import_chunk(conn, chunk, pool, workers, result)
+    result.errors.sort(key=lambda e: e.line)
+    return result
@@ -1,11 +1,19 @@
 import sqlite3
-from typing import List, Dict, Any, Optional
-from passlib.context import CryptContext
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from repositories.players import (list_players as repo_list_players, get_player as repo_get_player,
                                   insert_player as repo_insert_player, update_player as repo_update_player,
-                                  delete_player as repo_delete_player, get_player_events as repo_get_player_events, set_player_presence as repo_set_player_presence)
-
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+                                  delete_player as repo_delete_player, get_player_events as repo_get_player_events,
+                                  iter_player_events as repo_iter_player_events, set_player_presence as repo_set_player_presence,
+                                  set_presence_bulk as repo_set_presence_bulk, list_players_page as repo_list_players_page,
+                                  list_events_window as repo_list_events_window,
+                                  get_squad_attendance as repo_get_squad_attendance,
+                                  find_presence_targets as repo_find_presence_targets,
+                                  get_presence as repo_get_presence)
+from repositories.pagination import Page, date_window
+from services.attendance import DEFAULT_MATRIX_EVENTS, MAX_MATRIX_EVENTS, AttendanceMatrix, build_attendance_matrix
+from services.events import AttendanceChange, event_bus
+from services.player_import import DEFAULT_PASSWORD, ImportResult, import_players
+from services.security import hash_password
 
 class PlayersService:
     def __init__(self, conn : sqlite3.Connection):
@@ -14,23 +22,85 @@ class PlayersService:
     def get_all_players(self) -> List[Dict[str, Any]]:
         return repo_list_players(self.conn)
 
+    def get_players_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+        return repo_list_players_page(self.conn, limit, cursor)
+
     def get_player_by_id(self, player_id: int) -> Optional[Dict[str, Any]]:
         return repo_get_player(self.conn, player_id)
 
     def create_player(self, username: str, first_name: str, last_name: str,
                       position: str, birth_date: str,) -> int:
         default_password = "hrac123"
-        password = pwd_context.hash(default_password)
+        password = hash_password(default_password)
         return repo_insert_player(self.conn, username, password, first_name, last_name, position, birth_date)
 
+    def import_players(self, lines: Iterable[str], default_password: str = DEFAULT_PASSWORD) -> ImportResult:
+        """Hromadný import z CSV - pozri services.player_import."""
+        return import_players(self.conn, lines, default_password)
+
     def update_player_info(self, player_id: int, first_name: str, last_name: str, position: str, birth_date: str ):
         repo_update_player(self.conn, player_id, first_name, last_name, position, birth_date)
 
     def delete_player(self, player_id: int):
         repo_delete_player(self.conn, player_id)
 
-    def get_events_for_player(self, player_id: int) -> List[Dict[str, Any]]:
-        return repo_get_player_events(self.conn, player_id)
+    def get_events_for_player(self, player_id: int, when: Optional[str] = None, date_from: Optional[str] = None,
+                              date_before: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return repo_get_player_events(self.conn, player_id, when, date_from, date_before, limit)
+
+    def iter_events_for_player(self, player_id: int, when: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        return repo_iter_player_events(self.conn, player_id, when)
+
+    def get_attendance_matrix(self, season: Optional[str] = None, date_from: Optional[str] = None,
+                              date_to: Optional[str] = None, limit: Optional[int] = None) -> AttendanceMatrix:
+        """Dochádzka celej súpisky - najviac `limit` posledných udalostí v okne sezóny/dátumov."""
+        limit = max(1, min(limit or DEFAULT_MATRIX_EVENTS, MAX_MATRIX_EVENTS))
+        lower, upper = date_window(season, date_from, date_to)
+        events = repo_list_events_window(self.conn, lower, upper, limit)
+        if len(events) == limit:
+            # Účasť stačí načítať od najstaršej zobrazenej udalosti
+            lower = events[-1]["date"]
+        attendance = repo_get_squad_attendance(self.conn, lower, upper) if events else []
+        return build_attendance_matrix(repo_list_players(self.conn), events, attendance)
+
+    def _validate_presence(self, entries: List[Tuple[int, str, int, bool]]) -> None:
+        """Údaje prichádzajú od klienta - neznámy hráč alebo udalosť je chyba vstupu, nie 500."""
+        for _, event_type, _, _ in entries:
+            if event_type not in ('match', 'training'):
+                raise ValueError(f"Neznámy typ udalosti: {event_type}")
+        found = repo_find_presence_targets(
+            self.conn,
+            {e[0] for e in entries},
+            {e[2] for e in entries if e[1] == 'match'},
+            {e[2] for e in entries if e[1] == 'training'},
+        )
+        for player_id, event_type, event_id, _ in entries:
+            if player_id not in found['player']:
+                raise ValueError(f"Hráč {player_id} neexistuje")
+            if event_id not in found[event_type]:
+                raise ValueError(f"Udalosť {event_type}:{event_id} neexistuje")
 
     def confirm_presence(self, player_id: int, event_type: str, event_id: int, present: bool):
-        repo_set_player_presence(self.conn, player_id, event_type, event_id, present)
\ No newline at end of file
+        self._validate_presence([(player_id, event_type, event_id, present)])
+        repo_set_player_presence(self.conn, player_id, event_type, event_id, present)
+        event_bus.publish_change(AttendanceChange(event_type, event_id, player_id, present=bool(present)))
+
+    def confirm_presence_bulk(self, entries: Iterable[Tuple[int, str, int, bool]]) -> int:
+        """
+        Nastaví prítomnosť pre viac hráčov a udalostí naraz (jedna transakcia). Zapíšu sa
+        (a ohlásia cez event bus) len záznamy, ktorých hodnota sa naozaj mení. Vráti ich počet.
+        """
+        entries = list(entries)
+        self._validate_presence(entries)
+        current = repo_get_presence(self.conn, [(p, t, e) for p, t, e, _ in entries])
+        changed = [(p, t, e, bool(present)) for p, t, e, present in entries if current[(p, t, e)] != bool(present)]
+        if not changed:
+            return 0
+        try:
+            count = repo_set_presence_bulk(self.conn, changed)
+        except sqlite3.IntegrityError as e:
+            # Hráča alebo udalosť medzitým niekto zmazal
+            raise ValueError(str(e)) from e
+        for player_id, event_type, event_id, present in changed:
+            event_bus.publish_change(AttendanceChange(event_type, event_id, player_id, present=present))
+        return count
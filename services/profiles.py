@@ -0,0 +1,70 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+import settings
+from database.pool import get_pool
+from repositories.generations import get_generations as repo_get_generations
+from repositories.users import get_user_by_id
+from services.auth import User
+from services.session import session_store
+
+# Profil závisí len od tabuľky users - zápis do nej (aj z iného workera) zmení generáciu
+NAMESPACES = ("users",)
+
+
+class ProfileCache:
+    """
+    LRU cache profilov prihlásených používateľov (user_id -> User s menom, rolou, pozíciou, ...).
+    Položka platí, kým sa nezmení generácia tabuľky users - zmena role či mena sa tak
+    prejaví hneď vo všetkých workeroch. Generácia sa číta pred načítaním profilu, takže
+    zápis počas načítania uloží položku so starou generáciou a tá sa hneď prepočíta.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._items: "OrderedDict[int, Tuple[Hashable, User]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, generation: Hashable, load: Callable[[int], Optional[User]]) -> Optional[User]:
+        with self._lock:
+            entry = self._items.get(user_id)
+            if entry is not None and entry[0] == generation:
+                self._items.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        user = load(user_id)
+        with self._lock:
+            if user is None:
+                self._items.pop(user_id, None)
+                return None
+            self._items[user_id] = (generation, user)
+            self._items.move_to_end(user_id)
+            while len(self._items) > self._size:
+                self._items.popitem(last=False)
+        return user
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+profile_cache = ProfileCache(settings.PROFILE_CACHE_SIZE)
+
+
+def _load_profile(conn: sqlite3.Connection, user_id: int) -> Optional[User]:
+    row = get_user_by_id(conn, user_id)
+    return User.from_row(row) if row else None
+
+
+def resolve_user(session_id: Optional[str]) -> Optional[User]:
+    """Session cookie -> plný profil používateľa (alebo None). Číta generáciu users, profil len pri zmene."""
+    user = session_store.get_user(session_id)
+    if user is None:
+        return None
+    with get_pool().connection() as conn:
+        generation = repo_get_generations(conn, NAMESPACES).get("users")
+        return profile_cache.get(user.id, generation, lambda user_id: _load_profile(conn, user_id))
@@ -0,0 +1,27 @@
+import threading
+from functools import lru_cache
+import settings
+
+# bcrypt zaberie stovky ms CPU. Bez obmedzenia by pri náraze prihlásení obsadil
+# všetky jadrá (vlákna threadpoolu) a spomalil aj bežné prehliadanie stránok.
+_hash_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_CONCURRENCY)
+
+
+@lru_cache(maxsize=None)
+def password_context():
+    """
+    Jediný CryptContext pre celú aplikáciu - prihlásenie, nové účty aj import.
+    passlib sa načíta až pri prvom použití, štart aplikácie ho nepotrebuje.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_password(password: str) -> str:
+    with _hash_slots:
+        return password_context().hash(password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    with _hash_slots:
+        return password_context().verify(password, password_hash)
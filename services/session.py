@@ -1,27 +1,70 @@
+import hashlib
 import secrets
-from threading import Lock
-from typing import Dict, Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+import settings
 from services.auth import User
 
 SESSION_COOKIE_NAME = "session_id"
 
 
-class SessionStore:
-    def __init__(self) -> None:
-        self._sessions: Dict[str, User] = {}
-        self._lock = Lock()
+class SessionBackend:
+    """Rozhranie úložiska sessions. Implementácia sa vyberá v settings.SESSION_BACKEND."""
+
+    def create_session(self, user: User) -> str:
+        raise NotImplementedError
+
+    def get_user(self, session_id: Optional[str]) -> Optional[User]:
+        raise NotImplementedError
+
+    def delete_session(self, session_id: Optional[str]) -> None:
+        raise NotImplementedError
+
+    def purge_expired(self) -> int:
+        """Zmaže expirované sessions, vráti ich počet."""
+        return 0
+
+    def count(self) -> Optional[int]:
+        """Počet platných sessions (pre metriky); None, ak ho backend nevie zistiť."""
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySessionBackend(SessionBackend):
+    """Sessions v pamäti procesu - len pre vývoj s jedným workerom (reštart všetkých odhlási)."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.time) -> None:
+        self._sessions: Dict[str, Tuple[User, float]] = {}
+        self._lock = threading.Lock()
+        self._ttl = ttl
+        self._clock = clock
 
     def create_session(self, user: User) -> str:
         session_id = secrets.token_urlsafe(32)
         with self._lock:
-            self._sessions[session_id] = user
+            self._sessions[session_id] = (user, self._clock() + self._ttl)
         return session_id
 
     def get_user(self, session_id: Optional[str]) -> Optional[User]:
         if not session_id:
             return None
+        now = self._clock()
         with self._lock:
-            return self._sessions.get(session_id)
+            entry = self._sessions.get(session_id)
+            if not entry:
+                return None
+            user, expires_at = entry
+            if expires_at <= now:
+                del self._sessions[session_id]
+                return None
+            # Posuvná expirácia - aktívny používateľ zostáva prihlásený
+            self._sessions[session_id] = (user, now + self._ttl)
+            return user
 
     def delete_session(self, session_id: Optional[str]) -> None:
         if not session_id:
@@ -29,6 +72,231 @@ class SessionStore:
         with self._lock:
             self._sessions.pop(session_id, None)
 
+    def purge_expired(self) -> int:
+        now = self._clock()
+        with self._lock:
+            expired = [sid for sid, (_, expires_at) in self._sessions.items() if expires_at <= now]
+            for sid in expired:
+                del self._sessions[sid]
+        return len(expired)
+
+    def count(self) -> int:
+        now = self._clock()
+        with self._lock:
+            return sum(1 for _, expires_at in self._sessions.values() if expires_at > now)
+
+
+class SqliteSessionBackend(SessionBackend):
+    """
+    Sessions v tabuľke `sessions` - prežijú reštart a zdieľajú ich všetky workery.
+
+    - v DB je len SHA-256 z tokenu, nie token samotný (únik DB neprezradí platné cookies)
+    - posuvná expirácia: expires_at sa posunie najviac raz za `touch_interval` sekúnd
+    - pred DB je malá LRU cache; položka platí `cache_ttl` sekúnd, takže odhlásenie
+      v inom workeri sa prejaví najneskôr po tejto dobe
+    - expirované riadky sa mažú po dávkach raz za `purge_interval` sekúnd
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        ttl: float,
+        touch_interval: float = 300.0,
+        purge_interval: float = 600.0,
+        purge_batch: int = 500,
+        cache_size: int = 1024,
+        cache_ttl: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._connect = connect
+        self._ttl = ttl
+        self._touch_interval = touch_interval
+        self._purge_interval = purge_interval
+        self._purge_batch = purge_batch
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._clock = clock
+        # Vlastné spojenie (nie z poolu) - session sa rieši v závislostiach požiadavky,
+        # ktorá už môže držať spojenie z poolu, a dve spojenia na požiadavku by pool
+        # pri záťaži zablokovali. Dotazy sú krátke, takže stačí jedno spojenie so zámkom.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        # hash tokenu -> (používateľ, expires_at, uložené do cache, naposledy posunuté)
+        self._cache: "OrderedDict[str, Tuple[User, float, float, float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._next_purge = clock() + purge_interval
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return hashlib.sha256(session_id.encode()).hexdigest()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    # --- cache ---
+
+    def _cache_get(self, key: str, now: float) -> Optional[Tuple[User, float, float, float]]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[1] <= now or now - entry[2] > self._cache_ttl:
+                del self._cache[key]
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _cache_put(self, key: str, entry: Tuple[User, float, float, float]) -> None:
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _cache_drop(self, key: str) -> None:
+        with self._cache_lock:
+            self._cache.pop(key, None)
+
+    # --- rozhranie ---
+
+    def create_session(self, user: User) -> str:
+        session_id = secrets.token_urlsafe(32)
+        key = self._key(session_id)
+        now = self._clock()
+        expires_at = now + self._ttl
+        with self._db_lock:
+            conn = self._db()
+            conn.execute(
+                "INSERT INTO sessions(id, user_id, created_at, expires_at, touched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, user.id, now, expires_at, now)
+            )
+            conn.commit()
+        self._cache_put(key, (user, expires_at, now, now))
+        self._maybe_purge(now)
+        return session_id
+
+    def get_user(self, session_id: Optional[str]) -> Optional[User]:
+        if not session_id:
+            return None
+        key = self._key(session_id)
+        now = self._clock()
+        entry = self._cache_get(key, now)
+        if entry is None:
+            entry = self._load(key, now)
+            if entry is None:
+                return None
+        user, expires_at, cached_at, touched_at = entry
+        if now - touched_at >= self._touch_interval:
+            expires_at = self._touch(key, now)
+            if expires_at is None:
+                self._cache_drop(key)
+                return None
+            self._cache_put(key, (user, expires_at, cached_at, now))
+        self._maybe_purge(now)
+        return user
+
+    def delete_session(self, session_id: Optional[str]) -> None:
+        if not session_id:
+            return
+        key = self._key(session_id)
+        self._cache_drop(key)
+        with self._db_lock:
+            conn = self._db()
+            conn.execute("DELETE FROM sessions WHERE id = ?", (key,))
+            conn.commit()
+
+    def purge_expired(self) -> int:
+        # Po dávkach, každá vo vlastnej transakcii - zápis nikdy nedrží zámok DB dlho
+        deleted = 0
+        now = self._clock()
+        while True:
+            with self._db_lock:
+                conn = self._db()
+                cur = conn.execute(
+                    "DELETE FROM sessions WHERE id IN (SELECT id FROM sessions WHERE expires_at <= ? LIMIT ?)",
+                    (now, self._purge_batch)
+                )
+                conn.commit()
+            deleted += cur.rowcount
+            if cur.rowcount < self._purge_batch:
+                return deleted
+
+    def count(self) -> int:
+        with self._db_lock:
+            return self._db().execute(
+                "SELECT COUNT(*) FROM sessions WHERE expires_at > ?", (self._clock(),)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        with self._cache_lock:
+            self._cache.clear()
+
+    # --- pomocné ---
+
+    def _load(self, key: str, now: float) -> Optional[Tuple[User, float, float, float]]:
+        # Rolu a meno berieme z tabuľky users - zmena role sa prejaví bez nového prihlásenia
+        with self._db_lock:
+            row = self._db().execute(
+                """
+                SELECT u.id, u.username, u.role, s.expires_at, s.touched_at
+                FROM sessions s
+                JOIN users u ON u.id = s.user_id
+                WHERE s.id = ? AND s.expires_at > ?
+                """,
+                (key, now)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = (User(id=row[0], username=row[1], role=row[2]), row[3], now, row[4])
+        self._cache_put(key, entry)
+        return entry
+
+    def _touch(self, key: str, now: float) -> Optional[float]:
+        expires_at = now + self._ttl
+        with self._db_lock:
+            conn = self._db()
+            cur = conn.execute(
+                "UPDATE sessions SET expires_at = ?, touched_at = ? WHERE id = ? AND expires_at > ?",
+                (expires_at, now, key, now)
+            )
+            conn.commit()
+        # Session mohla byť medzitým zmazaná (odhlásenie v inom workeri)
+        return expires_at if cur.rowcount else None
+
+    def _maybe_purge(self, now: float) -> None:
+        if now < self._next_purge:
+            return
+        self._next_purge = now + self._purge_interval
+        self.purge_expired()
+
+
+def create_session_backend() -> SessionBackend:
+    if settings.SESSION_BACKEND == "memory":
+        return MemorySessionBackend(ttl=settings.SESSION_TTL)
+    if settings.SESSION_BACKEND == "sqlite":
+        # Import až tu - pamäťový backend databázu nepotrebuje
+        from database.database import connect
+        return SqliteSessionBackend(
+            connect=connect,
+            ttl=settings.SESSION_TTL,
+            touch_interval=settings.SESSION_TOUCH_INTERVAL,
+            purge_interval=settings.SESSION_PURGE_INTERVAL,
+            purge_batch=settings.SESSION_PURGE_BATCH,
+            cache_size=settings.SESSION_CACHE_SIZE,
+            cache_ttl=settings.SESSION_CACHE_TTL,
+        )
+    raise ValueError(f"Neznámy SESSION_BACKEND: {settings.SESSION_BACKEND}")
 
-session_store = SessionStore()
 
+session_store = create_session_backend()
@@ -0,0 +1,42 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class StartupProfile:
+    """Trvanie jednotlivých krokov štartu (import, routery, pool, migrácie, šablóny)."""
+
+    def __init__(self, started: Optional[float] = None) -> None:
+        self.started = time.perf_counter() if started is None else started
+        self.steps: List[Tuple[str, float]] = []
+        self.ready_after: Optional[float] = None
+        self.stopping = False
+
+    def record(self, name: str, seconds: float) -> None:
+        self.steps.append((name, seconds))
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def mark_ready(self) -> None:
+        self.ready_after = time.perf_counter() - self.started
+
+    @property
+    def ready(self) -> bool:
+        return self.ready_after is not None and not self.stopping
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "steps_ms": {name: round(seconds * 1000, 1) for name, seconds in self.steps},
+            "ready_after_ms": None if self.ready_after is None else round(self.ready_after * 1000, 1),
+        }
+
+    def summary(self) -> str:
+        parts = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.steps)
+        total = f"pripravená za {self.ready_after * 1000:.0f} ms" if self.ready_after is not None else "štartuje"
+        return f"Aplikácia {total} ({parts})"
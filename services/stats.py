@@ -1,10 +1,45 @@
 import sqlite3
-from typing import Dict, Any
-from repositories.stats import get_player_stats as repo_get_player_stats
+import threading
+from typing import Callable, Dict, Any, Hashable, Optional, Tuple
+from repositories.generations import get_generations as repo_get_generations
+from repositories.stats import (get_attendance_counters as repo_get_attendance_counters,
+                                get_event_totals as repo_get_event_totals,
+                                build_player_stats)
+
+# Celkové počty závisia od týchto tabuliek
+NAMESPACES = ("matches", "trainings")
+
+
+class EventTotalsCache:
+    """
+    Počty zápasov a tréningov zdieľané celým procesom. Hodnota platí, kým sa nezmenia
+    generácie tabuliek v NAMESPACES - zápis z ktoréhokoľvek workera sa prejaví hneď.
+    Generácia sa číta pred počítaním, takže zápis počas neho výsledok hneď zneplatní.
+    """
+
+    def __init__(self) -> None:
+        self._entry: Optional[Tuple[Hashable, Dict[str, int]]] = None
+        self._lock = threading.Lock()
+
+    def get(self, generation: Hashable, load: Callable[[], Dict[str, int]]) -> Dict[str, int]:
+        with self._lock:
+            if self._entry is not None and self._entry[0] == generation:
+                return self._entry[1]
+        value = load()
+        with self._lock:
+            self._entry = (generation, value)
+        return value
+
+
+event_totals = EventTotalsCache()
+
 
 class StatsService:
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
 
     def get_my_stats(self, user_id: int) -> Dict[str, Any]:
-        return repo_get_player_stats(self.conn, user_id)
\ No newline at end of file
+        # Počítadlá hráča a generácie; celkové počty väčšinou z cache
+        generations = repo_get_generations(self.conn, NAMESPACES)
+        totals = event_totals.get(tuple(sorted(generations.items())), lambda: repo_get_event_totals(self.conn))
+        return build_player_stats(repo_get_attendance_counters(self.conn, user_id), totals)
@@ -0,0 +1,70 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import jinja2
+from starlette.templating import Jinja2Templates
+import settings
+
+
+@dataclass
+class CompileReport:
+    templates: int
+    seconds: float
+    # (šablóna, sekundy) - najpomalšie na začiatku
+    slowest: List[Tuple[str, float]]
+    errors: List[Tuple[str, str]]
+
+    def summary(self) -> str:
+        line = f"Šablóny: {self.templates} skompilovaných za {self.seconds * 1000:.1f} ms"
+        if self.slowest:
+            line += " (najpomalšie: " + ", ".join(f"{name} {sec * 1000:.1f} ms" for name, sec in self.slowest) + ")"
+        return line
+
+
+def create_environment(
+    directory: str = settings.TEMPLATES_DIR,
+    cache_dir: Optional[str] = settings.TEMPLATE_CACHE_DIR,
+    auto_reload: bool = settings.TEMPLATE_AUTO_RELOAD,
+) -> jinja2.Environment:
+    """
+    Jinja prostredie s bytecode cache na disku. Skompilované šablóny zdieľajú všetky
+    workery aj reštarty; kľúčom je kontrolný súčet zdrojáku, takže zmenená šablóna
+    sa skompiluje nanovo. Zápis do cache je atomický (dočasný súbor + rename).
+    """
+    bytecode_cache = None
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(cache_dir)
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(directory),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+        # Bez auto_reload sa pri každom renderi nekontroluje čas zmeny súboru
+        auto_reload=auto_reload,
+    )
+
+
+def create_templates() -> Jinja2Templates:
+    return Jinja2Templates(env=create_environment())
+
+
+def precompile(env: jinja2.Environment, report_slowest: int = 3) -> CompileReport:
+    """
+    Načíta všetky šablóny do pamäte prostredia (a bytecode cache), aby kompiláciu
+    nezaplatili prvé požiadavky. Chybná šablóna štart nezastaví - nahlási sa v reporte.
+    """
+    timings: List[Tuple[str, float]] = []
+    errors: List[Tuple[str, str]] = []
+    start = time.perf_counter()
+    for name in env.list_templates(filter_func=lambda n: n.endswith(".html")):
+        t0 = time.perf_counter()
+        try:
+            env.get_template(name)
+        except jinja2.TemplateError as e:
+            errors.append((name, str(e)))
+            continue
+        timings.append((name, time.perf_counter() - t0))
+    elapsed = time.perf_counter() - start
+    timings.sort(key=lambda item: item[1], reverse=True)
+    return CompileReport(templates=len(timings), seconds=elapsed, slowest=timings[:report_slowest], errors=errors)
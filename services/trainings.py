@@ -4,7 +4,11 @@ from repositories.trainings import (
     list_trainings as repo_list_trainings, get_training as repo_get_training, insert_training as repo_insert_training,
     update_training as repo_update_training, delete_training as repo_delete_training,
     get_training_attendance as repo_get_training_attendance, set_training_attendance as repo_set_training_attendance,
+    toggle_training_attendance as repo_toggle_training_attendance,
+    list_trainings_page as repo_list_trainings_page,
 )
+from repositories.pagination import Page, date_window
+from services.events import AttendanceChange, event_bus
 
 class TrainingsService:
     def __init__(self, conn: sqlite3.Connection):
@@ -13,11 +17,23 @@ class TrainingsService:
     def get_all_trainings(self) -> List[Dict[str, Any]]:
         return repo_list_trainings(self.conn)
 
+    def get_trainings_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, season: Optional[str] = None,
+                           date_from: Optional[str] = None, date_to: Optional[str] = None,
+                           user_id: Optional[int] = None) -> Page:
+        """Jedna strana tréningov (od najnovších), voliteľne s účasťou hráča. Pri zlom filtri vyhodí ValueError."""
+        lower, upper = date_window(season, date_from, date_to)
+        page = repo_list_trainings_page(self.conn, limit, cursor, lower, upper, user_id)
+        if user_id is not None:
+            for t in page.items:
+                t['attendance_confirmed'] = bool(t['attendance_confirmed'])
+        return page
+
     def get_training_by_id(self, training_id: int) -> Optional[Dict[str, Any]]:
         return repo_get_training(self.conn, training_id)
 
     def create_training(self, date: str, location: str, description: str, team_id: int = 1) -> int:
-        return repo_insert_training(self.conn, date, location, description, team_id)
+        training_id = repo_insert_training(self.conn, date, location, description, team_id)
+        return training_id
 
     def edit_training(self, training_id: int, date: str, location: str, description: str):
         repo_update_training(self.conn, training_id, date, location, description)
@@ -34,4 +50,11 @@ class TrainingsService:
         return False
 
     def confirm_attendance(self, user_id: int, training_id: int, confirmed: bool = True):
-        repo_set_training_attendance(self.conn, user_id, training_id, confirmed)
\ No newline at end of file
+        repo_set_training_attendance(self.conn, user_id, training_id, confirmed)
+        event_bus.publish_change(AttendanceChange("training", training_id, user_id, confirmed=bool(confirmed)))
+
+    def toggle_attendance(self, user_id: int, training_id: int) -> bool:
+        """Prepne potvrdenie účasti (jedným príkazom) a vráti nový stav."""
+        confirmed = repo_toggle_training_attendance(self.conn, user_id, training_id)
+        event_bus.publish_change(AttendanceChange("training", training_id, user_id, confirmed=confirmed))
+        return confirmed
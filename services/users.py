@@ -1,15 +1,15 @@
 import sqlite3
 from typing import List, Dict, Any, Optional
-from passlib.context import CryptContext
 from repositories.users import (
     get_all_users as repo_get_all_users,
     get_user_by_id as repo_get_user_by_id,
     insert_user as repo_insert_user,
     update_user as repo_update_user,
-    delete_user as repo_delete_user
+    delete_user as repo_delete_user,
+    list_users_page as repo_list_users_page,
 )
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from repositories.pagination import Page
+from services.security import hash_password
 
 class UsersService:
     def __init__(self, conn: sqlite3.Connection):
@@ -18,11 +18,14 @@ class UsersService:
     def get_all_users(self) -> List[Dict[str, Any]]:
         return repo_get_all_users(self.conn)
 
+    def get_users_page(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+        return repo_list_users_page(self.conn, limit, cursor)
+
     def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         return repo_get_user_by_id(self.conn, user_id)
 
     def create_user(self, username: str, password: str, role: str, first_name: str, last_name: str, position: str = None, birth_date: str = None) -> int:
-        password_hash = pwd_context.hash(password)
+        password_hash = hash_password(password)
         return repo_insert_user(self.conn, username, password_hash, role, first_name, last_name, position, birth_date)
 
     def update_user(self, user_id: int, role: str, first_name: str, last_name: str, position: str = None, birth_date: str = None):
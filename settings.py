@@ -0,0 +1,133 @@
+# Konfigurácia aplikácie - hodnoty sa dajú prepísať premennými prostredia
+import os
+
+BASE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+# development | production - v produkcii sa napr. nekontrolujú zmeny šablón
+APP_ENV = os.environ.get("APP_ENV", "development")
+
+# Voliteľné časti aplikácie (čiarkou oddelené); prihlásenie, dashboard, profil
+# a /health sú vždy zapnuté. Vypnutá časť sa ani neimportuje.
+ENABLED_FEATURES = tuple(
+    name.strip()
+    for name in os.environ.get("ENABLED_FEATURES", "matches,players,trainings,users,analytics,exports,calendar,live,metrics").split(",")
+    if name.strip()
+)
+
+#   DATABÁZA
+
+DATABASE_PATH = os.environ.get("DATABASE_PATH", os.path.join(BASE_DIR, "database", "database.db"))
+
+# Počet spojení v poole (a teda aj max. počet súbežných požiadaviek, ktoré pracujú s DB)
+DB_POOL_SIZE = _env_int("DB_POOL_SIZE", 5)
+# Ako dlho (v sekundách) najviac čakať na voľné spojenie
+DB_POOL_TIMEOUT = _env_float("DB_POOL_TIMEOUT", 10.0)
+# Spojenie, ktoré bolo nečinné dlhšie, sa pred vydaním overí cez SELECT 1
+DB_POOL_HEALTH_CHECK_INTERVAL = _env_float("DB_POOL_HEALTH_CHECK_INTERVAL", 30.0)
+
+#   SERVER
+
+# Route handlery sú synchrónne a bežia v threadpoole (SQLite aj bcrypt blokujú).
+# Počet vlákien = max. počet súbežne spracovaných požiadaviek na jeden worker;
+# s DB pracuje najviac DB_POOL_SIZE z nich, ostatné čakajú na spojenie.
+THREADPOOL_SIZE = _env_int("THREADPOOL_SIZE", 40)
+# Koľko bcrypt výpočtov (prihlásenie, nové heslo) môže bežať naraz
+PASSWORD_HASH_CONCURRENCY = _env_int("PASSWORD_HASH_CONCURRENCY", max(1, (os.cpu_count() or 2) // 2))
+
+#   SESSIONS
+
+# sqlite = zdieľané medzi workermi a reštartmi, memory = len v procese (vývoj)
+SESSION_BACKEND = os.environ.get("SESSION_BACKEND", "sqlite")
+# Platnosť session v sekundách od poslednej aktivity
+SESSION_TTL = _env_float("SESSION_TTL", 14 * 24 * 3600)
+# Expirácia sa v DB posúva najviac raz za tento počet sekúnd (nie pri každej požiadavke)
+SESSION_TOUCH_INTERVAL = _env_float("SESSION_TOUCH_INTERVAL", 300.0)
+# Ako často mazať expirované sessions a koľko riadkov v jednej transakcii
+SESSION_PURGE_INTERVAL = _env_float("SESSION_PURGE_INTERVAL", 600.0)
+SESSION_PURGE_BATCH = _env_int("SESSION_PURGE_BATCH", 500)
+# In-process cache pred DB: počet položiek a ich životnosť v sekundách
+SESSION_CACHE_SIZE = _env_int("SESSION_CACHE_SIZE", 1024)
+SESSION_CACHE_TTL = _env_float("SESSION_CACHE_TTL", 5.0)
+
+# Cache profilov prihlásených (meno, rola, pozícia) - počet položiek; platnosť určuje generácia users
+PROFILE_CACHE_SIZE = _env_int("PROFILE_CACHE_SIZE", 1024)
+
+#   ŠTATISTIKY
+
+# Počet (sezóna, okno formy) výsledkov analytiky hodnotení držaných v pamäti
+ANALYTICS_CACHE_SIZE = _env_int("ANALYTICS_CACHE_SIZE", 32)
+
+#   IMPORT HRÁČOV
+
+# Počet riadkov CSV v jednej transakcii a počet procesov na hashovanie hesiel
+IMPORT_CHUNK_SIZE = _env_int("IMPORT_CHUNK_SIZE", 200)
+IMPORT_HASH_WORKERS = _env_int("IMPORT_HASH_WORKERS", os.cpu_count() or 2)
+
+#   KALENDÁR (ICS FEED)
+
+# Počet vygenerovaných feedov v pamäti a ako dlho (s) ich smie klient držať bez revalidácie
+CALENDAR_CACHE_SIZE = _env_int("CALENDAR_CACHE_SIZE", 1024)
+CALENDAR_MAX_AGE = _env_int("CALENDAR_MAX_AGE", 900)
+# Časy udalostí sú v DB bez zóny (miestny čas klubu)
+CALENDAR_TIMEZONE = os.environ.get("CALENDAR_TIMEZONE", "Europe/Bratislava")
+
+#   EXPORT DÁT
+
+# Počet riadkov načítaných naraz (fetchmany) a odoslaných ako jeden kus odpovede
+EXPORT_BATCH_SIZE = _env_int("EXPORT_BATCH_SIZE", 500)
+
+#   ŽIVÁ DOCHÁDZKA (SSE)
+
+# Interval komentára "heartbeat" v sekundách - drží spojenie cez proxy a odhalí odpojeného klienta
+LIVE_HEARTBEAT = _env_float("LIVE_HEARTBEAT", 15.0)
+# Za koľko milisekúnd sa má prehliadač po výpadku znova pripojiť
+LIVE_RETRY_MS = _env_int("LIVE_RETRY_MS", 3000)
+# Neodoslané správy jedného spojenia; pri pretečení klient dostane "reset" a načíta stav znova
+LIVE_QUEUE_SIZE = _env_int("LIVE_QUEUE_SIZE", 100)
+# Pamätané správy na udalosť a počet udalostí v histórii (doručenie zmeškaného po opätovnom pripojení)
+LIVE_HISTORY_SIZE = _env_int("LIVE_HISTORY_SIZE", 200)
+LIVE_HISTORY_TOPICS = _env_int("LIVE_HISTORY_TOPICS", 256)
+
+#   CACHE STRÁNOK
+
+# Cache vyrenderovaných zoznamov (zápasy, tréningy, hráči) - zapnutá a jej limit v bajtoch
+RENDER_CACHE_ENABLED = os.environ.get("RENDER_CACHE_ENABLED", "1") not in ("0", "false", "off")
+RENDER_CACHE_MAX_BYTES = _env_int("RENDER_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+
+#   ŠABLÓNY
+
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+# Skompilované šablóny (bytecode) zdieľané medzi workermi a reštartmi; prázdne = bez cache
+TEMPLATE_CACHE_DIR = os.environ.get("TEMPLATE_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "jinja"))
+# Kontrola zmien šablón pri každom použití - len pri vývoji
+TEMPLATE_AUTO_RELOAD = os.environ.get(
+    "TEMPLATE_AUTO_RELOAD", "0" if APP_ENV == "production" else "1"
+) not in ("0", "false", "off")
+
+#   METRIKY
+
+# Endpoint /metrics (formát Prometheus) a meranie každej požiadavky
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") not in ("0", "false", "off")
+# Ak je nastavený, /metrics vyžaduje hlavičku "Authorization: Bearer <token>";
+# bez tokenu ich vidí len prihlásený admin (nikdy nie sú verejné)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+#   SQL TRACE
+
+# off | print | log (pozri database/tracing.py)
+SQL_TRACE = os.environ.get("SQL_TRACE", "off")
+# Podiel príkazov, ktoré sa zapíšu (1.0 = všetky); pomalé príkazy sa zapíšu vždy
+SQL_TRACE_SAMPLE_RATE = _env_float("SQL_TRACE_SAMPLE_RATE", 1.0)
+# Hranica pre "pomalý" príkaz v milisekundách (0 = nehlásiť)
+SQL_SLOW_QUERY_MS = _env_float("SQL_SLOW_QUERY_MS", 100.0)
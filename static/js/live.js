@@ -0,0 +1,93 @@
+// Živá dochádzka: prepínače účasti bez znovunačítania stránky a zmeny od iných cez SSE.
+// Bez JavaScriptu všetko funguje ako doteraz (formuláre + presmerovanie).
+(function () {
+    "use strict";
+
+    // Potvrdenie účasti - server vráti len nové tlačidlo (X-Fragment), nie celý zoznam
+    document.addEventListener("submit", function (event) {
+        var form = event.target;
+        if (!form.matches("form[data-live-toggle]")) {
+            return;
+        }
+        event.preventDefault();
+        var button = form.querySelector("button");
+        if (button) {
+            button.disabled = true;
+        }
+        fetch(form.action, {
+            method: "POST",
+            headers: {"X-Fragment": "1"},
+            credentials: "same-origin",
+        }).then(function (response) {
+            if (!response.ok) {
+                throw new Error(response.status);
+            }
+            return response.text();
+        }).then(function (html) {
+            form.outerHTML = html;
+        }).catch(function () {
+            // Pri chybe klasické odoslanie - používateľ uvidí stránku s chybou/prihlásením
+            form.submit();
+        });
+    });
+
+    // Prítomnosť na súpiske sa uloží hneď po zaškrtnutí (hromadné uloženie ostáva ako záloha)
+    document.addEventListener("change", function (event) {
+        var box = event.target;
+        if (!box.matches("input[data-presence-url]")) {
+            return;
+        }
+        var body = new URLSearchParams();
+        if (box.checked) {
+            body.set("present", "1");
+        }
+        fetch(box.dataset.presenceUrl, {
+            method: "POST",
+            headers: {"Accept": "application/json"},
+            body: body,
+            credentials: "same-origin",
+        }).then(function (response) {
+            if (!response.ok) {
+                box.checked = !box.checked;
+            }
+        }).catch(function () {
+            box.checked = !box.checked;
+        });
+    });
+
+    function applyChange(root, change) {
+        var row = root.querySelector('tr[data-player-id="' + change.user_id + '"]');
+        if (!row) {
+            return;
+        }
+        if ("confirmed" in change) {
+            row.querySelectorAll('[data-field="confirmed"] [data-state]').forEach(function (el) {
+                el.hidden = (el.dataset.state === "1") !== change.confirmed;
+            });
+        }
+        if ("present" in change) {
+            var box = row.querySelector('input[data-field="present"]');
+            if (box && document.activeElement !== box) {
+                box.checked = change.present;
+            }
+        }
+    }
+
+    document.querySelectorAll("[data-live-url]").forEach(function (root) {
+        if (!window.EventSource) {
+            return;
+        }
+        var source = new EventSource(root.dataset.liveUrl);
+        source.addEventListener("attendance", function (event) {
+            applyChange(root, JSON.parse(event.data));
+        });
+        // Rozdiely nestačia (reštart servera, zahltený klient) - načítať celý stav
+        source.addEventListener("reset", function () {
+            source.close();
+            window.location.reload();
+        });
+        window.addEventListener("pagehide", function () {
+            source.close();
+        });
+    });
+})();
@@ -0,0 +1,91 @@
+# Testy bežia nad dočasnou databázou - nastavenia sa čítajú pri importe, preto prostredie
+# nastavíme skôr, než sa načíta čokoľvek z aplikácie
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TMP = tempfile.mkdtemp(prefix="futbal-test-")
+os.environ["DATABASE_PATH"] = os.path.join(_TMP, "test.db")
+os.environ["TEMPLATE_CACHE_DIR"] = ""
+os.environ["SESSION_BACKEND"] = "memory"
+sys.path.insert(0, ROOT)
+# Statické súbory sú v main.py pripojené relatívnou cestou
+os.chdir(ROOT)
+
+import pytest
+from fastapi.testclient import TestClient
+from database.database import connect
+from database.migrations import migrate
+from services.security import hash_password
+
+PASSWORD = "test123"
+
+
+@pytest.fixture(scope="session")
+def app():
+    with connect() as conn:
+        migrate(conn)
+    from main import app
+    return app
+
+
+@pytest.fixture
+def db(app):
+    conn = connect()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="session")
+def password_hash():
+    # bcrypt je pomalý - jeden hash pre všetkých testovacích používateľov
+    return hash_password(PASSWORD)
+
+
+@pytest.fixture
+def make_user(db, password_hash):
+    counter = iter(range(1, 1_000_000))
+
+    def make(role: str = "player", **fields) -> int:
+        username = fields.pop("username", None) or f"{role}-{os.urandom(4).hex()}-{next(counter)}"
+        columns = {"username": username, "password_hash": password_hash, "role": role,
+                   "first_name": "Test", "last_name": username, **fields}
+        cur = db.execute(
+            f"INSERT INTO users({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            list(columns.values()),
+        )
+        db.commit()
+        return cur.lastrowid
+
+    return make
+
+
+@pytest.fixture
+def login(app, db):
+    clients = []
+
+    def login_as(user_id: int) -> TestClient:
+        username = db.execute("SELECT username FROM users WHERE id = ?", (user_id,)).fetchone()[0]
+        client = TestClient(app)
+        client.__enter__()
+        clients.append(client)
+        response = client.post("/login", data={"username": username, "password": PASSWORD}, follow_redirects=False)
+        assert response.status_code == 303, response.text
+        return client
+
+    yield login_as
+    for client in clients:
+        client.__exit__(None, None, None)
+
+
+@pytest.fixture
+def make_match(db):
+    def make(opponent: str = "Súper", date: str = "2025-09-01T18:00") -> int:
+        cur = db.execute("INSERT INTO matches(date, opponent, location) VALUES (?, ?, ?)", (date, opponent, "Domov"))
+        db.commit()
+        return cur.lastrowid
+
+    return make
@@ -0,0 +1,64 @@
+import pytest
+from services.events import event_bus
+
+
+@pytest.fixture
+def coach(make_user, login):
+    return login(make_user("coach"))
+
+
+def test_bulk_presence_saves_valid_cells(db, make_user, make_match, coach):
+    player_id = make_user("player")
+    match_id = make_match()
+    response = coach.post("/players/presence/bulk", json={"entries": [
+        {"player_id": player_id, "event_type": "match", "event_id": match_id, "present": True},
+    ]})
+    assert response.status_code == 200
+    assert response.json() == {"updated": 1}
+    row = db.execute("SELECT present FROM attendance WHERE user_id = ? AND match_id = ?", (player_id, match_id)).fetchone()
+    assert row[0] == 1
+
+
+@pytest.mark.parametrize("cell", ["999999:match:{match}", "{player}:match:999999", "{player}:training:999999", "{coach}:match:{match}"])
+def test_bulk_presence_rejects_unknown_targets(db, make_user, make_match, login, cell):
+    coach_id = make_user("coach")
+    client = login(coach_id)
+    player_id, match_id = make_user("player"), make_match()
+    cell = cell.format(player=player_id, match=match_id, coach=coach_id)
+    response = client.post("/players/presence/bulk", data={"cell": cell, "present": cell}, follow_redirects=False)
+    assert response.status_code == 400
+    written = db.execute("SELECT COUNT(*) FROM attendance WHERE user_id IN (?, ?) OR match_id = ?",
+                         (player_id, coach_id, match_id)).fetchone()[0]
+    assert written == 0
+
+
+def test_bulk_presence_form_writes_only_changed_cells(db, make_user, make_match, coach):
+    player_id = make_user("player")
+    unchanged, checked, unchecked = make_match(), make_match(), make_match()
+    db.execute("INSERT INTO attendance(user_id, match_id, present) VALUES (?, ?, 1)", (player_id, unchecked))
+    db.commit()
+    cells = {match_id: f"{player_id}:match:{match_id}" for match_id in (unchanged, checked, unchecked)}
+    response = coach.post("/players/presence/bulk", data={
+        "cell": list(cells.values()),
+        "present": [cells[checked]],
+        "was_present": [cells[unchecked]],
+    }, follow_redirects=False)
+    assert response.status_code == 303
+    rows = dict(db.execute("SELECT match_id, present FROM attendance WHERE user_id = ?", (player_id,)).fetchall())
+    # Nezmenená bunka nevytvorí prázdny záznam dochádzky
+    assert rows == {checked: 1, unchecked: 0}
+
+
+def test_bulk_presence_skips_values_already_stored(db, make_user, make_match, coach):
+    player_id, match_id = make_user("player"), make_match()
+    entry = {"player_id": player_id, "event_type": "match", "event_id": match_id, "present": True}
+    assert coach.post("/players/presence/bulk", json={"entries": [entry]}).json() == {"updated": 1}
+    published = event_bus.published
+    assert coach.post("/players/presence/bulk", json={"entries": [entry]}).json() == {"updated": 0}
+    assert event_bus.published == published
+
+
+@pytest.mark.parametrize("present", ["false", "0", 0, 1, None])
+def test_bulk_presence_json_requires_boolean(make_user, make_match, coach, present):
+    entry = {"player_id": make_user("player"), "event_type": "match", "event_id": make_match(), "present": present}
+    assert coach.post("/players/presence/bulk", json={"entries": [entry]}).status_code == 400
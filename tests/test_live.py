@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.mark.parametrize("path", ["/live/matches/{id}", "/live/trainings/{id}"])
+def test_live_streams_are_for_coaches_only(db, make_user, make_match, login, path):
+    training_id = db.execute("INSERT INTO trainings(date, location) VALUES ('2025-09-02T18:00', 'Ihrisko')").lastrowid
+    db.commit()
+    event_id = make_match() if "matches" in path else training_id
+    response = login(make_user("player")).get(path.format(id=event_id))
+    assert response.status_code == 403
@@ -0,0 +1,40 @@
+from database.tracing import collect_queries
+
+# Generácia users (platnosť profilu) + zápas + súpiska (hráči s účasťou a hodnotením jedným
+# dotazom); session ide z cache
+EXPECTED_QUERIES = 3
+
+
+def _add_squad(db, make_user, match_id: int, coach_id: int, size: int) -> None:
+    for i in range(size):
+        player_id = make_user("player", position="Záložník")
+        db.execute("INSERT INTO attendance(user_id, match_id, confirmed, present) VALUES (?, ?, 1, ?)",
+                   (player_id, match_id, i % 2))
+        if i % 3:
+            db.execute("INSERT INTO evaluations(match_id, player_id, coach_id, rating, comment) VALUES (?, ?, ?, ?, ?)",
+                       (match_id, player_id, coach_id, 6.5, "ok"))
+    db.commit()
+
+
+def _count_queries(client, url: str) -> int:
+    # Prvá požiadavka zahreje cache session a profilu - meria sa až druhá
+    assert client.get(url).status_code == 200
+    with collect_queries() as stats:
+        response = client.get(url)
+    assert response.status_code == 200
+    return stats.count
+
+
+def test_match_pages_query_count_does_not_grow_with_squad(db, make_user, make_match, login):
+    coach_id = make_user("coach")
+    match_id = make_match()
+    client = login(coach_id)
+    urls = [f"/matches/{match_id}/manage", f"/matches/{match_id}/detail"]
+
+    _add_squad(db, make_user, match_id, coach_id, 3)
+    small = {url: _count_queries(client, url) for url in urls}
+    _add_squad(db, make_user, match_id, coach_id, 40)
+    large = {url: _count_queries(client, url) for url in urls}
+
+    assert small == {url: EXPECTED_QUERIES for url in urls}
+    assert large == small
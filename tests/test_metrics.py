@@ -0,0 +1,25 @@
+import pytest
+from fastapi.testclient import TestClient
+import settings
+
+
+def test_metrics_are_not_public(app):
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+    assert response.status_code == 401
+    assert "http_request_duration_seconds" not in response.text
+
+
+@pytest.mark.parametrize("role, expected", [("player", 403), ("coach", 403), ("admin", 200)])
+def test_metrics_without_token_require_admin(make_user, login, role, expected):
+    response = login(make_user(role)).get("/metrics")
+    assert response.status_code == expected
+
+
+def test_metrics_token(app, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "tajne")
+    with TestClient(app) as client:
+        assert client.get("/metrics", headers={"Authorization": "Bearer zle"}).status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer tajne"})
+    assert response.status_code == 200
+    assert "db_pool_connections" in response.text
@@ -0,0 +1,9 @@
+def test_role_change_applies_without_invalidation(db, make_user, make_match, login):
+    # Zápis priamo do DB - ako keby rolu zmenil iný worker alebo skript
+    coach_id = make_user("coach")
+    client = login(coach_id)
+    url = f"/matches/{make_match()}/manage"
+    assert client.get(url).status_code == 200
+    db.execute("UPDATE users SET role = 'player' WHERE id = ?", (coach_id,))
+    db.commit()
+    assert client.get(url).status_code == 403
@@ -0,0 +1,12 @@
+from services.stats import StatsService
+
+
+def test_event_totals_follow_writes_from_other_connections(db, make_user, make_match):
+    player_id = make_user("player")
+    before = StatsService(db).get_my_stats(player_id)["total_matches"]
+    # Zápis mimo služieb (iný worker, import) - cache sa nezneplatní ručne, len generáciou
+    match_id = make_match()
+    assert StatsService(db).get_my_stats(player_id)["total_matches"] == before + 1
+    db.execute("DELETE FROM matches WHERE id = ?", (match_id,))
+    db.commit()
+    assert StatsService(db).get_my_stats(player_id)["total_matches"] == before